@@ -0,0 +1,334 @@
+"""Load-test the HTTP API with a mixed dashboard workload against locally started servers.
+
+For every ``--workers`` x ``--threads`` combination the harness starts
+``python -m csv_temperature_data --preload`` on a free local port, serving a
+synthetic archive (``--threads`` sets ``QUERY_WORKERS``, the size of each
+worker's query executor; 0 = one per CPU). It then runs each ``--users``
+level of closed-loop virtual users for ``--duration`` seconds after a
+``--warmup``. Each user sends one request, waits ``--think`` ms and repeats,
+picking from a weighted mix of station lists, year ranges, summaries and
+monthly/annual series. Parameters come from a pool of ``--distinct``
+queries per route, so the response cache sees a realistic repeat rate;
+``--no-response-cache`` makes every request compute.
+
+The report gives throughput and p50/p95/p99 latency per level, and per
+configuration the highest level whose p99 stays under ``--slo`` ms. The
+load generator shares the machine with the servers: spread it with
+``--client-procs`` and read saturated numbers with that in mind.
+
+    python benchmarks/load.py                                    # 1000 x 120 synthetic archive
+    python benchmarks/load.py --workers 1,2,4 --threads 1,4 --users 1,8,32,128 --duration 20
+    python benchmarks/load.py --stations 5000 --years 170 --json load.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from synthetic import LAST_YEAR, write_csv
+
+# Relative frequency of each route in the workload, as a dashboard session issues them.
+MIX = {
+    "stations": 2,
+    "range": 2,
+    "summary": 20,
+    "monthly": 40,
+    "annual": 36,
+}
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    rank = max(0, math.ceil(q * len(sorted_values)) - 1)
+    return sorted_values[rank]
+
+
+def query_pool(stations: int, years: int, distinct: int, seed: int) -> dict[str, list[str]]:
+    """``distinct`` request paths per route, with 1-8 station selections and varied year windows."""
+    rng = random.Random(seed)
+    first_year = LAST_YEAR - years + 1
+    # A few stations are far more popular than the rest, as on a real dashboard.
+    weights = [1 / (rank + 1) for rank in range(stations)]
+
+    def selection() -> str:
+        picked = rng.choices(range(stations), weights=weights, k=rng.randint(1, 8))
+        return ",".join(str(10000 + i) for i in sorted(set(picked)))
+
+    def window() -> str:
+        start = rng.randint(first_year, LAST_YEAR)
+        end = rng.randint(start, LAST_YEAR)
+        return f"&start_year={start}&end_year={end}" if rng.random() < 0.7 else ""
+
+    def columnar() -> str:
+        return "&format=columnar" if rng.random() < 0.5 else ""
+
+    return {
+        "stations": ["/api/stations"],
+        "range": ["/api/data/range"],
+        "summary": [f"/api/analytics/summary?stations={selection()}{window()}" for _ in range(distinct)],
+        "monthly": [f"/api/data/monthly?stations={selection()}{window()}{columnar()}" for _ in range(distinct)],
+        "annual": [
+            f"/api/data/annual?stations={selection()}{window()}&include_std=true{columnar()}"
+            for _ in range(distinct)
+        ],
+    }
+
+
+async def _users(
+    base_url: str, pool: dict[str, list[str]], users: int, warmup: float, duration: float, think: float, seed: int
+) -> list[tuple[str, float, bool]]:
+    import httpx
+
+    kinds = list(MIX)
+    kind_weights = [MIX[kind] for kind in kinds]
+    start = time.perf_counter()
+    measure_from = start + warmup
+    deadline = measure_from + duration
+    samples: list[tuple[str, float, bool]] = []
+
+    async def user(client: httpx.AsyncClient, rng: random.Random) -> None:
+        while True:
+            sent = time.perf_counter()
+            if sent >= deadline:
+                return
+            kind = rng.choices(kinds, weights=kind_weights)[0]
+            try:
+                resp = await client.get(rng.choice(pool[kind]))
+                ok = resp.status_code == 200
+            except httpx.HTTPError:
+                ok = False
+            if sent >= measure_from:
+                samples.append((kind, time.perf_counter() - sent, ok))
+            if think:
+                await asyncio.sleep(think)
+
+    limits = httpx.Limits(max_connections=users, max_keepalive_connections=users)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60.0) as client:
+        await asyncio.gather(*(user(client, random.Random(seed * 100_003 + i)) for i in range(users)))
+    return samples
+
+
+def _client_process(
+    base_url: str, pool: dict[str, list[str]], users: int, warmup: float, duration: float, think: float, seed: int
+) -> list[tuple[str, float, bool]]:
+    return asyncio.run(_users(base_url, pool, users, warmup, duration, think, seed))
+
+
+def run_level(
+    base_url: str,
+    pool: dict[str, list[str]],
+    users: int,
+    *,
+    warmup: float,
+    duration: float,
+    think: float,
+    client_procs: int,
+) -> dict[str, object]:
+    """Run ``users`` virtual users split over ``client_procs`` processes; return the level's statistics."""
+    procs = min(client_procs, users)
+    shares = [users // procs + (i < users % procs) for i in range(procs)]
+    if procs == 1:
+        samples = _client_process(base_url, pool, users, warmup, duration, think, 0)
+    else:
+        with ProcessPoolExecutor(procs) as executor:
+            futures = [
+                executor.submit(_client_process, base_url, pool, share, warmup, duration, think, i)
+                for i, share in enumerate(shares)
+            ]
+            samples = [sample for future in futures for sample in future.result()]
+
+    latencies = sorted(seconds for _, seconds, ok in samples if ok)
+    errors = sum(1 for _, _, ok in samples if not ok)
+    stats: dict[str, object] = {
+        "users": users,
+        "requests": len(samples),
+        "errors": errors,
+        "req_per_s": round(len(latencies) / duration, 1),
+    }
+    for name, q in (("p50_ms", 0.50), ("p95_ms", 0.95), ("p99_ms", 0.99)):
+        stats[name] = round(_percentile(latencies, q) * 1000, 2) if latencies else None
+    stats["p50_ms_by_route"] = {
+        kind: round(_percentile(times, 0.50) * 1000, 2)
+        for kind in MIX
+        if (times := sorted(seconds for k, seconds, ok in samples if ok and k == kind))
+    }
+    return stats
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class Server:
+    """``python -m csv_temperature_data --preload`` in a subprocess, stopped with SIGTERM on exit."""
+
+    def __init__(self, env: dict[str, str], workers: int, startup_timeout: float = 300.0) -> None:
+        self.port = _free_port()
+        self.base_url = f"http://127.0.0.1:{self.port}"
+        self._command = [
+            sys.executable,
+            "-m",
+            "csv_temperature_data",
+            "--port",
+            str(self.port),
+            "--workers",
+            str(workers),
+            "--preload",
+            "--log-level",
+            "warning",
+        ]
+        self._env = env
+        self._startup_timeout = startup_timeout
+        self._proc: subprocess.Popen | None = None
+
+    def __enter__(self) -> "Server":
+        import httpx
+
+        self._proc = subprocess.Popen(self._command, env=self._env)
+        deadline = time.monotonic() + self._startup_timeout
+        while time.monotonic() < deadline:
+            if self._proc.poll() is not None:
+                raise RuntimeError(f"server exited during startup with status {self._proc.returncode}")
+            try:
+                if httpx.get(f"{self.base_url}/api/health", timeout=1.0).status_code == 200:
+                    return self
+            except httpx.HTTPError:
+                pass
+            time.sleep(0.2)
+        self.__exit__()
+        raise RuntimeError(f"server did not answer within {self._startup_timeout:.0f} s")
+
+    def __exit__(self, *exc: object) -> None:
+        if self._proc is None or self._proc.poll() is not None:
+            return
+        self._proc.send_signal(signal.SIGTERM)
+        try:
+            self._proc.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
+
+
+def _int_list(text: str) -> list[int]:
+    return [int(part) for part in text.split(",") if part.strip()]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stations", type=int, default=1000)
+    parser.add_argument("--years", type=int, default=120)
+    parser.add_argument("--workers", type=_int_list, default=[1, 2], help="Server worker processes, e.g. 1,2,4")
+    parser.add_argument("--threads", type=_int_list, default=[1, 4], help="QUERY_WORKERS per worker (0 = per CPU)")
+    parser.add_argument("--users", type=_int_list, default=[1, 4, 16, 64], help="Concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=10.0, help="Measured seconds per level")
+    parser.add_argument("--warmup", type=float, default=2.0, help="Unmeasured seconds before each level")
+    parser.add_argument("--think", type=float, default=0.0, help="Pause between a user's requests (ms)")
+    parser.add_argument("--distinct", type=int, default=500, help="Distinct queries per data route")
+    parser.add_argument("--no-response-cache", action="store_true", help="Run the servers with the cache off")
+    parser.add_argument("--client-procs", type=int, default=1, help="Processes generating the load")
+    parser.add_argument("--slo", type=float, default=500.0, help="p99 target (ms) for the capacity summary")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", type=Path, help="Also write the results to this file")
+    args = parser.parse_args()
+    if args.client_procs < 1 or min(args.workers + args.users) < 1 or min(args.threads) < 0:
+        parser.error("--workers, --users and --client-procs must be >= 1 and --threads >= 0")
+
+    pool = query_pool(args.stations, args.years, args.distinct, args.seed)
+    configs = []
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = str(Path(tmp) / "synthetic.csv")
+        rows = write_csv(csv_path, stations=args.stations, years=args.years, seed=args.seed)
+        print(f"synthetic archive: {args.stations} stations x {args.years} years = {rows} rows")
+
+        base_env = dict(os.environ)
+        base_env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT / "src"), base_env.get("PYTHONPATH")]))
+        base_env["CSV_PATH"] = csv_path
+        # The first server parses the CSV into the bundle; the others map it.
+        base_env["CSV_CACHE_DIR"] = str(Path(tmp) / "cache")
+        if args.no_response_cache:
+            base_env["RESPONSE_CACHE_BYTES"] = "0"
+
+        for workers in args.workers:
+            for threads in args.threads:
+                env = dict(base_env, QUERY_WORKERS=str(threads))
+                print(f"\nworkers={workers} threads={threads}")
+                print(f"{'users':>7} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}")
+                levels = []
+                with Server(env, workers) as server:
+                    for users in args.users:
+                        stats = run_level(
+                            server.base_url,
+                            pool,
+                            users,
+                            warmup=args.warmup,
+                            duration=args.duration,
+                            think=args.think / 1000,
+                            client_procs=args.client_procs,
+                        )
+                        levels.append(stats)
+                        print(
+                            f"{users:>7} {stats['req_per_s']:>9.1f} {_ms(stats['p50_ms']):>9}"
+                            f" {_ms(stats['p95_ms']):>9} {_ms(stats['p99_ms']):>9} {stats['errors']:>7}"
+                        )
+                configs.append({"workers": workers, "threads": threads, "levels": levels})
+
+    print(f"\n{'workers':>7} {'threads':>7} {'peak req/s':>11} {'at users':>9} {f'users @ p99<{args.slo:g}ms':>18}")
+    for config in configs:
+        peak = max(config["levels"], key=lambda level: level["req_per_s"])
+        within = [
+            level["users"]
+            for level in config["levels"]
+            if level["p99_ms"] is not None and level["p99_ms"] < args.slo and not level["errors"]
+        ]
+        config["peak_req_per_s"] = peak["req_per_s"]
+        config["max_users_within_slo"] = max(within) if within else None
+        print(
+            f"{config['workers']:>7} {config['threads']:>7} {peak['req_per_s']:>11.1f} {peak['users']:>9}"
+            f" {config['max_users_within_slo'] if within else '-':>18}"
+        )
+
+    if args.json:
+        report = {
+            "dataset": {"stations": args.stations, "years": args.years, "rows": rows},
+            "workload": {
+                "mix": MIX,
+                "distinct": args.distinct,
+                "think_ms": args.think,
+                "duration_s": args.duration,
+                "response_cache": not args.no_response_cache,
+                "client_procs": args.client_procs,
+                "slo_p99_ms": args.slo,
+            },
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "configs": configs,
+        }
+        args.json.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+def _ms(value: float | None) -> str:
+    return "-" if value is None else f"{value:.2f}"
+
+
+if __name__ == "__main__":
+    sys.exit(main())
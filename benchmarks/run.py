@@ -0,0 +1,197 @@
+"""Benchmark the core query functions and the HTTP routes on a synthetic archive.
+
+Each case is timed over ``--repeat`` calls (after one warm-up call) and
+reported as p50/p99 latency and throughput; peak Python heap is measured
+on one extra traced call. With ``--baseline``, any case whose p50 exceeds
+the stored p50 by more than ``--tolerance``, or that the baseline does not
+cover, fails the run (exit status 1).
+
+    python benchmarks/run.py                        # report only
+    python benchmarks/run.py --save-baseline        # record benchmarks/baseline.json
+    python benchmarks/run.py --baseline benchmarks/baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from synthetic import write_csv
+
+DEFAULT_BASELINE = ROOT / "benchmarks" / "baseline.json"
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    rank = max(0, math.ceil(q * len(sorted_values)) - 1)
+    return sorted_values[rank]
+
+
+def measure(fn: Callable[[], object], repeat: int) -> dict[str, float]:
+    fn()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+
+    tracemalloc.start()
+    try:
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "p50_ms": round(_percentile(timings, 0.50) * 1000, 3),
+        "p99_ms": round(_percentile(timings, 0.99) * 1000, 3),
+        "ops_per_s": round(len(timings) / sum(timings), 1),
+        "peak_mib": round(peak / 2**20, 2),
+    }
+
+
+def cases(csv_path: str) -> dict[str, Callable[[], object]]:
+    from fastapi.testclient import TestClient
+
+    from csv_temperature_data.api.cache import RESPONSE_CACHE
+    from csv_temperature_data.core import csv_data
+    from csv_temperature_data.core.config import settings
+    from csv_temperature_data.main import app
+
+    settings.csv_path = csv_path
+    stations = csv_data.unique_stations(csv_path)
+    few = ",".join(stations[:10])
+    many = ",".join(stations[:200])
+    client = TestClient(app)
+
+    def route(url: str, encoding: str = "identity") -> Callable[[], object]:
+        # Uncompressed unless a case asks for a coding: the test client would otherwise request gzip.
+        headers = {"Accept-Encoding": encoding}
+
+        def call() -> object:
+            RESPONSE_CACHE.clear()  # time the computation, not the response cache
+            resp = client.get(url, headers=headers)
+            assert resp.status_code == 200, (url, resp.status_code)
+            assert resp.headers.get("content-encoding", "identity") == encoding or len(resp.content) < 1024, url
+            return resp
+
+        return call
+
+    return {
+        "load": lambda: csv_data._CsvStore._load(csv_path),
+        "monthly_data[10]": lambda: csv_data.monthly_data(csv_path, stations=stations[:10]),
+        "monthly_data[10,columnar]": lambda: csv_data.monthly_data(csv_path, stations=stations[:10], layout="columnar"),
+        "annual_data[10,std]": lambda: csv_data.annual_data(csv_path, stations=stations[:10], include_std=True),
+        "annual_data[200,std]": lambda: csv_data.annual_data(csv_path, stations=stations[:200], include_std=True),
+        "analytics_summary[all]": lambda: csv_data.analytics_summary(csv_path, stations=stations),
+        "export_series[all]": lambda: csv_data.export_series(csv_path),
+        "analytics_rolling[200,10y]": lambda: csv_data.analytics_rolling(
+            csv_path, stations=stations[:200], window=10, include_std=True
+        ),
+        "analytics_correlation[200,anomalies]": lambda: csv_data.analytics_correlation(
+            csv_path, stations=stations[:200], anomalies=True, arrays=True
+        ),
+        "analytics_anomalies[200,annual]": lambda: csv_data.analytics_anomalies(
+            csv_path, stations=stations[:200], base_start=1961, base_end=1990, resolution="annual"
+        ),
+        "GET /api/stations": route("/api/stations"),
+        "GET /api/stations/metadata[1000]": route("/api/stations/metadata?limit=1000"),
+        "GET /api/data/range": route("/api/data/range"),
+        "GET /api/data/monthly[10]": route(f"/api/data/monthly?stations={few}"),
+        "GET /api/data/monthly[10,columnar,500pts]": route(
+            f"/api/data/monthly?stations={few}&format=columnar&max_points=500"
+        ),
+        "GET /api/data/annual[10,std]": route(f"/api/data/annual?stations={few}&include_std=true"),
+        "GET /api/data/annual[200,columnar]": route(f"/api/data/annual?stations={many}&format=columnar"),
+        "GET /api/data/annual[200,columnar,gzip]": route(
+            f"/api/data/annual?stations={many}&format=columnar", encoding="gzip"
+        ),
+        "GET /api/analytics/summary[200]": route(f"/api/analytics/summary?stations={many}"),
+        "GET /api/data/export[raw]": route("/api/data/export"),
+    }
+
+
+def compare(results: dict[str, dict[str, float]], baseline: dict, tolerance: float) -> list[str]:
+    """Cases slower than the baseline allows, and cases the baseline does not cover."""
+    failures = []
+    for name, stats in results.items():
+        reference = baseline.get("cases", {}).get(name)
+        if reference is None:
+            failures.append(f"{name}: not in the baseline (record it with --save-baseline)")
+            continue
+        limit = reference["p50_ms"] * (1 + tolerance)
+        if stats["p50_ms"] > limit:
+            failures.append(
+                f"{name}: p50 {stats['p50_ms']:.2f} ms > {limit:.2f} ms (baseline {reference['p50_ms']:.2f} ms)"
+            )
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stations", type=int, default=1000)
+    parser.add_argument("--years", type=int, default=120)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--only", default="", help="Run only cases whose name contains this text")
+    parser.add_argument("--baseline", type=Path, help="Fail on regressions against this baseline file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed p50 slowdown (0.25 = +25%%)")
+    parser.add_argument("--save-baseline", nargs="?", type=Path, const=DEFAULT_BASELINE, metavar="PATH")
+    parser.add_argument("--json", type=Path, help="Also write the results to this file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = str(Path(tmp) / "synthetic.csv")
+        rows = write_csv(csv_path, stations=args.stations, years=args.years)
+        print(f"synthetic archive: {args.stations} stations x {args.years} years = {rows} rows")
+
+        results = {}
+        print(f"{'case':<44} {'p50 ms':>9} {'p99 ms':>9} {'ops/s':>9} {'peak MiB':>9}")
+        for name, fn in cases(csv_path).items():
+            if args.only and args.only not in name:
+                continue
+            stats = measure(fn, args.repeat)
+            results[name] = stats
+            print(
+                f"{name:<44} {stats['p50_ms']:>9.2f} {stats['p99_ms']:>9.2f}"
+                f" {stats['ops_per_s']:>9.1f} {stats['peak_mib']:>9.2f}"
+            )
+
+    report = {
+        "dataset": {"stations": args.stations, "years": args.years, "rows": rows},
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cases": results,
+    }
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    if args.save_baseline:
+        args.save_baseline.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"baseline written to {args.save_baseline}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        if baseline.get("dataset") != report["dataset"]:
+            print(f"baseline was recorded on a different dataset: {baseline.get('dataset')}", file=sys.stderr)
+            return 2
+        failures = compare(results, baseline, args.tolerance)
+        if failures:
+            print("REGRESSIONS:", *failures, sep="\n  ", file=sys.stderr)
+            return 1
+        print(f"no regressions beyond +{args.tolerance:.0%} of {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
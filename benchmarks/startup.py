@@ -0,0 +1,128 @@
+"""Profile API process startup: module import cost and time to the first response.
+
+Every measurement runs in a fresh interpreter, as a new worker would. The
+import profile comes from ``python -X importtime``; the phases are importing
+the app, loading the dataset (parsing the CSV, or mapping the cache bundle
+once it exists) and serving the first query.
+
+    python benchmarks/startup.py                       # synthetic archive
+    python benchmarks/startup.py --csv data/temperature_data.csv --top 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from synthetic import write_csv
+
+# Runs in the child; prints one JSON line. The test client's own import is not timed.
+_PHASES = """
+import json, sys, time
+t0 = time.perf_counter()
+from csv_temperature_data.main import app
+from csv_temperature_data.core.config import settings
+from csv_temperature_data.core.csv_data import preload, unique_stations
+t1 = time.perf_counter()
+preload(settings.csv_path, watch=False)
+t2 = time.perf_counter()
+from fastapi.testclient import TestClient
+client = TestClient(app)
+station = unique_stations(settings.csv_path)[0]
+t3 = time.perf_counter()
+resp = client.get(f"/api/data/monthly?stations={station}&format=columnar")
+t4 = time.perf_counter()
+assert resp.status_code == 200, resp.status_code
+print(json.dumps({
+    "import_s": t1 - t0,
+    "load_s": t2 - t1,
+    "first_query_s": t4 - t3,
+    "pandas_imported": "pandas" in sys.modules,
+}))
+"""
+
+
+def _env(csv_path: str, cache_dir: str) -> dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT / "src"), env.get("PYTHONPATH")]))
+    env["CSV_PATH"] = csv_path
+    env["CSV_CACHE_DIR"] = cache_dir
+    return env
+
+
+def import_profile(env: dict[str, str]) -> list[tuple[int, int, str]]:
+    """``(self_us, cumulative_us, module)`` for each module imported by ``csv_temperature_data.main``."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import csv_temperature_data.main"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        rows.append((int(self_us), int(cumulative_us), name[1:].rstrip()))  # nesting is indented
+    return rows
+
+
+def phases(env: dict[str, str]) -> dict[str, float]:
+    proc = subprocess.run([sys.executable, "-c", _PHASES], env=env, capture_output=True, text=True, check=True)
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--csv", help="Archive to load (default: a synthetic one)")
+    parser.add_argument("--stations", type=int, default=1000)
+    parser.add_argument("--years", type=int, default=120)
+    parser.add_argument("--top", type=int, default=15, help="Modules to list in the import profile")
+    parser.add_argument("--json", type=Path, help="Also write the results to this file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = args.csv
+        if csv_path is None:
+            csv_path = str(Path(tmp) / "synthetic.csv")
+            rows = write_csv(csv_path, stations=args.stations, years=args.years)
+            print(f"synthetic archive: {args.stations} stations x {args.years} years = {rows} rows")
+        cache_dir = str(Path(tmp) / "cache")
+
+        profile = import_profile(_env(csv_path, cache_dir))
+        total_us = max(cumulative for _, cumulative, name in profile if not name.startswith(" "))
+        print(f"\nimport csv_temperature_data.main: {total_us / 1000:.1f} ms; slowest modules (self time):")
+        for self_us, cumulative_us, name in sorted(profile, reverse=True)[: args.top]:
+            print(f"  {self_us / 1000:8.1f} ms self {cumulative_us / 1000:8.1f} ms cumulative  {name.strip()}")
+
+        results = {}
+        print(f"\n{'startup':<28} {'import ms':>10} {'load ms':>10} {'1st query ms':>13}  pandas")
+        for name, env in (
+            ("no cache (parse CSV)", _env(csv_path, "")),
+            ("cold cache (parse + write)", _env(csv_path, cache_dir)),
+            ("warm cache (map bundle)", _env(csv_path, cache_dir)),
+        ):
+            stats = phases(env)
+            results[name] = stats
+            print(
+                f"{name:<28} {stats['import_s'] * 1000:>10.1f} {stats['load_s'] * 1000:>10.1f}"
+                f" {stats['first_query_s'] * 1000:>13.1f}  {'yes' if stats['pandas_imported'] else 'no'}"
+            )
+
+    if args.json:
+        report = {"import_ms": total_us / 1000, "phases": results}
+        args.json.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""Synthetic station archives in the served CSV format.
+
+Rows are ``stations x years`` (station numbers 10000.., consecutive years
+ending in 2019), shuffled in blocks like a merged archive, with a fraction
+of months left empty. Output is deterministic for a given seed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from pathlib import Path
+
+MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+LAST_YEAR = 2019
+
+
+def write_csv(path: str | Path, *, stations: int, years: int, missing: float = 0.05, seed: int = 0) -> int:
+    """Write the archive to ``path`` and return its number of data rows."""
+    rng = random.Random(seed)
+    first_year = LAST_YEAR - years + 1
+    rows = 0
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        f.write(";".join(("Station Number", "Year", *MONTHS)) + "\n")
+        order = list(range(stations))
+        rng.shuffle(order)
+        for station_i in order:
+            station = 10000 + station_i
+            base = rng.uniform(-5.0, 20.0)
+            lines = []
+            for year in range(first_year, LAST_YEAR + 1):
+                values = []
+                for month_i in range(12):
+                    if rng.random() < missing:
+                        values.append("")
+                    else:
+                        seasonal = 8.0 * (1 - abs(month_i - 6) / 3)
+                        values.append(f"{base + seasonal + rng.gauss(0.0, 2.0):.1f}")
+                lines.append(f"{station};{year};" + ";".join(values))
+            f.write("\n".join(lines) + "\n")
+            rows += len(lines)
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path")
+    parser.add_argument("--stations", type=int, default=1000)
+    parser.add_argument("--years", type=int, default=120)
+    parser.add_argument("--missing", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rows = write_csv(args.path, stations=args.stations, years=args.years, missing=args.missing, seed=args.seed)
+    print(f"wrote {rows} rows to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -108,13 +108,18 @@ export default function App() {
   }, [baseParams]);
 
   const fetchMonthly = useCallback(async () => {
-    return await getJson<MonthlyResponse>(`/api/data/monthly?${baseParams.toString()}`, { requestKey: "monthlyData" });
+    const monthlyParams = new URLSearchParams(baseParams);
+    monthlyParams.set("format", "columnar");
+    // Roughly one point per horizontal pixel is all the plot can show.
+    monthlyParams.set("max_points", String(Math.max(300, Math.round(window.innerWidth * (window.devicePixelRatio || 1)))));
+    return await getJson<MonthlyResponse>(`/api/data/monthly?${monthlyParams.toString()}`, { requestKey: "monthlyData" });
   }, [baseParams]);
 
   const fetchAnnual = useCallback(
     async (std: boolean) => {
       const annualParams = new URLSearchParams(baseParams);
       annualParams.set("include_std", std ? "true" : "false");
+      annualParams.set("format", "columnar");
       return await getJson<AnnualResponse>(`/api/data/annual?${annualParams.toString()}`, { requestKey: "annualData" });
     },
     [baseParams]
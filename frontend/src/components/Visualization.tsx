@@ -58,18 +58,17 @@ export default function Visualization({
         name: series.station,
         legendgroup: series.station,
         line: { color: colorForStation(series.station) },
-        x: series.points.map((p) => `${p.year}-${pad2(p.month)}-01`),
-        y: series.points.map((p) => p.value)
+        x: series.years.map((year, i) => `${year}-${pad2(series.months[i])}-01`),
+        y: series.values
       }));
     }
 
     const data = annual?.stations ?? [];
     const out: any[] = [];
     for (const series of data) {
-      const points = series.points as any[];
       const baseColor = colorForStation(series.station);
-      const x = points.map((p) => p.year);
-      const mean = points.map((p) => p.mean);
+      const x = series.years;
+      const mean = series.mean;
       out.push({
         type: "scatter",
         mode: "lines",
@@ -82,8 +81,9 @@ export default function Visualization({
 
       if (includeStd) {
         const fill = hexToRgba(baseColor, 0.18);
-        const lower = points.map((p) => (typeof p.lower === "number" ? p.lower : null));
-        const upper = points.map((p) => (typeof p.upper === "number" ? p.upper : null));
+        const std = series.std ?? [];
+        const lower = mean.map((m, i) => (typeof std[i] === "number" ? m - (std[i] as number) : null));
+        const upper = mean.map((m, i) => (typeof std[i] === "number" ? m + (std[i] as number) : null));
         out.push({
           type: "scatter",
           mode: "lines",
@@ -8,14 +8,11 @@ export type AnalyticsSummary = {
 
 export type StationsResponse = { count: number; stations: string[] };
 
-export type MonthlyPoint = { year: number; month: number; value: number };
-export type MonthlySeries = { station: string; points: MonthlyPoint[] };
+// Columnar (`format=columnar`) shapes: parallel arrays per station.
+export type MonthlySeries = { station: string; years: number[]; months: number[]; values: number[] };
 export type MonthlyResponse = { stations: MonthlySeries[] };
 
-export type AnnualPoint =
-  | { year: number; mean: number }
-  | { year: number; mean: number; std: number | null; lower?: number; upper?: number };
-export type AnnualSeries = { station: string; points: AnnualPoint[] };
+export type AnnualSeries = { station: string; years: number[]; mean: number[]; std?: (number | null)[] };
 export type AnnualResponse = { stations: AnnualSeries[] };
 
 export type DataRangeResponse = { min_year: number | null; max_year: number | null };
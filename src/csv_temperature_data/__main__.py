@@ -0,0 +1,127 @@
+"""Serve the API: ``python -m csv_temperature_data [--workers N] [--preload]``.
+
+Without ``--preload`` this runs uvicorn on ``csv_temperature_data.main:app``;
+each of its workers imports the app and loads ``CSV_PATH`` itself. With
+``--preload`` the parent does both once, binds the socket and then forks the
+workers, which serve right away and share the imported modules and the
+loaded dataset copy-on-write. The parent replaces workers that exit
+unexpectedly and stops them all on SIGTERM/SIGINT. ``--preload`` needs
+``os.fork`` (not available on Windows).
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import signal
+import sys
+import time
+
+logger = logging.getLogger("csv_temperature_data")
+
+# Workers exiting sooner than this after their fork failed to start; they are not replaced.
+_MIN_WORKER_SECONDS = 5.0
+
+
+def _serve_preloaded(host: str, port: int, workers: int, log_level: str) -> int:
+    import uvicorn
+
+    from csv_temperature_data.core.config import settings
+    from csv_temperature_data.core.csv_data import preload
+    from csv_temperature_data.main import app
+
+    # Not watched here: that only changes how requests check for updates, and each worker's lifespan sets it.
+    preload(settings.csv_path, watch=False)
+    config = uvicorn.Config(app, host=host, port=port, log_level=log_level)
+    sock = config.bind_socket()
+
+    children: dict[int, float] = {}  # pid -> fork time
+    stopping = False
+
+    def spawn() -> None:
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            code = 0
+            try:
+                uvicorn.Server(config).run(sockets=[sock])
+            except BaseException:
+                logger.exception("worker %d failed", os.getpid())
+                code = 1
+            os._exit(code)
+        children[pid] = time.monotonic()
+
+    def stop(signum: int, frame: object) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    for _ in range(workers):
+        spawn()
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    logger.info("serving on %s:%d with %d preloaded workers", host, port, workers)
+
+    status = 0
+    while children:
+        try:
+            pid, wait_status = os.wait()
+        except ChildProcessError:
+            break
+        started = children.pop(pid, None)
+        if started is None:
+            continue
+        if stopping:
+            continue
+        if time.monotonic() - started < _MIN_WORKER_SECONDS:
+            logger.error("worker %d exited during startup; stopping", pid)
+            status = 1
+            stop(signal.SIGTERM, None)
+            continue
+        logger.warning("worker %d exited (%d); starting a replacement", pid, os.waitstatus_to_exitcode(wait_status))
+        spawn()
+    sock.close()
+    return status
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m csv_temperature_data", description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--workers", type=int, default=int(os.getenv("WEB_CONCURRENCY", "1")), help="Worker processes"
+    )
+    parser.add_argument(
+        "--preload", action="store_true", help="Load the app and dataset once, then fork the workers"
+    )
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be >= 1")
+
+    if args.preload:
+        if not hasattr(os, "fork"):
+            parser.error("--preload needs os.fork, which this platform does not have")
+        logging.basicConfig(level=args.log_level.upper(), format="%(levelname)s:     %(message)s")
+        return _serve_preloaded(args.host, args.port, args.workers, args.log_level)
+
+    import uvicorn
+
+    uvicorn.run(
+        "csv_temperature_data.main:app",
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        log_level=args.log_level,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+from fastapi import Request, Response
+
+from csv_temperature_data.api.compression import compress, negotiate_encoding, offered_encodings
+from csv_temperature_data.api.concurrency import SINGLE_FLIGHT, run_query
+from csv_temperature_data.api.encoding import dumps
+from csv_temperature_data.core.config import settings
+from csv_temperature_data.core.csv_data import dataset_version
+from csv_temperature_data.core.metrics import REGISTRY
+
+
+class ResponseCache:
+    """Thread-safe LRU of serialized response bodies, bounded by total bytes."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, bytes] = OrderedDict()
+        self._size = 0
+
+    def get(self, key: Hashable) -> bytes | None:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+            return body
+
+    def put(self, key: Hashable, body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = body
+            self._size += len(body)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+RESPONSE_CACHE = ResponseCache(settings.response_cache_bytes)
+
+_CACHE_LOOKUPS = REGISTRY.counter(
+    "api_response_cache_total", "Cached-route responses, by outcome (hit, miss or not_modified).", ("result",)
+)
+_ENCODE_SECONDS = REGISTRY.histogram("api_json_encode_seconds", "Time to serialize a cached-route response body.")
+_COMPRESS_SECONDS = REGISTRY.histogram(
+    "api_compress_seconds", "Time to compress a response body, by content coding.", ("coding",)
+)
+REGISTRY.gauge(
+    "api_response_cache_bytes",
+    "Bytes of serialized responses held in the response cache.",
+    (),
+    lambda: {(): RESPONSE_CACHE.size},
+)
+
+
+def _etag(key: Hashable, coding: str | None = None) -> str:
+    """Strong ETag of the response for ``key``; each content coding is a representation with its own tag."""
+    digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()[:20]
+    return f'"{digest}-{coding}"' if coding else f'"{digest}"'
+
+
+def _matching_etag(if_none_match: str | None, etag: str) -> str | None:
+    """The ``If-None-Match`` entry naming any coding of the response tagged ``etag``, or None."""
+    if not if_none_match:
+        return None
+    variants = {etag, *(etag[:-1] + f'-{coding}"' for coding in offered_encodings())}
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return etag
+        if candidate.removeprefix("W/") in variants:
+            return candidate.removeprefix("W/")
+    return None
+
+
+def _encode(content: object) -> bytes:
+    with _ENCODE_SECONDS.time():
+        return dumps(content)
+
+
+async def cached_json_response(
+    request: Request, csv_path: str, query: tuple[Hashable, ...], compute: Callable[[], object]
+) -> Response:
+    """Serve ``compute()`` as JSON, cached per (``csv_path``, its version, ``query``) with ETag revalidation.
+
+    ``query`` must identify the request completely (route name plus normalized
+    parameters). ``If-None-Match`` is answered with 304 without computing or
+    serializing anything. On a miss, computing and serializing run on the query
+    executor and identical concurrent misses share one computation. Bodies of
+    at least ``settings.compression_min_bytes`` are compressed as
+    ``Accept-Encoding`` allows, and the compressed bytes are cached as well.
+    Raises FileNotFoundError like the core functions.
+    """
+    version = await run_query(dataset_version, csv_path)
+    key = (csv_path, version, *query)
+    etag = _etag(key)
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={settings.response_max_age}"}
+    if settings.response_compression:
+        headers["Vary"] = "Accept-Encoding"
+    matched = _matching_etag(request.headers.get("if-none-match"), etag)
+    if matched is not None:
+        _CACHE_LOOKUPS.inc("not_modified")
+        headers["ETag"] = matched
+        return Response(status_code=304, headers=headers)
+
+    body = await cached_body(key, compute)
+    coding = negotiate_encoding(request.headers.get("accept-encoding"))
+    if coding is not None and len(body) >= settings.compression_min_bytes:
+        body = await compressed_body(body, coding, key)
+        headers["ETag"] = _etag(key, coding)
+        headers["Content-Encoding"] = coding
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def cached_body(key: Hashable, compute: Callable[[], object]) -> bytes:
+    """Serialized ``compute()`` from the response cache under ``key``; computed once (single-flight) on a miss."""
+    body = RESPONSE_CACHE.get(key)
+    if body is None:
+        _CACHE_LOOKUPS.inc("miss")
+        body = await SINGLE_FLIGHT.run(key, lambda: _encode(compute()))
+        RESPONSE_CACHE.put(key, body)
+    else:
+        _CACHE_LOOKUPS.inc("hit")
+    return body
+
+
+def _compress(body: bytes, coding: str) -> bytes:
+    with _COMPRESS_SECONDS.time(coding):
+        return compress(body, coding)
+
+
+async def compressed_body(body: bytes, coding: str, key: Hashable | None = None) -> bytes:
+    """``body`` compressed with ``coding`` on the query executor.
+
+    With ``key`` (the response-cache key ``body`` is stored under) the result
+    is cached next to it and concurrent identical requests compress once.
+    """
+    if key is None:
+        return await run_query(_compress, body, coding)
+    compressed_key = (key, coding)
+    compressed = RESPONSE_CACHE.get(compressed_key)
+    if compressed is None:
+        compressed = await SINGLE_FLIGHT.run(compressed_key, lambda: _compress(body, coding))
+        RESPONSE_CACHE.put(compressed_key, compressed)
+    return compressed
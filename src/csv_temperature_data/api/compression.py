@@ -0,0 +1,72 @@
+"""Content-Encoding negotiation and compression of API response bodies.
+
+Cached routes store each compressed variant next to the plain body in the
+response cache, so a repeated query is compressed once per dataset version
+rather than once per request. ``br`` needs the optional ``brotli`` package;
+``gzip`` is always offered.
+"""
+
+from __future__ import annotations
+
+import gzip
+
+from csv_temperature_data.core.config import settings
+
+try:
+    import brotli
+except ModuleNotFoundError:  # optional; only gzip is offered
+    brotli = None
+
+# Levels trading a little ratio for speed, since the first request of each query pays for compression.
+_GZIP_LEVEL = 6
+_BROTLI_QUALITY = 5
+
+
+def offered_encodings() -> list[str]:
+    """Content codings this process can produce, most preferred first."""
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def negotiate_encoding(accept_encoding: str | None) -> str | None:
+    """The coding to compress with for this ``Accept-Encoding``, or None to send the body as is.
+
+    Codings the client gives the highest ``q`` win, ties going to the earlier
+    of ``offered_encodings()``; ``*`` stands for any coding the header does
+    not name. Returns None when compression is disabled or nothing offered
+    is acceptable.
+    """
+    if not settings.response_compression or not accept_encoding:
+        return None
+
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        parts = [p.strip() for p in item.split(";")]
+        if not parts[0]:
+            continue
+        q = 1.0
+        for param in parts[1:]:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[parts[0].lower()] = q
+
+    best: str | None = None
+    best_q = 0.0
+    for coding in offered_encodings():
+        q = weights.get(coding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def compress(body: bytes, coding: str) -> bytes:
+    """``body`` encoded with ``coding`` (one of ``offered_encodings()``)."""
+    if coding == "gzip":
+        # mtime=0 keeps the output (and so the cached bytes) a pure function of the body.
+        return gzip.compress(body, compresslevel=_GZIP_LEVEL, mtime=0)
+    if coding == "br" and brotli is not None:
+        return brotli.compress(body, quality=_BROTLI_QUALITY)
+    raise ValueError(f"unsupported content coding: {coding}")
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Hashable, TypeVar
+
+from csv_temperature_data.core.config import settings
+
+T = TypeVar("T")
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            workers = settings.query_workers or os.cpu_count() or 4
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="query")
+        return _executor
+
+
+def shutdown_executor() -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+async def run_query(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run blocking dataset work on the query executor, keeping Starlette's threadpool free."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), partial(fn, *args, **kwargs))
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into one execution on the query executor.
+
+    Callers that arrive while a call for their key is in flight await its
+    result instead of starting their own. A cancelled caller (client gone)
+    does not cancel the shared call.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, asyncio.Future[Any]] = {}
+
+    async def run(self, key: Hashable, fn: Callable[[], T]) -> T:
+        future = self._inflight.get(key)
+        if future is None or future.get_loop() is not asyncio.get_running_loop():
+            future = asyncio.ensure_future(run_query(fn))
+            self._inflight[key] = future
+            future.add_done_callback(partial(self._forget, key))
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: asyncio.Future[Any]) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            future.exception()  # mark retrieved even if every waiter went away
+
+    def inflight(self) -> int:
+        return len(self._inflight)
+
+
+SINGLE_FLIGHT = SingleFlight()
@@ -0,0 +1,107 @@
+"""JSON encoding of API response bodies.
+
+``dumps`` produces exactly the bytes ``fastapi.responses.JSONResponse`` would
+for the same content, with NumPy arrays standing in for the lists their
+``tolist()`` returns (float NaN encoded as ``null``). When the optional
+``orjson`` package is installed and ``settings.fast_json`` is on, payloads
+whose bulk lives in NumPy arrays (the columnar layouts) are serialized by
+orjson straight from the array buffers instead of walking Python floats.
+
+That path is only taken where both encoders are known to agree: float arrays
+must be float64 and every float must print in plain decimal notation under
+``repr`` (Python and orjson spell exponents differently), and content with many Python objects (the points
+layout) stays on the stdlib encoder, since checking it would cost as much as
+encoding it.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import numpy as np
+
+from csv_temperature_data.core.config import settings
+
+try:
+    import orjson
+except ModuleNotFoundError:  # optional; the stdlib encoder is used throughout
+    orjson = None
+
+# Python's repr switches to exponent notation outside [1e-4, 1e16).
+_PLAIN_MIN = 1e-4
+_PLAIN_MAX = 1e16
+# Python containers and scalars the fast path inspects before giving up on a payload.
+_MAX_PYTHON_ITEMS = 4096
+
+
+def _plain_float(value: float) -> bool:
+    magnitude = abs(value)
+    return magnitude == 0 or _PLAIN_MIN <= magnitude < _PLAIN_MAX
+
+
+def _plain_array(array: Any) -> bool:
+    if not array.flags.c_contiguous:
+        return False
+    if array.dtype != np.float64:
+        # orjson prints float32 at its own (shortest) precision; tolist() widens it to float64 first.
+        return array.dtype.kind in "iub"
+    magnitude = np.abs(array[~np.isnan(array)])
+    return bool(np.all((magnitude == 0) | ((magnitude >= _PLAIN_MIN) & (magnitude < _PLAIN_MAX))))
+
+
+def _fast_path_ok(content: object) -> bool:
+    """Whether orjson's output for ``content`` is guaranteed to equal the stdlib encoder's."""
+    budget = _MAX_PYTHON_ITEMS
+    pending = [content]
+    while pending:
+        item = pending.pop()
+        budget -= 1
+        if budget < 0:
+            return False
+        if isinstance(item, np.ndarray):
+            if not _plain_array(item):
+                return False
+        elif isinstance(item, (dict, list)):
+            if len(item) > budget:
+                return False
+            pending.extend(item.values() if isinstance(item, dict) else item)
+        elif isinstance(item, float):
+            if not _plain_float(item):
+                return False
+        elif not (item is None or isinstance(item, (str, int))):
+            return False
+    return True
+
+
+def _nan_to_none(values: list) -> list:
+    if values and isinstance(values[0], list):
+        return [_nan_to_none(row) for row in values]
+    return [None if v != v else v for v in values]
+
+
+def _default(obj: object) -> object:
+    if isinstance(obj, np.ndarray):
+        values = obj.tolist()
+        if obj.dtype.kind == "f" and np.isnan(obj).any():
+            values = _nan_to_none(values)
+        return values
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _stdlib_dumps(content: object) -> bytes:
+    # Same encoding as fastapi.responses.JSONResponse.
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":"), default=_default
+    ).encode("utf-8")
+
+
+def dumps(content: object) -> bytes:
+    """Serialize ``content`` (JSON types plus NumPy arrays) to UTF-8 JSON bytes."""
+    if settings.fast_json and orjson is not None and _fast_path_ok(content):
+        try:
+            return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+        except orjson.JSONEncodeError:  # e.g. integers beyond 64 bits
+            pass
+    return _stdlib_dumps(content)
+
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from csv_temperature_data.core.config import settings
+from csv_temperature_data.core.metrics import REGISTRY
+
+_REQUEST_SECONDS = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency until the response body is sent, by method, route template and status.",
+    ("method", "route", "status"),
+)
+
+
+def _route_label(scope: Scope) -> str:
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    if template is None:
+        return "<unmatched>"
+    # Included routers may report the template without their prefix; the path is exact when it has no parameters.
+    return template if "{" in template else scope["path"]
+
+
+class RequestMetricsMiddleware:
+    """Pure ASGI middleware recording per-route request latency.
+
+    Requests are labelled with the route they matched, never an arbitrary raw
+    path, so label cardinality stays bounded: the request path itself for
+    routes without path parameters, else the route's path template.
+    Unmatched requests share one label.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.metrics_enabled:
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = "500"
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _REQUEST_SECONDS.observe(time.perf_counter() - start, scope["method"], _route_label(scope), status)
@@ -0,0 +1,218 @@
+"""Cache keys and computations of the cached query routes.
+
+Each builder returns ``(query, compute)`` for ``cached_json_response``:
+``query`` identifies the request completely and ``compute`` produces its
+content. The GET routes and ``POST /api/batch`` share them, so a batched
+sub-query and the equivalent GET request share one response-cache entry.
+"""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import Callable, Hashable
+
+from csv_temperature_data.core.csv_data import (
+    analytics_anomalies,
+    analytics_correlation,
+    analytics_normals,
+    analytics_rolling,
+    analytics_summary,
+    annual_data,
+    monthly_data,
+    normalize_stations,
+    station_metadata,
+)
+
+CachedQuery = tuple[tuple[Hashable, ...], Callable[[], object]]
+
+
+def summary_query(csv_path: str, stations: list[str], start_year: int | None, end_year: int | None) -> CachedQuery:
+    return (
+        ("summary", normalize_stations(stations), start_year, end_year),
+        partial(analytics_summary, csv_path, stations=stations, start_year=start_year, end_year=end_year),
+    )
+
+
+def monthly_query(
+    csv_path: str,
+    stations: list[str],
+    start_year: int | None,
+    end_year: int | None,
+    response_format: str,
+    max_points: int | None,
+    downsample: str,
+) -> CachedQuery:
+    return (
+        ("monthly", normalize_stations(stations), start_year, end_year, response_format, max_points, downsample),
+        partial(
+            monthly_data,
+            csv_path,
+            stations=stations,
+            start_year=start_year,
+            end_year=end_year,
+            layout=response_format,
+            max_points=max_points,
+            downsample_method=downsample,
+            arrays=True,
+        ),
+    )
+
+
+def annual_query(
+    csv_path: str,
+    stations: list[str],
+    start_year: int | None,
+    end_year: int | None,
+    include_std: bool,
+    response_format: str,
+    max_points: int | None,
+    downsample: str,
+) -> CachedQuery:
+    return (
+        (
+            "annual",
+            normalize_stations(stations),
+            start_year,
+            end_year,
+            include_std,
+            response_format,
+            max_points,
+            downsample,
+        ),
+        partial(
+            annual_data,
+            csv_path,
+            stations=stations,
+            start_year=start_year,
+            end_year=end_year,
+            include_std=include_std,
+            layout=response_format,
+            max_points=max_points,
+            downsample_method=downsample,
+            arrays=True,
+        ),
+    )
+
+
+def rolling_query(
+    csv_path: str,
+    stations: list[str],
+    window: int,
+    min_years: int | None,
+    start_year: int | None,
+    end_year: int | None,
+    include_std: bool,
+    response_format: str,
+) -> CachedQuery:
+    return (
+        (
+            "rolling",
+            normalize_stations(stations),
+            window,
+            min_years,
+            start_year,
+            end_year,
+            include_std,
+            response_format,
+        ),
+        partial(
+            analytics_rolling,
+            csv_path,
+            stations=stations,
+            window=window,
+            min_years=min_years,
+            start_year=start_year,
+            end_year=end_year,
+            include_std=include_std,
+            layout=response_format,
+            arrays=True,
+        ),
+    )
+
+
+def normals_query(csv_path: str, stations: list[str], base_start: int | None, base_end: int | None) -> CachedQuery:
+    return (
+        ("normals", normalize_stations(stations), base_start, base_end),
+        partial(analytics_normals, csv_path, stations=stations, base_start=base_start, base_end=base_end),
+    )
+
+
+def anomalies_query(
+    csv_path: str,
+    stations: list[str],
+    base_start: int | None,
+    base_end: int | None,
+    start_year: int | None,
+    end_year: int | None,
+    resolution: str,
+    response_format: str,
+) -> CachedQuery:
+    return (
+        (
+            "anomalies",
+            normalize_stations(stations),
+            base_start,
+            base_end,
+            start_year,
+            end_year,
+            resolution,
+            response_format,
+        ),
+        partial(
+            analytics_anomalies,
+            csv_path,
+            stations=stations,
+            base_start=base_start,
+            base_end=base_end,
+            start_year=start_year,
+            end_year=end_year,
+            resolution=resolution,
+            layout=response_format,
+            arrays=True,
+        ),
+    )
+
+
+def correlation_query(
+    csv_path: str,
+    stations: list[str],
+    start_year: int | None,
+    end_year: int | None,
+    anomalies: bool,
+    base_start: int | None,
+    base_end: int | None,
+    min_overlap: int,
+) -> CachedQuery:
+    return (
+        (
+            "correlation",
+            normalize_stations(stations),
+            start_year,
+            end_year,
+            anomalies,
+            base_start,
+            base_end,
+            min_overlap,
+        ),
+        partial(
+            analytics_correlation,
+            csv_path,
+            stations=stations,
+            start_year=start_year,
+            end_year=end_year,
+            anomalies=anomalies,
+            base_start=base_start,
+            base_end=base_end,
+            min_overlap=min_overlap,
+            arrays=True,
+        ),
+    )
+
+
+def station_metadata_query(
+    csv_path: str, prefix: str | None, offset: int, limit: int, response_format: str
+) -> CachedQuery:
+    return (
+        ("stations", prefix, offset, limit, response_format),
+        partial(station_metadata, csv_path, prefix=prefix, offset=offset, limit=limit, layout=response_format),
+    )
@@ -2,7 +2,10 @@ from fastapi import APIRouter
 
 from csv_temperature_data.api.routes.health import router as health_router
 from csv_temperature_data.api.routes.analytics import router as analytics_router
+from csv_temperature_data.api.routes.batch import router as batch_router
 from csv_temperature_data.api.routes.data import router as data_router
+from csv_temperature_data.api.routes.datasets import router as datasets_router
+from csv_temperature_data.api.routes.metrics import router as metrics_router
 from csv_temperature_data.api.routes.stations import router as stations_router
 
 api_router = APIRouter()
@@ -10,3 +13,6 @@ api_router.include_router(health_router)
 api_router.include_router(stations_router)
 api_router.include_router(analytics_router)
 api_router.include_router(data_router)
+api_router.include_router(batch_router)
+api_router.include_router(datasets_router)
+api_router.include_router(metrics_router)
@@ -1,13 +1,30 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
-from csv_temperature_data.core.config import settings
-from csv_temperature_data.core.csv_data import analytics_summary
-from csv_temperature_data.api.utils import ensure_stations_exist, parse_stations_param, validate_year_range
+from csv_temperature_data.api.cache import cached_json_response
+from csv_temperature_data.api.concurrency import run_query
+from csv_temperature_data.api.queries import (
+    anomalies_query,
+    correlation_query,
+    normals_query,
+    rolling_query,
+    summary_query,
+)
+from csv_temperature_data.api.utils import (
+    FORMAT_DESCRIPTION,
+    Resolution,
+    ResponseFormat,
+    dataset_csv_path,
+    ensure_stations_exist,
+    parse_stations_param,
+    validate_year_range,
+)
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
+_BASE_DESCRIPTION = "Reference period for the monthly normals (inclusive); the whole record if omitted."
+
 _MISSING_STATIONS_404 = {
     "description": "One or more requested stations do not exist in the dataset.",
     "content": {
@@ -19,24 +36,139 @@ _MISSING_STATIONS_404 = {
 
 
 @router.get("/summary", responses={404: _MISSING_STATIONS_404})
-def summary(
+async def summary(
+    request: Request,
     stations: str = Query(..., description="Comma-separated station numbers"),
     start_year: int | None = Query(None),
     end_year: int | None = Query(None),
-) -> dict[str, int | float | None]:
+    csv_path: str = Depends(dataset_csv_path),
+) -> Response:
     station_list = parse_stations_param(stations)
     validate_year_range(start_year, end_year)
 
     try:
-        ensure_stations_exist(station_list)
-        return analytics_summary(
-            settings.csv_path,
-            stations=station_list,
-            start_year=start_year,
-            end_year=end_year,
+        await run_query(ensure_stations_exist, csv_path, station_list)
+        return await cached_json_response(
+            request,
+            csv_path,
+            *summary_query(csv_path, station_list, start_year, end_year),
         )
     except FileNotFoundError as e:
         raise HTTPException(
             status_code=500,
-            detail=f"CSV_PATH not found: {settings.csv_path}",
+            detail=f"CSV_PATH not found: {csv_path}",
         ) from e
+
+
+@router.get("/rolling", responses={404: _MISSING_STATIONS_404})
+async def rolling(
+    request: Request,
+    stations: str = Query(..., description="Comma-separated station numbers"),
+    window: int = Query(..., ge=1, description="Window length in years, ending at each reported year"),
+    min_years: int | None = Query(None, ge=1, description="Annual means a window needs (default: all of them)"),
+    start_year: int | None = Query(None),
+    end_year: int | None = Query(None),
+    include_std: bool = Query(False),
+    response_format: ResponseFormat = Query("points", alias="format", description=FORMAT_DESCRIPTION),
+    csv_path: str = Depends(dataset_csv_path),
+) -> Response:
+    """Rolling mean (and population std) of each station's annual means."""
+    station_list = parse_stations_param(stations)
+    validate_year_range(start_year, end_year)
+    if min_years is not None and min_years > window:
+        raise HTTPException(status_code=422, detail="min_years must be <= window")
+
+    try:
+        await run_query(ensure_stations_exist, csv_path, station_list)
+        return await cached_json_response(
+            request,
+            csv_path,
+            *rolling_query(
+                csv_path, station_list, window, min_years, start_year, end_year, include_std, response_format
+            ),
+        )
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=500, detail=f"CSV_PATH not found: {csv_path}") from e
+
+
+@router.get("/normals", responses={404: _MISSING_STATIONS_404})
+async def normals(
+    request: Request,
+    stations: str = Query(..., description="Comma-separated station numbers"),
+    base_start: int | None = Query(None, description=_BASE_DESCRIPTION),
+    base_end: int | None = Query(None, description=_BASE_DESCRIPTION),
+    csv_path: str = Depends(dataset_csv_path),
+) -> Response:
+    """Per-calendar-month climatological normals of each station."""
+    station_list = parse_stations_param(stations)
+    validate_year_range(base_start, base_end, ("base_start", "base_end"))
+
+    try:
+        await run_query(ensure_stations_exist, csv_path, station_list)
+        return await cached_json_response(
+            request,
+            csv_path,
+            *normals_query(csv_path, station_list, base_start, base_end),
+        )
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=500, detail=f"CSV_PATH not found: {csv_path}") from e
+
+
+@router.get("/anomalies", responses={404: _MISSING_STATIONS_404})
+async def anomalies(
+    request: Request,
+    stations: str = Query(..., description="Comma-separated station numbers"),
+    base_start: int | None = Query(None, description=_BASE_DESCRIPTION),
+    base_end: int | None = Query(None, description=_BASE_DESCRIPTION),
+    start_year: int | None = Query(None),
+    end_year: int | None = Query(None),
+    resolution: Resolution = Query("monthly", description="`annual`: mean monthly anomaly per year"),
+    response_format: ResponseFormat = Query("points", alias="format", description=FORMAT_DESCRIPTION),
+    csv_path: str = Depends(dataset_csv_path),
+) -> Response:
+    """Departures of each station's values from its monthly normals."""
+    station_list = parse_stations_param(stations)
+    validate_year_range(start_year, end_year)
+    validate_year_range(base_start, base_end, ("base_start", "base_end"))
+
+    try:
+        await run_query(ensure_stations_exist, csv_path, station_list)
+        return await cached_json_response(
+            request,
+            csv_path,
+            *anomalies_query(
+                csv_path, station_list, base_start, base_end, start_year, end_year, resolution, response_format
+            ),
+        )
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=500, detail=f"CSV_PATH not found: {csv_path}") from e
+
+
+@router.get("/correlation", responses={404: _MISSING_STATIONS_404})
+async def correlation(
+    request: Request,
+    stations: str = Query(..., description="Comma-separated station numbers"),
+    start_year: int | None = Query(None),
+    end_year: int | None = Query(None),
+    anomalies: bool = Query(False, description="Correlate departures from each station's monthly normals"),
+    base_start: int | None = Query(None, description=_BASE_DESCRIPTION),
+    base_end: int | None = Query(None, description=_BASE_DESCRIPTION),
+    min_overlap: int = Query(12, ge=2, description="Shared months a pair needs for a correlation"),
+    csv_path: str = Depends(dataset_csv_path),
+) -> Response:
+    """Pairwise Pearson correlation matrix of the stations' monthly values (or anomalies)."""
+    station_list = parse_stations_param(stations)
+    validate_year_range(start_year, end_year)
+    validate_year_range(base_start, base_end, ("base_start", "base_end"))
+
+    try:
+        await run_query(ensure_stations_exist, csv_path, station_list)
+        return await cached_json_response(
+            request,
+            csv_path,
+            *correlation_query(
+                csv_path, station_list, start_year, end_year, anomalies, base_start, base_end, min_overlap
+            ),
+        )
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=500, detail=f"CSV_PATH not found: {csv_path}") from e
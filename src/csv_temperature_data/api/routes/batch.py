@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Annotated, Callable, Hashable, Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from pydantic import BaseModel, ConfigDict, Field
+
+from csv_temperature_data.api.cache import cached_body, compressed_body
+from csv_temperature_data.api.compression import negotiate_encoding
+from csv_temperature_data.api.concurrency import run_query
+from csv_temperature_data.api.encoding import dumps
+from csv_temperature_data.api.queries import (
+    CachedQuery,
+    annual_query,
+    anomalies_query,
+    correlation_query,
+    monthly_query,
+    normals_query,
+    rolling_query,
+    summary_query,
+)
+from csv_temperature_data.api.utils import (
+    DownsampleMethod,
+    Resolution,
+    ResponseFormat,
+    dataset_csv_path,
+    parse_stations_param,
+    validate_year_range,
+)
+from csv_temperature_data.core.config import settings
+from csv_temperature_data.core.csv_data import dataset_version, station_set
+
+router = APIRouter(tags=["batch"])
+
+MAX_QUERIES = 100
+
+
+class _StationsQuery(BaseModel, ABC):
+    model_config = ConfigDict(extra="forbid", populate_by_name=True)
+
+    stations: str | list[str] = Field(..., description="Station numbers, as a list or comma-separated")
+
+    def station_list(self) -> list[str]:
+        return parse_stations_param(self.stations if isinstance(self.stations, str) else ",".join(self.stations))
+
+    def check(self) -> None:
+        """Raise ``HTTPException`` (422) like the GET route would for inconsistent parameters."""
+
+    @abstractmethod
+    def cached_query(self, csv_path: str, stations: list[str]) -> CachedQuery:
+        """The sub-query's ``(query, compute)`` from ``api.queries``."""
+
+
+class _YearsQuery(_StationsQuery):
+    start_year: int | None = None
+    end_year: int | None = None
+
+    def check(self) -> None:
+        validate_year_range(self.start_year, self.end_year)
+
+
+class SummaryQuery(_YearsQuery):
+    type: Literal["summary"]
+
+    def cached_query(self, csv_path: str, stations: list[str]) -> CachedQuery:
+        return summary_query(csv_path, stations, self.start_year, self.end_year)
+
+
+class MonthlyQuery(_YearsQuery):
+    type: Literal["monthly"]
+    response_format: ResponseFormat = Field("points", alias="format")
+    max_points: int | None = Field(None, ge=3)
+    downsample: DownsampleMethod = "lttb"
+
+    def cached_query(self, csv_path: str, stations: list[str]) -> CachedQuery:
+        return monthly_query(
+            csv_path, stations, self.start_year, self.end_year, self.response_format, self.max_points, self.downsample
+        )
+
+
+class AnnualQuery(_YearsQuery):
+    type: Literal["annual"]
+    include_std: bool = False
+    response_format: ResponseFormat = Field("points", alias="format")
+    max_points: int | None = Field(None, ge=3)
+    downsample: DownsampleMethod = "lttb"
+
+    def cached_query(self, csv_path: str, stations: list[str]) -> CachedQuery:
+        return annual_query(
+            csv_path,
+            stations,
+            self.start_year,
+            self.end_year,
+            self.include_std,
+            self.response_format,
+            self.max_points,
+            self.downsample,
+        )
+
+
+class RollingQuery(_YearsQuery):
+    type: Literal["rolling"]
+    window: int = Field(..., ge=1)
+    min_years: int | None = Field(None, ge=1)
+    include_std: bool = False
+    response_format: ResponseFormat = Field("points", alias="format")
+
+    def check(self) -> None:
+        super().check()
+        if self.min_years is not None and self.min_years > self.window:
+            raise HTTPException(status_code=422, detail="min_years must be <= window")
+
+    def cached_query(self, csv_path: str, stations: list[str]) -> CachedQuery:
+        return rolling_query(
+            csv_path,
+            stations,
+            self.window,
+            self.min_years,
+            self.start_year,
+            self.end_year,
+            self.include_std,
+            self.response_format,
+        )
+
+
+class NormalsQuery(_StationsQuery):
+    type: Literal["normals"]
+    base_start: int | None = None
+    base_end: int | None = None
+
+    def check(self) -> None:
+        validate_year_range(self.base_start, self.base_end, ("base_start", "base_end"))
+
+    def cached_query(self, csv_path: str, stations: list[str]) -> CachedQuery:
+        return normals_query(csv_path, stations, self.base_start, self.base_end)
+
+
+class AnomaliesQuery(_YearsQuery):
+    type: Literal["anomalies"]
+    base_start: int | None = None
+    base_end: int | None = None
+    resolution: Resolution = "monthly"
+    response_format: ResponseFormat = Field("points", alias="format")
+
+    def check(self) -> None:
+        super().check()
+        validate_year_range(self.base_start, self.base_end, ("base_start", "base_end"))
+
+    def cached_query(self, csv_path: str, stations: list[str]) -> CachedQuery:
+        return anomalies_query(
+            csv_path,
+            stations,
+            self.base_start,
+            self.base_end,
+            self.start_year,
+            self.end_year,
+            self.resolution,
+            self.response_format,
+        )
+
+
+class CorrelationQuery(_YearsQuery):
+    type: Literal["correlation"]
+    anomalies: bool = False
+    base_start: int | None = None
+    base_end: int | None = None
+    min_overlap: int = Field(12, ge=2)
+
+    def check(self) -> None:
+        super().check()
+        validate_year_range(self.base_start, self.base_end, ("base_start", "base_end"))
+
+    def cached_query(self, csv_path: str, stations: list[str]) -> CachedQuery:
+        return correlation_query(
+            csv_path,
+            stations,
+            self.start_year,
+            self.end_year,
+            self.anomalies,
+            self.base_start,
+            self.base_end,
+            self.min_overlap,
+        )
+
+
+SubQuery = Annotated[
+    SummaryQuery | MonthlyQuery | AnnualQuery | RollingQuery | NormalsQuery | AnomaliesQuery | CorrelationQuery,
+    Field(discriminator="type"),
+]
+
+
+class BatchRequest(BaseModel):
+    queries: list[SubQuery] = Field(..., min_length=1, max_length=MAX_QUERIES)
+
+
+def _snapshot_info(csv_path: str) -> tuple[frozenset[str], str]:
+    return station_set(csv_path), dataset_version(csv_path)
+
+
+@router.post("/batch")
+async def batch(request: Request, body: BatchRequest, csv_path: str = Depends(dataset_csv_path)) -> Response:
+    """Answer several query-route requests in one round trip.
+
+    ``type`` selects the route (``summary``, ``monthly``, ``annual``,
+    ``rolling``, ``normals``, ``anomalies`` or ``correlation``); the other
+    fields are that route's query parameters. Results come back in request order as
+    ``{"status": 200, "body": ...}`` with exactly the GET route's body, or
+    ``{"status": 404|422, "detail": ...}`` for a sub-query the route would
+    reject. Stations are checked against one lookup, identical sub-queries
+    are computed once, and results share the GET routes' response cache.
+    The combined body is compressed per request as ``Accept-Encoding`` allows.
+    """
+    try:
+        available, version = await run_query(_snapshot_info, csv_path)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=500, detail=f"CSV_PATH not found: {csv_path}") from e
+
+    results: list[bytes | None] = [None] * len(body.queries)
+    pending: dict[Hashable, tuple[Callable[[], object], list[int]]] = {}
+    for i, query in enumerate(body.queries):
+        try:
+            stations = query.station_list()
+            query.check()
+            missing = sorted(set(stations) - available)
+            if missing:
+                raise HTTPException(status_code=404, detail={"missing_stations": missing})
+        except HTTPException as e:
+            results[i] = dumps({"status": e.status_code, "detail": e.detail})
+            continue
+        query_key, compute = query.cached_query(csv_path, stations)
+        pending.setdefault((csv_path, version, *query_key), (compute, []))[1].append(i)
+
+    try:
+        bodies = await asyncio.gather(*(cached_body(key, compute) for key, (compute, _) in pending.items()))
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=500, detail=f"CSV_PATH not found: {csv_path}") from e
+    for content, (_, indices) in zip(bodies, pending.values()):
+        result = b'{"status":200,"body":' + content + b"}"
+        for i in indices:
+            results[i] = result
+    content = b'{"results":[' + b",".join(results) + b"]}"
+    headers = {"Vary": "Accept-Encoding"} if settings.response_compression else {}
+    coding = negotiate_encoding(request.headers.get("accept-encoding"))
+    if coding is not None and len(content) >= settings.compression_min_bytes:
+        content = await compressed_body(content, coding)
+        headers["Content-Encoding"] = coding
+    return Response(content=content, media_type="application/json", headers=headers)
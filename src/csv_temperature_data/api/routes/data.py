@@ -1,13 +1,35 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
-from csv_temperature_data.core.config import settings
-from csv_temperature_data.core.csv_data import annual_data, data_year_range, monthly_data
-from csv_temperature_data.api.utils import ensure_stations_exist, parse_stations_param, validate_year_range
+from csv_temperature_data.api.cache import cached_json_response
+from csv_temperature_data.api.concurrency import run_query
+from csv_temperature_data.api.queries import annual_query, monthly_query
+from csv_temperature_data.core.csv_data import data_year_range, export_series
+from csv_temperature_data.core.export import (
+    ARROW_MEDIA_TYPE,
+    RAW_MEDIA_TYPE,
+    arrow_available,
+    arrow_stream,
+    raw_stream,
+)
+from csv_temperature_data.api.utils import (
+    FORMAT_DESCRIPTION,
+    DownsampleMethod,
+    ResponseFormat,
+    dataset_csv_path,
+    ensure_stations_exist,
+    negotiate_media_type,
+    parse_stations_param,
+    validate_year_range,
+)
 
 router = APIRouter(prefix="/data", tags=["data"])
 
+_MAX_POINTS_DESCRIPTION = "Downsample each station's series to at most this many points (e.g. the plot width in pixels)."
+_DOWNSAMPLE_DESCRIPTION = "`lttb`: Largest-Triangle-Three-Buckets. `minmax`: min and max per bucket."
+
 _MISSING_STATIONS_404 = {
     "description": "One or more requested stations do not exist in the dataset.",
     "content": {
@@ -19,52 +41,114 @@ _MISSING_STATIONS_404 = {
 
 
 @router.get("/range")
-def get_range() -> dict[str, int | None]:
+async def get_range(csv_path: str = Depends(dataset_csv_path)) -> dict[str, int | None]:
     try:
-        return data_year_range(settings.csv_path)
+        return await run_query(data_year_range, csv_path)
     except FileNotFoundError as e:
-        raise HTTPException(status_code=500, detail=f"CSV_PATH not found: {settings.csv_path}") from e
+        raise HTTPException(status_code=500, detail=f"CSV_PATH not found: {csv_path}") from e
 
 
 @router.get("/monthly", responses={404: _MISSING_STATIONS_404})
-def get_monthly(
+async def get_monthly(
+    request: Request,
     stations: str = Query(..., description="Comma-separated station numbers"),
     start_year: int | None = Query(None),
     end_year: int | None = Query(None),
-) -> dict[str, object]:
+    response_format: ResponseFormat = Query("points", alias="format", description=FORMAT_DESCRIPTION),
+    max_points: int | None = Query(None, ge=3, description=_MAX_POINTS_DESCRIPTION),
+    downsample: DownsampleMethod = Query("lttb", description=_DOWNSAMPLE_DESCRIPTION),
+    csv_path: str = Depends(dataset_csv_path),
+) -> Response:
     station_list = parse_stations_param(stations)
     validate_year_range(start_year, end_year)
 
     try:
-        ensure_stations_exist(station_list)
-        return monthly_data(
-            settings.csv_path,
-            stations=station_list,
-            start_year=start_year,
-            end_year=end_year,
+        await run_query(ensure_stations_exist, csv_path, station_list)
+        return await cached_json_response(
+            request,
+            csv_path,
+            *monthly_query(
+                csv_path, station_list, start_year, end_year, response_format, max_points, downsample
+            ),
         )
     except FileNotFoundError as e:
-        raise HTTPException(status_code=500, detail=f"CSV_PATH not found: {settings.csv_path}") from e
+        raise HTTPException(status_code=500, detail=f"CSV_PATH not found: {csv_path}") from e
 
 
 @router.get("/annual", responses={404: _MISSING_STATIONS_404})
-def get_annual(
+async def get_annual(
+    request: Request,
     stations: str = Query(..., description="Comma-separated station numbers"),
     start_year: int | None = Query(None),
     end_year: int | None = Query(None),
     include_std: bool = Query(False),
-) -> dict[str, object]:
+    response_format: ResponseFormat = Query("points", alias="format", description=FORMAT_DESCRIPTION),
+    max_points: int | None = Query(None, ge=3, description=_MAX_POINTS_DESCRIPTION),
+    downsample: DownsampleMethod = Query("lttb", description=_DOWNSAMPLE_DESCRIPTION),
+    csv_path: str = Depends(dataset_csv_path),
+) -> Response:
     station_list = parse_stations_param(stations)
     validate_year_range(start_year, end_year)
 
     try:
-        ensure_stations_exist(station_list)
-        return annual_data(
-            settings.csv_path,
+        await run_query(ensure_stations_exist, csv_path, station_list)
+        return await cached_json_response(
+            request,
+            csv_path,
+            *annual_query(
+                csv_path, station_list, start_year, end_year, include_std, response_format, max_points, downsample
+            ),
+        )
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=500, detail=f"CSV_PATH not found: {csv_path}") from e
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "Raw little-endian buffer (see `core/export.py`) or an Arrow IPC stream, per `Accept`.",
+            "content": {RAW_MEDIA_TYPE: {}, ARROW_MEDIA_TYPE: {}},
+        },
+        404: _MISSING_STATIONS_404,
+        406: {"description": "None of the acceptable media types can be produced."},
+    },
+)
+async def export(
+    request: Request,
+    stations: str | None = Query(None, description="Comma-separated station numbers; all stations if omitted"),
+    start_year: int | None = Query(None),
+    end_year: int | None = Query(None),
+    csv_path: str = Depends(dataset_csv_path),
+) -> StreamingResponse:
+    offered = [RAW_MEDIA_TYPE, ARROW_MEDIA_TYPE] if arrow_available() else [RAW_MEDIA_TYPE]
+    media_type = negotiate_media_type(request.headers.get("accept"), offered)
+    if media_type is None:
+        raise HTTPException(status_code=406, detail={"acceptable": offered})
+
+    station_list = parse_stations_param(stations) if stations is not None else None
+    validate_year_range(start_year, end_year)
+
+    try:
+        if station_list is not None:
+            await run_query(ensure_stations_exist, csv_path, station_list)
+        month_cols, months, series = await run_query(
+            export_series,
+            csv_path,
             stations=station_list,
             start_year=start_year,
             end_year=end_year,
-            include_std=include_std,
         )
     except FileNotFoundError as e:
-        raise HTTPException(status_code=500, detail=f"CSV_PATH not found: {settings.csv_path}") from e
+        raise HTTPException(status_code=500, detail=f"CSV_PATH not found: {csv_path}") from e
+
+    if media_type == ARROW_MEDIA_TYPE:
+        body, filename = arrow_stream(month_cols, series), "temperature_data.arrows"
+    else:
+        body, filename = raw_stream(months, series), "temperature_data.bin"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"', "Vary": "Accept"},
+    )
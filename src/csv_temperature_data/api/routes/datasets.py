@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import os
+
+from fastapi import APIRouter
+
+from csv_temperature_data.api.concurrency import run_query
+from csv_temperature_data.api.utils import list_datasets
+from csv_temperature_data.core.config import settings
+from csv_temperature_data.core.csv_data import dataset_cache_info
+
+router = APIRouter(tags=["datasets"])
+
+
+@router.get("/datasets")
+async def get_datasets() -> dict[str, object]:
+    """Selectable dataset ids, which of them are loaded, and the memory the loaded ones hold."""
+    ids = await run_query(list_datasets)
+    info = dataset_cache_info()
+    loaded: dict[str, int] = info["datasets"]  # type: ignore[assignment]
+
+    def _path(dataset_id: str) -> str:
+        return os.path.join(settings.datasets_dir, f"{dataset_id}.csv")
+
+    return {
+        "default": {"loaded": settings.csv_path in loaded, "bytes": loaded.get(settings.csv_path, 0)},
+        "datasets": [
+            {"id": dataset_id, "loaded": _path(dataset_id) in loaded, "bytes": loaded.get(_path(dataset_id), 0)}
+            for dataset_id in ids
+        ],
+        "memory": {"total_bytes": info["total_bytes"], "max_bytes": info["max_bytes"]},
+    }
@@ -4,6 +4,6 @@ router = APIRouter(tags=["health"])
 
 
 @router.get("/health")
-def healthcheck() -> dict[str, str]:
+async def healthcheck() -> dict[str, str]:
     return {"status": "ok"}
 
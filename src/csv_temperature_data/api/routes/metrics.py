@@ -0,0 +1,12 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from csv_temperature_data.core.metrics import CONTENT_TYPE, REGISTRY
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", response_class=Response)
+async def metrics() -> Response:
+    """Prometheus text exposition of request latencies, query-stage timings and memory gauges."""
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
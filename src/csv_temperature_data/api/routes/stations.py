@@ -1,22 +1,57 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
-from csv_temperature_data.core.config import settings
+from csv_temperature_data.api.cache import cached_json_response
+from csv_temperature_data.api.concurrency import run_query
+from csv_temperature_data.api.queries import station_metadata_query
+from csv_temperature_data.api.utils import FORMAT_DESCRIPTION, ResponseFormat, dataset_csv_path
 from csv_temperature_data.core.csv_data import unique_stations
 
 router = APIRouter(tags=["stations"])
 
+MAX_PAGE = 1000
+
 
 @router.get("/stations")
-def list_stations() -> dict[str, object]:
+async def list_stations(csv_path: str = Depends(dataset_csv_path)) -> dict[str, object]:
     try:
-        stations = unique_stations(settings.csv_path)
+        stations = await run_query(unique_stations, csv_path)
     except FileNotFoundError as e:
         raise HTTPException(
             status_code=500,
-            detail=f"CSV_PATH not found: {settings.csv_path}",
+            detail=f"CSV_PATH not found: {csv_path}",
         ) from e
 
     return {"count": len(stations), "stations": stations}
 
+
+@router.get("/stations/metadata")
+async def station_metadata(
+    request: Request,
+    prefix: str | None = Query(None, description="Only stations whose number starts with this"),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE),
+    response_format: ResponseFormat = Query("points", alias="format", description=FORMAT_DESCRIPTION),
+    csv_path: str = Depends(dataset_csv_path),
+) -> Response:
+    """Coverage and overall statistics per station, paginated, optionally filtered by prefix.
+
+    ``count`` is the number of matching stations. Each entry has
+    ``first_year``, ``last_year``, ``valid_months``, ``missing_ratio`` (share
+    of empty months between the first and last year) and the record's
+    ``mean``, ``min`` and ``max``. The table is computed once per dataset
+    version from the precomputed aggregates.
+    """
+    prefix = prefix.strip() if prefix else None
+    try:
+        return await cached_json_response(
+            request,
+            csv_path,
+            *station_metadata_query(csv_path, prefix or None, offset, limit, response_format),
+        )
+    except FileNotFoundError as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"CSV_PATH not found: {csv_path}",
+        ) from e
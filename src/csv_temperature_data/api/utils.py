@@ -1,10 +1,24 @@
 from __future__ import annotations
 
-from fastapi import HTTPException
+import os
+import re
+from typing import Literal
+
+from fastapi import HTTPException, Query
 
 from csv_temperature_data.core.config import settings
 from csv_temperature_data.core.csv_data import station_set
 
+_DATASET_ID = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]*$")
+
+ResponseFormat = Literal["points", "columnar"]
+DownsampleMethod = Literal["lttb", "minmax"]
+Resolution = Literal["monthly", "annual"]
+FORMAT_DESCRIPTION = (
+    "`points`: one object per point. "
+    "`columnar`: parallel arrays per station, which is much smaller to encode and transfer."
+)
+
 
 def parse_stations_param(stations: str) -> list[str]:
     station_list = [s.strip() for s in stations.split(",") if s and s.strip()]
@@ -13,14 +27,71 @@ def parse_stations_param(stations: str) -> list[str]:
     return station_list
 
 
-def validate_year_range(start_year: int | None, end_year: int | None) -> None:
+def validate_year_range(
+    start_year: int | None, end_year: int | None, names: tuple[str, str] = ("start_year", "end_year")
+) -> None:
     if start_year is not None and end_year is not None and start_year > end_year:
-        raise HTTPException(status_code=422, detail="start_year must be <= end_year")
+        raise HTTPException(status_code=422, detail=f"{names[0]} must be <= {names[1]}")
 
 
-def ensure_stations_exist(stations: list[str]) -> None:
-    available = station_set(settings.csv_path)
+def ensure_stations_exist(csv_path: str, stations: list[str]) -> None:
+    available = station_set(csv_path)
     missing = sorted(set(stations) - set(available))
     if missing:
         raise HTTPException(status_code=404, detail={"missing_stations": missing})
 
+
+def list_datasets() -> list[str]:
+    """Dataset ids available in ``settings.datasets_dir`` (CSV file names without ``.csv``)."""
+    if not settings.datasets_dir or not os.path.isdir(settings.datasets_dir):
+        return []
+    names = (name[: -len(".csv")] for name in os.listdir(settings.datasets_dir) if name.endswith(".csv"))
+    return sorted(name for name in names if _DATASET_ID.match(name))
+
+
+def dataset_csv_path(
+    dataset: str | None = Query(None, description="Dataset id from /api/datasets; the default CSV if omitted"),
+) -> str:
+    """Dependency resolving the ``dataset`` query parameter to a CSV path."""
+    if dataset is None:
+        return settings.csv_path
+    if settings.datasets_dir and _DATASET_ID.match(dataset):
+        csv_path = os.path.join(settings.datasets_dir, f"{dataset}.csv")
+        if os.path.isfile(csv_path):
+            return csv_path
+    raise HTTPException(status_code=404, detail={"unknown_dataset": dataset})
+
+
+def negotiate_media_type(accept: str | None, offered: list[str]) -> str | None:
+    """Return the offered media type the ``Accept`` header prefers, or None if none is acceptable.
+
+    The most specific matching range decides each offer's ``q``; ties go to the
+    earlier offer. A missing header accepts the first offer.
+    """
+    if not accept or not accept.strip():
+        return offered[0] if offered else None
+
+    ranges: dict[str, float] = {}
+    for media_range in accept.split(","):
+        parts = [p.strip() for p in media_range.split(";")]
+        if not parts[0]:
+            continue
+        q = 1.0
+        for param in parts[1:]:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        ranges[parts[0].lower()] = q
+
+    best: str | None = None
+    best_q = 0.0
+    for offer in offered:
+        for candidate in (offer, offer.split("/", 1)[0] + "/*", "*/*"):
+            if candidate in ranges:
+                if ranges[candidate] > best_q:
+                    best, best_q = offer, ranges[candidate]
+                break
+    return best
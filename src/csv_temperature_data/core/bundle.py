@@ -0,0 +1,123 @@
+"""On-disk cache of parsed datasets as a bundle of ``.npy`` files.
+
+A bundle is a directory holding ``meta.json`` plus one ``.npy`` file per array.
+It is keyed by the CSV's absolute path, mtime and size, so any change to the
+CSV makes the old bundle unreachable. Arrays are opened with ``mmap_mode="r"``:
+later loads skip CSV parsing entirely and worker processes share the pages
+through the OS page cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the arrays stored in a bundle change meaning.
+BUNDLE_FORMAT = 2
+
+
+def _key(csv_path: str) -> str:
+    return hashlib.sha1(os.path.abspath(csv_path).encode("utf-8")).hexdigest()[:16]
+
+
+def bundle_dir(cache_dir: str, csv_path: str, mtime_ns: int, size: int) -> str:
+    return os.path.join(cache_dir, f"{_key(csv_path)}-{mtime_ns}-{size}-v{BUNDLE_FORMAT}")
+
+
+def read_bundle(
+    cache_dir: str, csv_path: str, mtime_ns: int, size: int
+) -> tuple[dict[str, Any], dict[str, np.ndarray]] | None:
+    """Return ``(meta, arrays)`` for a matching bundle, or None if there is none (or it is unreadable)."""
+    path = bundle_dir(cache_dir, csv_path, mtime_ns, size)
+    try:
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r") for name in meta["arrays"]}
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning("Ignoring unreadable dataset cache %s: %s", path, e)
+        return None
+    return meta, arrays
+
+
+class BundleBuilder:
+    """Writes a bundle incrementally in a temp directory.
+
+    ``allocate`` creates an array as a writable memory map to be filled in
+    place, so arrays larger than RAM can be built piecewise. Readers see
+    nothing until ``commit`` renames the directory into place. Raises
+    ``OSError`` on filesystem errors.
+    """
+
+    def __init__(self, cache_dir: str, csv_path: str, mtime_ns: int, size: int) -> None:
+        self.cache_dir = cache_dir
+        self.csv_path = csv_path
+        self.target = bundle_dir(cache_dir, csv_path, mtime_ns, size)
+        os.makedirs(cache_dir, exist_ok=True)
+        self._tmp = tempfile.mkdtemp(prefix=".bundle-", dir=cache_dir)
+        self._allocated: set[str] = set()
+
+    def allocate(self, name: str, shape: tuple[int, ...], dtype: Any) -> np.ndarray:
+        """Return a zero-filled, writable memory-mapped array stored as ``name``."""
+        self._allocated.add(name)
+        path = os.path.join(self._tmp, f"{name}.npy")
+        return np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=shape)
+
+    def commit(self, meta: dict[str, Any], arrays: dict[str, np.ndarray]) -> None:
+        """Save ``arrays`` not created by ``allocate``, write ``meta.json`` and publish the bundle.
+
+        Older bundles of the same CSV are removed afterwards.
+        """
+        try:
+            for name, array in arrays.items():
+                if name in self._allocated:
+                    if isinstance(array, np.memmap):
+                        array.flush()
+                else:
+                    np.save(os.path.join(self._tmp, f"{name}.npy"), array, allow_pickle=False)
+            with open(os.path.join(self._tmp, "meta.json"), "w", encoding="utf-8") as f:
+                json.dump({**meta, "csv_path": os.path.abspath(self.csv_path), "arrays": sorted(arrays)}, f)
+            os.rename(self._tmp, self.target)
+        except OSError:
+            self.abort()
+            if not os.path.isdir(self.target):  # another worker may have won the rename
+                raise
+
+        prefix = f"{_key(self.csv_path)}-"
+        for name in os.listdir(self.cache_dir):
+            stale = os.path.join(self.cache_dir, name)
+            if name.startswith(prefix) and stale != self.target:
+                shutil.rmtree(stale, ignore_errors=True)
+
+    def abort(self) -> None:
+        shutil.rmtree(self._tmp, ignore_errors=True)
+
+
+def write_bundle(
+    cache_dir: str,
+    csv_path: str,
+    mtime_ns: int,
+    size: int,
+    meta: dict[str, Any],
+    arrays: dict[str, np.ndarray],
+) -> None:
+    """Write a bundle atomically (temp dir + rename) and drop older bundles of the same CSV.
+
+    Failures are logged and swallowed: the cache is an optimization only.
+    """
+    if os.path.isdir(bundle_dir(cache_dir, csv_path, mtime_ns, size)):
+        return
+    try:
+        BundleBuilder(cache_dir, csv_path, mtime_ns, size).commit(meta, arrays)
+    except OSError as e:
+        logger.warning("Could not write dataset cache for %s: %s", csv_path, e)
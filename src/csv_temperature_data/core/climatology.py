@@ -0,0 +1,112 @@
+"""Sliding-window, climatology and cross-station statistics over dense arrays.
+
+All functions take NaN as "missing" and work on whole arrays: windows come
+from differences of cumulative sums, so a series of any length costs a few
+vectorized passes however wide the window is, and pairwise statistics come
+from matrix products instead of loops over pairs.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def _window_sums(values: np.ndarray, window: int) -> np.ndarray:
+    """Sum of each run of ``window`` consecutive entries (``len(values) - window + 1`` of them)."""
+    totals = np.concatenate(([0], np.cumsum(values)))
+    return totals[window:] - totals[:-window]
+
+
+def rolling_mean_std(
+    values: np.ndarray, window: int, min_count: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Trailing-window mean and population std of ``values``, skipping NaN.
+
+    Entry ``i`` of each result covers ``values[i : i + window]``. Returns
+    ``(means, stds, counts)`` as float64/float64/int64; windows with fewer
+    than ``min_count`` values are NaN. Values are centred on their overall
+    mean before accumulating, which keeps the sum-of-squares variance free of
+    cancellation for temperature-sized data.
+    """
+    n_windows = values.shape[0] - window + 1
+    if n_windows <= 0:
+        empty = np.empty(0, dtype=np.float64)
+        return empty, empty.copy(), np.empty(0, dtype=np.int64)
+
+    finite = np.isfinite(values)
+    centred = np.zeros(values.shape[0], dtype=np.float64)
+    if finite.any():
+        centre = float(values[finite].astype(np.float64).mean())
+        centred[finite] = values[finite] - centre
+    else:
+        centre = 0.0
+
+    counts = _window_sums(finite.astype(np.int64), window)
+    sums = _window_sums(centred, window)
+    sumsq = _window_sums(centred * centred, window)
+
+    means = np.full(n_windows, np.nan)
+    stds = np.full(n_windows, np.nan)
+    ok = counts >= max(min_count, 1)
+    shifted = sums[ok] / counts[ok]
+    means[ok] = shifted + centre
+    stds[ok] = np.sqrt(np.maximum(sumsq[ok] / counts[ok] - shifted * shifted, 0.0))
+    return means, stds, counts
+
+
+def monthly_normals(block: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Per-calendar-month mean over the years of a ``(..., year, month)`` block.
+
+    Returns ``(normals, counts)`` shaped ``(..., month)``; months without any
+    value have a NaN normal and a zero count.
+    """
+    finite = np.isfinite(block)
+    counts = np.count_nonzero(finite, axis=-2)
+    sums = np.where(finite, block, 0).sum(axis=-2, dtype=np.float64)
+    normals = np.full(counts.shape, np.nan)
+    np.true_divide(sums, counts, out=normals, where=counts > 0)
+    return normals, counts
+
+
+def annual_anomalies(anomalies: np.ndarray) -> np.ndarray:
+    """Mean monthly anomaly of each year (row) of a ``(year, month)`` block, NaN for years without any."""
+    finite = np.isfinite(anomalies)
+    counts = np.count_nonzero(finite, axis=1)
+    sums = np.where(finite, anomalies, 0).sum(axis=1)
+    out = np.full(anomalies.shape[0], np.nan)
+    np.true_divide(sums, counts, out=out, where=counts > 0)
+    return out
+
+
+def pairwise_correlation(values: np.ndarray, min_overlap: int) -> tuple[np.ndarray, np.ndarray]:
+    """Pearson correlation between the rows of ``values`` over their pairwise-complete columns.
+
+    Returns ``(r, overlap)``: symmetric ``(rows, rows)`` float64 and int64
+    matrices, ``overlap[i, j]`` being the number of columns where both rows
+    have a value. ``r`` is NaN where the overlap is below ``min_overlap`` (at
+    least 2) or either row is constant on it. Every per-pair sum comes from
+    one matrix product over the value and presence matrices, so the cost is
+    a handful of ``rows x columns x rows`` products and no per-pair work.
+    """
+    finite = np.isfinite(values)
+    present = finite.astype(np.float64)
+    row_counts = present.sum(axis=1)
+    row_means = np.zeros(values.shape[0])
+    np.true_divide(np.where(finite, values, 0).sum(axis=1), row_counts, out=row_means, where=row_counts > 0)
+    # Centring each row first keeps the sums of squares small relative to the variances.
+    centred = np.where(finite, values - row_means[:, None], 0.0)
+
+    overlap = present @ present.T
+    sums = centred @ present.T  # sums[i, j]: sum of row i over the columns row j also has
+    sumsq = (centred * centred) @ present.T
+    cross = centred @ centred.T
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = cross - sums * sums.T / overlap
+        var = sumsq - sums * sums / overlap
+        r = cov / np.sqrt(var * var.T)
+    defined = (overlap >= max(min_overlap, 2)) & (var > 0) & (var.T > 0)
+    r = np.where(defined, np.clip(r, -1.0, 1.0), np.nan)
+    np.fill_diagonal(r, np.where(np.diagonal(defined), 1.0, np.nan))
+    r = np.triu(r) + np.triu(r, 1).T  # exactly symmetric whatever the products' rounding
+    return r, overlap.astype(np.int64)
@@ -10,13 +10,76 @@ class Settings(BaseModel):
     env: Literal["development", "test", "production"] = "development"
     app_name: str = "csv_temperature_data"
     csv_path: str = "data/temperature_data.csv"
+    # Directory of additional CSV archives, selectable per request as ?dataset=<file name without .csv>.
+    datasets_dir: str = ""
+    # Evict least recently used datasets beyond this many bytes; 0 keeps everything loaded.
+    dataset_cache_bytes: int = 0
+    # Directory for parsed-dataset bundles (memory-mapped on later loads); empty disables it.
+    cache_dir: str = ""
+    # CSVs at least this large are parsed in chunks straight into a memory-mapped bundle (needs cache_dir).
+    stream_threshold_bytes: int = 256 * 1024 * 1024
+    # Rows per chunk when streaming a CSV.
+    stream_chunk_rows: int = 200_000
+    # Seconds between checks of the CSV for changes; 0 disables the background reloader.
+    reload_interval: float = 5.0
+    # Upper bound for the in-process cache of serialized API responses; 0 disables it.
+    response_cache_bytes: int = 64 * 1024 * 1024
+    # max-age sent in Cache-Control; clients revalidate with If-None-Match after it expires.
+    response_max_age: int = 0
+    # Compress cached-route responses (gzip, or br with the brotli package) when Accept-Encoding allows.
+    response_compression: bool = True
+    # Bodies smaller than this are sent uncompressed.
+    compression_min_bytes: int = 1024
+    # Threads running dataset queries off the event loop; 0 means one per CPU.
+    query_workers: int = 0
+    # Worker processes for monthly/annual queries over many stations; 0 disables them (needs cache_dir).
+    query_processes: int = 0
+    # Smallest station selection split across the worker processes.
+    parallel_min_stations: int = 64
+    # Record request latencies and query-stage timings for /api/metrics.
+    metrics_enabled: bool = True
+    # Serialize array-backed JSON responses with orjson when it is installed.
+    fast_json: bool = True
 
     @classmethod
     def from_env(cls) -> "Settings":
         raw_env = os.getenv("APP_ENV", "development").lower()
         env = raw_env if raw_env in {"development", "test", "production"} else "development"
         csv_path = os.getenv("CSV_PATH", "data/temperature_data.csv")
-        return cls(env=env, csv_path=csv_path)
+        datasets_dir = os.getenv("DATASETS_DIR", "")
+        dataset_cache_bytes = int(os.getenv("DATASET_CACHE_BYTES", "0"))
+        cache_dir = os.getenv("CSV_CACHE_DIR", "")
+        stream_threshold_bytes = int(os.getenv("CSV_STREAM_THRESHOLD_BYTES", str(256 * 1024 * 1024)))
+        stream_chunk_rows = int(os.getenv("CSV_STREAM_CHUNK_ROWS", "200000"))
+        reload_interval = float(os.getenv("CSV_RELOAD_INTERVAL", "5"))
+        response_cache_bytes = int(os.getenv("RESPONSE_CACHE_BYTES", str(64 * 1024 * 1024)))
+        response_max_age = int(os.getenv("RESPONSE_MAX_AGE", "0"))
+        response_compression = os.getenv("RESPONSE_COMPRESSION", "1").lower() not in {"0", "false", "no", "off"}
+        compression_min_bytes = int(os.getenv("COMPRESSION_MIN_BYTES", "1024"))
+        query_workers = int(os.getenv("QUERY_WORKERS", "0"))
+        query_processes = int(os.getenv("QUERY_PROCESSES", "0"))
+        parallel_min_stations = int(os.getenv("PARALLEL_MIN_STATIONS", "64"))
+        metrics_enabled = os.getenv("METRICS_ENABLED", "1").lower() not in {"0", "false", "no", "off"}
+        fast_json = os.getenv("FAST_JSON", "1").lower() not in {"0", "false", "no", "off"}
+        return cls(
+            env=env,
+            csv_path=csv_path,
+            datasets_dir=datasets_dir,
+            dataset_cache_bytes=dataset_cache_bytes,
+            cache_dir=cache_dir,
+            stream_threshold_bytes=stream_threshold_bytes,
+            stream_chunk_rows=stream_chunk_rows,
+            reload_interval=reload_interval,
+            response_cache_bytes=response_cache_bytes,
+            response_max_age=response_max_age,
+            response_compression=response_compression,
+            compression_min_bytes=compression_min_bytes,
+            query_workers=query_workers,
+            query_processes=query_processes,
+            parallel_min_stations=parallel_min_stations,
+            metrics_enabled=metrics_enabled,
+            fast_json=fast_json,
+        )
 
 
 settings = Settings.from_env()
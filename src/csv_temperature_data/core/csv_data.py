@@ -1,13 +1,57 @@
 from __future__ import annotations
 
+import bisect
+import hashlib
+import io
+import itertools
+import logging
 import os
 import threading
-from typing import Iterable
-from typing import TYPE_CHECKING, Any
+import time
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from csv_temperature_data.core.bundle import BundleBuilder, read_bundle, write_bundle
+from csv_temperature_data.core.climatology import (
+    annual_anomalies,
+    monthly_normals,
+    pairwise_correlation,
+    rolling_mean_std,
+)
+from csv_temperature_data.core.config import settings
+from csv_temperature_data.core.downsample import downsample
+from csv_temperature_data.core.metrics import REGISTRY
+from csv_temperature_data.core.parallel import partition, process_pool, reset_process_pool
 
 if TYPE_CHECKING:
     import pandas as pd
 
+logger = logging.getLogger(__name__)
+
+_LOAD_SECONDS = REGISTRY.histogram(
+    "csv_dataset_load_seconds",
+    "Time to build a dataset snapshot, by source (append, bundle, stream or parse).",
+    ("mode",),
+)
+_LOOKUPS = REGISTRY.counter(
+    "csv_dataset_lookups_total",
+    "Dataset lookups, by whether the loaded snapshot was current (hit) or had to be (re)loaded (miss).",
+    ("result",),
+)
+_QUERY_SECONDS = REGISTRY.histogram(
+    "csv_query_stage_seconds",
+    "Time spent in each query stage: compute (array work) and format (building Python objects).",
+    ("query", "stage"),
+)
+_SLOTS_SCANNED = REGISTRY.counter(
+    "csv_query_station_years_scanned_total", "(station, year) slots read from the cube, by query.", ("query",)
+)
+_POINTS_EMITTED = REGISTRY.counter(
+    "csv_query_points_total", "Points (monthly values or annual means) returned, by query.", ("query",)
+)
 
 _MONTH_ORDER: list[tuple[str, int]] = [
     ("Jan", 1),
@@ -24,6 +68,22 @@ _MONTH_ORDER: list[tuple[str, int]] = [
     ("Dec", 12),
 ]
 _MONTH_NAMES = {name for name, _ in _MONTH_ORDER}
+_LAYOUTS = frozenset({"points", "columnar"})
+_RESOLUTIONS = frozenset({"monthly", "annual"})
+# Stations per block when deriving arrays from the cube, to bound the temporaries.
+_STATION_BLOCK = 512
+_CSV_OPTIONS: dict[str, object] = {
+    "sep": ";",
+    "encoding": "utf-8",
+    "engine": "c",
+    "dtype": {
+        "Station Number": "string",
+        "Year": "Int64",
+        **{name: "float32" for name, _ in _MONTH_ORDER},
+    },
+    "na_values": ["", "NA", "NaN", "null", "NULL"],
+    "keep_default_na": True,
+}
 
 
 def _sort_station_key(value: str):
@@ -33,90 +93,844 @@ def _sort_station_key(value: str):
         return (1, value)
 
 
+_Allocate = Callable[[str, tuple[int, ...], object], np.ndarray]
+
+
+def _allocate_in_memory(name: str, shape: tuple[int, ...], dtype: object) -> np.ndarray:
+    return np.zeros(shape, dtype=dtype)
+
+
+class _Aggregates:
+    """Per-(station, year) partial aggregates with prefix sums over the year axis.
+
+    ``prefix_*[s, b] - prefix_*[s, a]`` gives the count, sum and sum of
+    squares of station ``s`` over year slots ``[a, b)`` in O(1), for all
+    requested stations at once. Sums are taken over values shifted by the
+    station's overall mean, which keeps the sum-of-squares difference well
+    conditioned. Min/max are per (station, year) and are reduced over the
+    window (12x fewer than the raw cells).
+    """
+
+    __slots__ = ("shift", "prefix_count", "prefix_sum", "prefix_sumsq", "year_min", "year_max")
+
+    def __init__(
+        self,
+        *,
+        shift: np.ndarray,
+        prefix_count: np.ndarray,
+        prefix_sum: np.ndarray,
+        prefix_sumsq: np.ndarray,
+        year_min: np.ndarray,
+        year_max: np.ndarray,
+    ) -> None:
+        self.shift = shift
+        self.prefix_count = prefix_count
+        self.prefix_sum = prefix_sum
+        self.prefix_sumsq = prefix_sumsq
+        self.year_min = year_min
+        self.year_max = year_max
+
+    @classmethod
+    def build(cls, cube: np.ndarray, allocate: "_Allocate | None" = None) -> "_Aggregates":
+        """Compute the aggregates of ``cube`` a block of stations at a time.
+
+        ``allocate(name, shape, dtype)`` supplies the zero-filled output arrays
+        (e.g. memory maps of a bundle being built); defaults to ``np.zeros``.
+        """
+        if allocate is None:
+            allocate = _allocate_in_memory
+        n_stations, n_years, _ = cube.shape
+        shift = allocate("agg_shift", (n_stations,), np.float64)
+        prefix_count = allocate("agg_prefix_count", (n_stations, n_years + 1), np.int32)
+        prefix_sum = allocate("agg_prefix_sum", (n_stations, n_years + 1), np.float64)
+        prefix_sumsq = allocate("agg_prefix_sumsq", (n_stations, n_years + 1), np.float64)
+        year_min = allocate("agg_year_min", (n_stations, n_years), np.float32)
+        year_max = allocate("agg_year_max", (n_stations, n_years), np.float32)
+        year_min[...] = np.nan
+        year_max[...] = np.nan
+        if not cube.size or cube.shape[2] == 0:  # no rows, or a header without month columns
+            return cls(
+                shift=shift,
+                prefix_count=prefix_count,
+                prefix_sum=prefix_sum,
+                prefix_sumsq=prefix_sumsq,
+                year_min=year_min,
+                year_max=year_max,
+            )
+
+        for lo in range(0, n_stations, _STATION_BLOCK):
+            hi = min(lo + _STATION_BLOCK, n_stations)
+            block = cube[lo:hi]
+            finite = np.isfinite(block)
+            count = np.count_nonzero(finite, axis=2)
+            total = count.sum(axis=1)
+            raw_sum = np.where(finite, block, 0).sum(axis=(1, 2), dtype=np.float64)
+            np.divide(raw_sum, total, out=shift[lo:hi], where=total > 0)
+
+            centered = np.where(finite, block - shift[lo:hi, None, None], 0.0)
+            np.cumsum(count, axis=1, out=prefix_count[lo:hi, 1:])
+            np.cumsum(centered.sum(axis=2), axis=1, out=prefix_sum[lo:hi, 1:])
+            np.cumsum(np.square(centered).sum(axis=2), axis=1, out=prefix_sumsq[lo:hi, 1:])
+            masked = np.where(finite, block, np.float32(np.nan))
+            np.fmin.reduce(masked, axis=2, out=year_min[lo:hi])
+            np.fmax.reduce(masked, axis=2, out=year_max[lo:hi])
+
+        return cls(
+            shift=shift,
+            prefix_count=prefix_count,
+            prefix_sum=prefix_sum,
+            prefix_sumsq=prefix_sumsq,
+            year_min=year_min,
+            year_max=year_max,
+        )
+
+    def summary(self, positions: np.ndarray, a: int, b: int) -> dict[str, int | float | None]:
+        """Combine year slots ``[a, b)`` of stations ``positions``.
+
+        Each station yields ``(n, mean, M2)``; those are merged with Chan et
+        al.'s parallel variance formula.
+        """
+        n = self.prefix_count[positions, b] - self.prefix_count[positions, a]
+        keep = n > 0
+        if not keep.any():
+            return {"count": 0, "mean": None, "std": None, "min": None, "max": None}
+        positions, n = positions[keep], n[keep]
+
+        sums = self.prefix_sum[positions, b] - self.prefix_sum[positions, a]
+        sumsqs = self.prefix_sumsq[positions, b] - self.prefix_sumsq[positions, a]
+        means = self.shift[positions] + sums / n
+        m2s = np.maximum(sumsqs - sums * sums / n, 0.0)
+
+        total = int(n.sum())
+        mean = float((n * means).sum() / total)
+        m2 = float(m2s.sum() + (n * np.square(means - mean)).sum())
+        return {
+            "count": total,
+            "mean": mean,
+            "std": float(np.sqrt(m2 / total)),
+            "min": float(np.fmin.reduce(self.year_min[positions, a:b], axis=None)),
+            "max": float(np.fmax.reduce(self.year_max[positions, a:b], axis=None)),
+        }
+
+
+class _StationIndex:
+    """Per-station coverage and overall statistics, with a prefix-search index over the labels.
+
+    Columns are indexed by cube position: ``first_year`` / ``last_year``
+    (int64; both -1 for stations without data), ``valid_months`` (int64),
+    ``missing_ratio`` (share of the month cells between the first and last
+    year that are empty) and ``mean`` / ``min`` / ``max`` over the whole
+    record (float64, NaN without data). Everything comes from the
+    aggregates, so building it never touches the cube.
+    """
+
+    __slots__ = ("columns", "_labels", "_label_order")
+
+    def __init__(self, dataset: "_Dataset") -> None:
+        aggregates = dataset.aggregates
+        valid = aggregates.prefix_count[:, -1].astype(np.int64)
+        has_data = valid > 0
+        first_year = np.where(has_data, dataset.first_year, -1).astype(np.int64)
+        last_year = np.where(has_data, dataset.last_year, -1).astype(np.int64)
+        span = np.where(has_data, last_year - first_year + 1, 0) * len(dataset.month_cols)
+
+        missing_ratio = np.full(valid.shape, np.nan)
+        np.true_divide(span - valid, span, out=missing_ratio, where=has_data)
+        mean = np.full(valid.shape, np.nan)
+        np.true_divide(aggregates.prefix_sum[:, -1], valid, out=mean, where=has_data)
+        mean += aggregates.shift
+        if aggregates.year_min.shape[1]:
+            low = np.fmin.reduce(aggregates.year_min, axis=1).astype(np.float64)
+            high = np.fmax.reduce(aggregates.year_max, axis=1).astype(np.float64)
+        else:
+            low = np.full(valid.shape, np.nan)
+            high = low.copy()
+
+        self.columns: dict[str, np.ndarray] = {
+            "first_year": first_year,
+            "last_year": last_year,
+            "valid_months": valid,
+            "missing_ratio": missing_ratio,
+            "mean": mean,
+            "min": low,
+            "max": high,
+        }
+        order = sorted(range(len(dataset.stations)), key=dataset.stations.__getitem__)
+        self._labels = [dataset.stations[i] for i in order]
+        self._label_order = np.array(order, dtype=np.int64)
+
+    def matching(self, prefix: str) -> np.ndarray:
+        """Cube positions (ascending, i.e. station order) of the stations whose label starts with ``prefix``."""
+        lo = bisect.bisect_left(self._labels, prefix)
+        hi = bisect.bisect_right(self._labels, prefix, lo=lo, key=lambda label: label[: len(prefix)])
+        return np.sort(self._label_order[lo:hi])
+
+
+class _Dataset:
+    """Parsed CSV packed into a dense ``(station, year, month)`` float32 cube.
+
+    Stations are integer positions along the first axis (in
+    ``_sort_station_key`` order); year ``y`` is slot ``y - year0`` along the
+    second; NaN marks missing months and absent (station, year) rows. A
+    station + year window is therefore plain index arithmetic, and the 12
+    months of a (station, year) are adjacent in memory. ``first_year`` /
+    ``last_year`` (int16) bound each station's years with data; for stations
+    without any, ``first_year > last_year``. Rows without a station or a year
+    are dropped, and a (station, year) repeated in the file keeps its last row.
+    """
+
+    __slots__ = (
+        "month_cols",
+        "months",
+        "stations",
+        "stations_set",
+        "year0",
+        "cube",
+        "first_year",
+        "last_year",
+        "aggregates",
+        "_positions",
+        "_station_index",
+    )
+
+    def __init__(
+        self,
+        *,
+        month_cols: list[str],
+        stations: list[str],
+        year0: int,
+        cube: np.ndarray,
+        first_year: np.ndarray | None = None,
+        last_year: np.ndarray | None = None,
+        aggregates: _Aggregates | None = None,
+    ) -> None:
+        self.month_cols = month_cols
+        self.months = np.array([dict(_MONTH_ORDER)[name] for name in month_cols], dtype=np.int64)
+        self.stations = stations
+        self.stations_set = frozenset(stations)
+        self.year0 = year0
+        self.cube = cube
+        if first_year is None or last_year is None:
+            first_year, last_year = self._coverage(cube, year0)
+        self.first_year = first_year
+        self.last_year = last_year
+        self.aggregates = aggregates if aggregates is not None else _Aggregates.build(cube)
+        self._positions = {station: i for i, station in enumerate(stations)}
+        self._station_index: _StationIndex | None = None
+
+    @staticmethod
+    def _coverage(cube: np.ndarray, year0: int) -> tuple[np.ndarray, np.ndarray]:
+        """First and last year with data per station, computed a block of stations at a time."""
+        n_stations, n_years, _ = cube.shape
+        first_year = np.full(n_stations, year0, dtype=np.int16)
+        last_year = np.full(n_stations, year0 - 1, dtype=np.int16)
+        for lo in range(0, n_stations, _STATION_BLOCK):
+            hi = min(lo + _STATION_BLOCK, n_stations)
+            has_data = np.isfinite(cube[lo:hi]).any(axis=2)
+            found = has_data.any(axis=1)
+            first_year[lo:hi][found] = year0 + has_data[found].argmax(axis=1)
+            last_year[lo:hi][found] = year0 + n_years - 1 - has_data[found, ::-1].argmax(axis=1)
+        return first_year, last_year
+
+    @staticmethod
+    def _frame_rows(
+        df: "pd.DataFrame", month_cols: list[str]
+    ) -> tuple[list[str], np.ndarray, np.ndarray, np.ndarray]:
+        """Return ``(labels, codes, years, values)`` for the frame rows that have a station and a year."""
+        try:
+            import pandas as pd
+        except ModuleNotFoundError as e:
+            raise RuntimeError("pandas is required. Install requirements.txt.") from e
+
+        if "Station Number" not in df.columns or "Year" not in df.columns:
+            return (
+                [],
+                np.empty(0, dtype=np.int64),
+                np.empty(0, dtype=np.int16),
+                np.empty((0, len(month_cols)), dtype=np.float32),
+            )
+
+        df = df[df["Station Number"].notna() & df["Year"].notna()]
+        codes, uniques = pd.factorize(df["Station Number"].astype(str), sort=False)
+        return (
+            [str(u) for u in uniques],
+            codes.astype(np.int64, copy=False),
+            df["Year"].to_numpy(dtype=np.int16),
+            df[month_cols].to_numpy(dtype=np.float32),
+        )
+
+    @classmethod
+    def _from_rows(
+        cls,
+        month_cols: list[str],
+        labels: list[str],
+        codes: np.ndarray,
+        years: np.ndarray,
+        values: np.ndarray,
+        *,
+        base: "_Dataset | None" = None,
+    ) -> "_Dataset":
+        """Scatter rows (``codes`` index into ``labels``) into a new cube.
+
+        With ``base``, its stations must be ``labels[:len(base.stations)]``; its
+        cube is copied in first and the rows then overwrite matching cells.
+        """
+        order = sorted(range(len(labels)), key=lambda i: _sort_station_key(labels[i]))
+        rank = np.empty(len(labels), dtype=np.int64)
+        rank[order] = np.arange(len(labels), dtype=np.int64)
+
+        bounds = [int(years.min()), int(years.max())] if years.size else []
+        if base is not None and base.cube.shape[1]:
+            bounds += [base.year0, base.year0 + base.cube.shape[1] - 1]
+        year0 = min(bounds) if bounds else 0
+        n_years = max(bounds) - year0 + 1 if bounds else 0
+
+        cube = np.full((len(labels), n_years, len(month_cols)), np.nan, dtype=np.float32)
+        if base is not None and base.cube.size:
+            start = base.year0 - year0
+            cube[rank[: len(base.stations)], start : start + base.cube.shape[1]] = base.cube
+
+        cls._scatter(cube, year0, rank[codes], years, values)
+        return cls(month_cols=month_cols, stations=[labels[i] for i in order], year0=year0, cube=cube)
+
+    @staticmethod
+    def _scatter(
+        cube: np.ndarray, year0: int, positions: np.ndarray, years: np.ndarray, values: np.ndarray
+    ) -> None:
+        """Write rows into ``cube`` at (station position, year); the last of any repeated cell wins."""
+        if not years.size or cube.shape[2] == 0:  # nothing to write, or a header without month columns
+            return
+        n_years = cube.shape[1]
+        cell = positions * n_years + (years.astype(np.int64) - year0)
+        _, last = np.unique(cell[::-1], return_index=True)
+        rows = cell.shape[0] - 1 - last
+        cube.reshape(-1, cube.shape[2])[cell[rows]] = values[rows]
+
+    @classmethod
+    def from_frame(cls, df: "pd.DataFrame", month_cols: list[str]) -> "_Dataset":
+        return cls._from_rows(month_cols, *cls._frame_rows(df, month_cols))
+
+    def extend(self, df: "pd.DataFrame") -> "_Dataset":
+        """Return a new dataset with the rows of ``df`` (parsed with the same header) added."""
+        new_labels, new_codes, new_years, new_values = self._frame_rows(df, self.month_cols)
+        labels = list(self.stations)
+        positions = dict(self._positions)
+        remap = np.empty(len(new_labels), dtype=np.int64)
+        for i, label in enumerate(new_labels):
+            if label not in positions:
+                positions[label] = len(labels)
+                labels.append(label)
+            remap[i] = positions[label]
+
+        return self._from_rows(self.month_cols, labels, remap[new_codes], new_years, new_values, base=self)
+
+    @property
+    def nbytes(self) -> int:
+        _, arrays = self.to_arrays()
+        return sum(int(array.nbytes) for array in arrays.values())
+
+    def to_arrays(self) -> tuple[dict[str, object], dict[str, np.ndarray]]:
+        """Split into JSON-able metadata and named arrays (the on-disk bundle layout)."""
+        meta = {"month_cols": self.month_cols, "stations": self.stations, "year0": self.year0}
+        arrays = {"cube": self.cube, "first_year": self.first_year, "last_year": self.last_year}
+        arrays.update({f"agg_{name}": getattr(self.aggregates, name) for name in _Aggregates.__slots__})
+        return meta, arrays
+
+    @classmethod
+    def from_arrays(cls, meta: dict[str, object], arrays: dict[str, np.ndarray]) -> "_Dataset":
+        aggregates = _Aggregates(**{name: arrays[f"agg_{name}"] for name in _Aggregates.__slots__})
+        return cls(
+            month_cols=list(meta["month_cols"]),
+            stations=list(meta["stations"]),
+            year0=int(meta["year0"]),
+            cube=arrays["cube"],
+            first_year=arrays["first_year"],
+            last_year=arrays["last_year"],
+            aggregates=aggregates,
+        )
+
+    def station_index(self) -> _StationIndex:
+        """The per-station table, built on first use (a snapshot never changes, so once per version)."""
+        if self._station_index is None:
+            self._station_index = _StationIndex(self)
+        return self._station_index
+
+    def position(self, station: str) -> int | None:
+        return self._positions.get(station)
+
+    def positions(self, stations: Iterable[str]) -> np.ndarray:
+        """Cube positions of the known ``stations``, in the given order (unknown ones are skipped)."""
+        found = [self._positions.get(station) for station in stations]
+        return np.array([pos for pos in found if pos is not None], dtype=np.int64)
+
+    def year_slots(self, start_year: int | None, end_year: int | None) -> tuple[int, int]:
+        """Return the ``[a, b)`` year slots of the inclusive year window, clipped to the cube."""
+        n_years = self.cube.shape[1]
+        a = 0 if start_year is None else min(max(start_year - self.year0, 0), n_years)
+        b = n_years if end_year is None else min(max(end_year - self.year0 + 1, 0), n_years)
+        return a, max(a, b)
+
+    def block(self, pos: int | None, a: int, b: int) -> np.ndarray:
+        """Station ``pos``'s ``(year, month)`` view over year slots ``[a, b)``; empty if ``pos`` is None."""
+        if pos is None:
+            return np.empty((0, len(self.month_cols)), dtype=np.float32)
+        return self.cube[pos, a:b]
+
+    def station_slots(self, pos: int | None, start_year: int | None, end_year: int | None) -> tuple[int, int]:
+        """Like ``year_slots``, further clipped to the years where station ``pos`` has data."""
+        if pos is None:
+            return 0, 0
+        a, b = self.year_slots(start_year, end_year)
+        a = max(a, int(self.first_year[pos]) - self.year0)
+        b = min(b, int(self.last_year[pos]) - self.year0 + 1)
+        return a, max(a, b)
+
+
+class _SourceState:
+    """Where the last parse of a CSV ended, for detecting pure appends.
+
+    ``offset`` is the number of bytes parsed; the hashes cover the header line
+    and the last parsed line (``[tail_start, offset)``). If both still match
+    and the file only grew, just the bytes after ``offset`` need parsing.
+    """
+
+    __slots__ = ("offset", "header_hash", "tail_start", "tail_hash")
+
+    _TAIL_SCAN = 1 << 16
+
+    def __init__(self, offset: int, header_hash: bytes, tail_start: int, tail_hash: bytes) -> None:
+        self.offset = offset
+        self.header_hash = header_hash
+        self.tail_start = tail_start
+        self.tail_hash = tail_hash
+
+    @classmethod
+    def scan(cls, csv_path: str, size: int) -> "_SourceState | None":
+        """State for the first ``size`` bytes of ``csv_path``; None if they don't end in a complete line."""
+        with open(csv_path, "rb") as f:
+            header = f.readline()
+            if not header.endswith(b"\n") or len(header) > size:
+                return None
+            window = min(size, cls._TAIL_SCAN)
+            f.seek(size - window)
+            data = f.read(window)
+        if len(data) != window or not data.endswith(b"\n"):
+            return None
+        start = data.rfind(b"\n", 0, len(data) - 1) + 1
+        if start == 0 and window < size:
+            return None  # last line longer than the scan window
+        return cls(size, hashlib.sha1(header).digest(), size - window + start, hashlib.sha1(data[start:]).digest())
+
+    def appended_bytes(self, csv_path: str, size: int) -> tuple[bytes, bytes] | None:
+        """Return ``(header, new_bytes)`` if the file only grew past ``offset``, else None."""
+        if size <= self.offset:
+            return None
+        with open(csv_path, "rb") as f:
+            header = f.readline()
+            if hashlib.sha1(header).digest() != self.header_hash:
+                return None
+            f.seek(self.tail_start)
+            if hashlib.sha1(f.read(self.offset - self.tail_start)).digest() != self.tail_hash:
+                return None
+            appended = f.read(size - self.offset)
+        if len(appended) != size - self.offset:
+            return None
+        return header, appended
+
+
 class _CsvStore:
+    """Caches one ``_Dataset`` snapshot per CSV path.
+
+    Unwatched paths are stat-ed on every ``get`` and reloaded when their mtime
+    or size changes. Watched paths (see ``preload``) skip the stat entirely:
+    ``refresh`` (run by the background reloader) builds the new snapshot off
+    the request path and swaps it in with a single dict assignment, so readers
+    never wait on a reload. When a file has only been appended to, a reload
+    parses just the new lines and merges them into the previous snapshot.
+    """
+
     def __init__(self) -> None:
         self._lock = threading.Lock()
-        self._cache: dict[str, tuple[int, int, Any, list[str], frozenset[str]]] = {}
+        self._cache: dict[str, tuple[int, int, _Dataset, _SourceState | None]] = {}
+        self._watched: set[str] = set()
+        self._last_used: dict[str, int] = {}
+        self._ticks = itertools.count()
+
+    def get(self, csv_path: str) -> _Dataset:
+        return self._entry(csv_path)[2]
+
+    def snapshot(self, csv_path: str) -> tuple[int, int, _Dataset]:
+        """``(mtime_ns, size, dataset)``: the dataset ``get`` returns with the CSV version it was loaded from."""
+        mtime_ns, size, dataset, _ = self._entry(csv_path)
+        return mtime_ns, size, dataset
+
+    def _entry(self, csv_path: str) -> tuple[int, int, _Dataset, _SourceState | None]:
+        self._last_used[csv_path] = next(self._ticks)
+        cached = self._cache.get(csv_path)
+        if cached is not None and csv_path in self._watched:
+            _LOOKUPS.inc("hit")
+            return cached
 
-    def get(self, csv_path: str) -> tuple["pd.DataFrame", list[str], frozenset[str]]:
         stat = os.stat(csv_path)  # raises FileNotFoundError
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            _LOOKUPS.inc("hit")
+            return cached
+
+        _LOOKUPS.inc("miss")
         with self._lock:
-            cached = self._cache.get(csv_path)
-            if cached is not None:
-                mtime_ns, size, df, month_cols, stations_set = cached
-                if mtime_ns == stat.st_mtime_ns and size == stat.st_size:
-                    return df, month_cols, stations_set
+            return self._reload(csv_path, stat)
+
+    def version(self, csv_path: str) -> str:
+        """Opaque identifier of the snapshot ``get`` currently returns for ``csv_path``."""
+        mtime_ns, size = self._entry(csv_path)[:2]
+        return f"{mtime_ns:x}-{size:x}"
 
-            df, month_cols, stations_set = self._load(csv_path)
-            self._cache[csv_path] = (stat.st_mtime_ns, stat.st_size, df, month_cols, stations_set)
-            return df, month_cols, stations_set
+    def watch(self, csv_path: str) -> None:
+        self._watched.add(csv_path)
+
+    def watched(self) -> list[str]:
+        return list(self._watched)
+
+    def footprint(self) -> dict[str, int]:
+        """Bytes held by each loaded snapshot (memory-mapped arrays included), by CSV path."""
+        return {path: entry[2].nbytes for path, entry in list(self._cache.items())}
+
+    def refresh(self, csv_path: str) -> bool:
+        """Reload ``csv_path`` if it changed on disk; return True if a new snapshot was swapped in."""
+        stat = os.stat(csv_path)  # raises FileNotFoundError
+        cached = self._cache.get(csv_path)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return False
+        self._reload(csv_path, stat)
+        return True
+
+    def _reload(self, csv_path: str, stat: os.stat_result) -> tuple[int, int, _Dataset, _SourceState | None]:
+        mtime_ns, size = stat.st_mtime_ns, stat.st_size
+        cached = self._cache.get(csv_path)
+        if cached is not None and cached[0] == mtime_ns and cached[1] == size:
+            return cached
+
+        start = time.perf_counter()
+        dataset, mode = None, "append"
+        # Merging an append materializes the whole cube in memory, which streamed files must avoid.
+        if cached is not None and cached[3] is not None and not self._streams(size):
+            dataset = self._load_appended(csv_path, cached[2], cached[3], mtime_ns, size)
+        if dataset is None:
+            dataset, mode = self._load_cached(csv_path, mtime_ns, size)
+        _LOAD_SECONDS.observe(time.perf_counter() - start, mode)
+
+        # Only trust the parse position if the file did not move while we parsed it.
+        after = os.stat(csv_path)
+        unchanged = after.st_mtime_ns == mtime_ns and after.st_size == size
+        source = _SourceState.scan(csv_path, size) if unchanged else None
+        entry = (mtime_ns, size, dataset, source)
+        self._cache[csv_path] = entry
+        self._evict(keep=csv_path)
+        return entry
+
+    def _evict(self, keep: str) -> None:
+        """Drop least recently used snapshots until the total fits ``settings.dataset_cache_bytes``.
+
+        Watched paths and ``keep`` (the snapshot just loaded) are never evicted.
+        """
+        budget = settings.dataset_cache_bytes
+        if budget <= 0:
+            return
+        sizes = self.footprint()
+        total = sum(sizes.values())
+        candidates = sorted(
+            (path for path in sizes if path != keep and path not in self._watched),
+            key=lambda path: self._last_used.get(path, -1),
+        )
+        for path in candidates:
+            if total <= budget:
+                break
+            self._cache.pop(path, None)
+            self._last_used.pop(path, None)
+            total -= sizes[path]
+
+    def _load_appended(
+        self, csv_path: str, previous: _Dataset, source: _SourceState, mtime_ns: int, size: int
+    ) -> _Dataset | None:
+        appended = source.appended_bytes(csv_path, size)
+        if appended is None:
+            return None
+        header, new_bytes = appended
+        df, month_cols = self._parse(io.BytesIO(header + new_bytes))
+        if month_cols != previous.month_cols:
+            return None
+        dataset = previous.extend(df)
+        self._store_bundle(csv_path, mtime_ns, size, dataset)
+        return dataset
+
+    def _load_cached(self, csv_path: str, mtime_ns: int, size: int) -> tuple[_Dataset, str]:
+        """Load from the on-disk bundle for this CSV version if there is one, else parse and write it.
+
+        Returns the dataset and how it was obtained (``bundle``, ``stream`` or ``parse``).
+        """
+        if settings.cache_dir:
+            bundle = read_bundle(settings.cache_dir, csv_path, mtime_ns, size)
+            if bundle is not None:
+                return _Dataset.from_arrays(*bundle), "bundle"
+            if self._streams(size):
+                dataset = self._load_streamed(csv_path, mtime_ns, size)
+                if dataset is not None:
+                    return dataset, "stream"
+
+        dataset = self._load(csv_path)
+        self._store_bundle(csv_path, mtime_ns, size, dataset)
+        return dataset, "parse"
+
+    @staticmethod
+    def _store_bundle(csv_path: str, mtime_ns: int, size: int, dataset: _Dataset) -> None:
+        if settings.cache_dir:
+            meta, arrays = dataset.to_arrays()
+            write_bundle(settings.cache_dir, csv_path, mtime_ns, size, meta, arrays)
 
     @staticmethod
-    def _load(csv_path: str) -> tuple["pd.DataFrame", list[str], frozenset[str]]:
+    def _streams(size: int) -> bool:
+        return bool(settings.cache_dir) and size >= settings.stream_threshold_bytes
+
+    def _load_streamed(self, csv_path: str, mtime_ns: int, size: int) -> _Dataset | None:
+        """Build the bundle for this CSV version chunk by chunk, then map it.
+
+        The first pass reads only the station and year columns to size the
+        cube; the second scatters each chunk of rows straight into the
+        memory-mapped cube file. Peak memory is one chunk plus a block of
+        stations while the aggregates are derived. Returns None if the bundle
+        cannot be written.
+        """
+        chunk_rows = settings.stream_chunk_rows
+        labels: dict[str, None] = {}
+        year_lo = year_hi = None
+        for df, _ in self._parse_chunks(csv_path, chunk_rows, columns=("Station Number", "Year")):
+            chunk_labels, _, years, _ = _Dataset._frame_rows(df, [])
+            labels.update(dict.fromkeys(chunk_labels))
+            if years.size:
+                lo, hi = int(years.min()), int(years.max())
+                year_lo = lo if year_lo is None else min(year_lo, lo)
+                year_hi = hi if year_hi is None else max(year_hi, hi)
+
+        stations = sorted(labels, key=_sort_station_key)
+        positions = {station: i for i, station in enumerate(stations)}
+        year0 = year_lo if year_lo is not None else 0
+        n_years = year_hi - year_lo + 1 if year_lo is not None else 0
+
+        try:
+            builder = BundleBuilder(settings.cache_dir, csv_path, mtime_ns, size)
+        except OSError as e:
+            logger.warning("Could not stream %s into the dataset cache: %s", csv_path, e)
+            return None
+        try:
+            month_cols = None
+            cube = None
+            for df, chunk_month_cols in self._parse_chunks(csv_path, chunk_rows):
+                if cube is None:
+                    month_cols = chunk_month_cols
+                    cube = builder.allocate("cube", (len(stations), n_years, len(month_cols)), np.float32)
+                    cube[...] = np.nan
+                chunk_labels, codes, years, values = _Dataset._frame_rows(df, month_cols)
+                # Rows that were not there during the first pass (the file changed) are left out.
+                remap = np.array([positions.get(label, -1) for label in chunk_labels], dtype=np.int64)
+                rows = remap[codes]
+                keep = (rows >= 0) & (years >= year0) & (years < year0 + n_years)
+                _Dataset._scatter(cube, year0, rows[keep], years[keep], values[keep])
+
+            if cube is None:
+                builder.abort()
+                return None
+            dataset = _Dataset(
+                month_cols=month_cols,
+                stations=stations,
+                year0=year0,
+                cube=cube,
+                aggregates=_Aggregates.build(cube, builder.allocate),
+            )
+            builder.commit(*dataset.to_arrays())
+        except OSError as e:
+            builder.abort()
+            logger.warning("Could not stream %s into the dataset cache: %s", csv_path, e)
+            return None
+        except BaseException:
+            builder.abort()
+            raise
+
+        bundle = read_bundle(settings.cache_dir, csv_path, mtime_ns, size)
+        return _Dataset.from_arrays(*bundle) if bundle is not None else None
+
+    @classmethod
+    def _load(cls, csv_path: str) -> _Dataset:
+        return _Dataset.from_frame(*cls._parse(csv_path))
+
+    @staticmethod
+    def _parse_chunks(
+        csv_path: str, chunk_rows: int, columns: tuple[str, ...] | None = None
+    ) -> Iterator[tuple["pd.DataFrame", list[str]]]:
+        """Like ``_parse`` but yields ``chunk_rows`` rows at a time, optionally reading only ``columns``."""
         try:
             import pandas as pd
         except ModuleNotFoundError as e:
             raise RuntimeError("pandas is required. Install requirements.txt.") from e
 
-        df = pd.read_csv(
-            csv_path,
-            sep=";",
-            encoding="utf-8",
-            engine="c",
-            dtype={
-                "Station Number": "string",
-                "Year": "Int64",
-                "Jan": "float32",
-                "Feb": "float32",
-                "Mar": "float32",
-                "Apr": "float32",
-                "May": "float32",
-                "Jun": "float32",
-                "Jul": "float32",
-                "Aug": "float32",
-                "Sep": "float32",
-                "Oct": "float32",
-                "Nov": "float32",
-                "Dec": "float32",
-            },
-            na_values=["", "NA", "NaN", "null", "NULL"],
-            keep_default_na=True,
-        )
+        usecols = None if columns is None else (lambda name: name.strip() in columns)
+        with pd.read_csv(csv_path, chunksize=chunk_rows, usecols=usecols, **_CSV_OPTIONS) as reader:
+            for df in reader:
+                df = df.rename(columns={c: c.strip() for c in df.columns})
+                yield df, [name for name, _ in _MONTH_ORDER if name in df.columns]
+
+    @staticmethod
+    def _parse(source: "str | io.BytesIO") -> tuple["pd.DataFrame", list[str]]:
+        try:
+            import pandas as pd
+        except ModuleNotFoundError as e:
+            raise RuntimeError("pandas is required. Install requirements.txt.") from e
+
+        df = pd.read_csv(source, **_CSV_OPTIONS)
         df = df.rename(columns={c: c.strip() for c in df.columns})
         month_cols = [name for name, _ in _MONTH_ORDER if name in df.columns]
-        stations_col = df.get("Station Number")
-        if stations_col is None:
-            stations_set: frozenset[str] = frozenset()
-        else:
-            stations_set = frozenset(stations_col.dropna().astype(str).tolist())
-        return df, month_cols, stations_set
+        return df, month_cols
 
 
 _STORE = _CsvStore()
 
+REGISTRY.gauge(
+    "csv_dataset_bytes",
+    "Memory held by each loaded dataset snapshot, memory-mapped arrays included.",
+    ("csv_path",),
+    lambda: {(path,): size for path, size in _STORE.footprint().items()},
+)
+REGISTRY.gauge(
+    "csv_dataset_cache_budget_bytes",
+    "Configured budget for loaded datasets (0 = unbounded).",
+    (),
+    lambda: {(): settings.dataset_cache_bytes},
+)
+
+
+class _Reloader(threading.Thread):
+    """Daemon thread polling the watched CSV files and refreshing their snapshots."""
+
+    def __init__(self, store: _CsvStore, interval: float) -> None:
+        super().__init__(name="csv-reloader", daemon=True)
+        self._store = store
+        self._interval = interval
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self._interval):
+            for csv_path in self._store.watched():
+                try:
+                    self._store.refresh(csv_path)
+                except FileNotFoundError:
+                    logger.warning("CSV file disappeared, keeping the last loaded snapshot: %s", csv_path)
+                except Exception:
+                    logger.exception("Reloading %s failed, keeping the last loaded snapshot", csv_path)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+
+_RELOADER: _Reloader | None = None
+
+
+def preload(csv_path: str, *, watch: bool = True) -> None:
+    """Load ``csv_path`` now; with ``watch``, requests stop stat-ing it and rely on the reloader instead."""
+    try:
+        _STORE.refresh(csv_path)
+    except FileNotFoundError:
+        logger.warning("CSV file not found at startup: %s", csv_path)
+    if watch:
+        _STORE.watch(csv_path)
+
+
+def start_reloader(interval: float) -> None:
+    global _RELOADER
+    if _RELOADER is None:
+        _RELOADER = _Reloader(_STORE, interval)
+        _RELOADER.start()
+
+
+def stop_reloader() -> None:
+    global _RELOADER
+    if _RELOADER is not None:
+        _RELOADER.stop()
+        _RELOADER = None
+
+
+def normalize_stations(stations: Iterable[str]) -> tuple[str, ...]:
+    return tuple(sorted({s.strip() for s in stations if s and s.strip()}, key=_sort_station_key))
+
+
+def dataset_version(csv_path: str) -> str:
+    """Changes whenever the data served for ``csv_path`` changes; use it to key derived caches."""
+    return _STORE.version(csv_path)
+
+
+def dataset_cache_info() -> dict[str, object]:
+    """Memory held by loaded datasets, per CSV path, against ``settings.dataset_cache_bytes``."""
+    sizes = _STORE.footprint()
+    return {"max_bytes": settings.dataset_cache_bytes, "total_bytes": sum(sizes.values()), "datasets": sizes}
+
 
 def unique_stations(csv_path: str) -> list[str]:
-    _, _, stations_set = _STORE.get(csv_path)
-    values = list(stations_set)
-    values.sort(key=_sort_station_key)
-    return values
+    return list(_STORE.get(csv_path).stations)
 
 
 def station_set(csv_path: str) -> frozenset[str]:
-    _, _, stations_set = _STORE.get(csv_path)
-    return stations_set
+    return _STORE.get(csv_path).stations_set
 
 
 def data_year_range(csv_path: str) -> dict[str, int | None]:
-    df, _, _ = _STORE.get(csv_path)
-    years = df.get("Year")
-    if years is None:
-        return {"min_year": None, "max_year": None}
-    cleaned = years.dropna()
-    if cleaned.empty:
+    dataset = _STORE.get(csv_path)
+    if dataset.cube.shape[1] == 0:
         return {"min_year": None, "max_year": None}
-    vals = cleaned.astype(int, copy=False).to_numpy(copy=False)
-    return {"min_year": int(vals.min()), "max_year": int(vals.max())}
+    return {"min_year": dataset.year0, "max_year": dataset.year0 + dataset.cube.shape[1] - 1}
+
+
+def station_metadata(
+    csv_path: str,
+    *,
+    prefix: str | None = None,
+    offset: int = 0,
+    limit: int | None = None,
+    layout: str = "points",
+) -> dict[str, object]:
+    """Coverage and overall statistics of each station, a page at a time.
+
+    Stations come in ``/api/stations`` order, restricted to labels starting
+    with ``prefix``; ``count`` is the number of matches and the page holds
+    ``limit`` (all by default) of them from ``offset``. Per station:
+    ``first_year``, ``last_year``, ``valid_months``, ``missing_ratio`` (empty
+    months between the first and last year over all of them) and the
+    ``mean`` / ``min`` / ``max`` of the whole record; stations without data
+    have 0 valid months and None for the rest. ``columnar`` returns one list
+    per field instead of one object per station.
+    """
+    _check_layout(layout)
+    dataset = _STORE.get(csv_path)
+    with _QUERY_SECONDS.time("stations", "compute"):
+        index = dataset.station_index()
+        if prefix:
+            matches = index.matching(prefix)
+        else:
+            matches = np.arange(len(dataset.stations), dtype=np.int64)
+        page = matches[offset : None if limit is None else offset + limit]
+        has_data = (index.columns["valid_months"][page] > 0).tolist()
+
+    with _QUERY_SECONDS.time("stations", "format"):
+        columns: dict[str, list] = {"station": [dataset.stations[pos] for pos in page.tolist()]}
+        for name, values in index.columns.items():
+            column = values[page].tolist()
+            if name != "valid_months":
+                column = [value if ok else None for value, ok in zip(column, has_data)]
+            columns[name] = column
+        out: dict[str, object] = {"count": int(matches.size), "offset": offset, "limit": limit}
+        if layout == "columnar":
+            out["stations"] = columns
+        else:
+            out["stations"] = [dict(zip(columns, row)) for row in zip(*columns.values())]
+        return out
 
 
 def analytics_summary(
@@ -126,36 +940,194 @@ def analytics_summary(
     start_year: int | None = None,
     end_year: int | None = None,
 ) -> dict[str, int | float | None]:
-    df, month_cols, _ = _STORE.get(csv_path)
-    station_list = [s.strip() for s in stations if s and s.strip()]
-    if not station_list or not month_cols:
+    dataset = _STORE.get(csv_path)
+    stations_key = normalize_stations(stations)
+    if not stations_key or not dataset.month_cols:
         return {"count": 0, "mean": None, "std": None, "min": None, "max": None}
 
-    mask = df["Station Number"].isin(station_list)
-    if start_year is not None:
-        mask &= df["Year"] >= start_year
-    if end_year is not None:
-        mask &= df["Year"] <= end_year
+    with _QUERY_SECONDS.time("summary", "compute"):
+        positions = dataset.positions(stations_key)
+        if not positions.size:
+            return {"count": 0, "mean": None, "std": None, "min": None, "max": None}
+        a, b = dataset.year_slots(start_year, end_year)
+        _SLOTS_SCANNED.inc("summary", amount=positions.size * (b - a))
+        return dataset.aggregates.summary(positions, a, b)
+
+
+def _slot_years(dataset: _Dataset, a: int, slots: np.ndarray) -> np.ndarray:
+    return slots.astype(np.int64) + (dataset.year0 + a)
+
+
+def _monthly_arrays(
+    dataset: _Dataset, pos: int | None, a: int, b: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return ``(years, months, values)`` of station ``pos``'s finite cells in year slots ``[a, b)``, year-major."""
+    block = dataset.block(pos, a, b)
+    rows, cols = np.isfinite(block).nonzero()
+    return _slot_years(dataset, a, rows), dataset.months[cols], block[rows, cols]
+
+
+def _month_sums(block: np.ndarray) -> np.ndarray:
+    """Sum each row across months, left to right.
+
+    That is the order ``np.nansum`` accumulates in over the column-major
+    frame values, so float32 results stay bit-identical to it.
+    """
+    total = block[:, 0].copy()
+    for col_i in range(1, block.shape[1]):
+        total += block[:, col_i]
+    return total
+
+
+def _annual_arrays(
+    dataset: _Dataset, pos: int | None, a: int, b: int, *, include_std: bool
+) -> tuple[np.ndarray, np.ndarray, np.ndarray | None]:
+    """Return ``(years, means, stds)`` of station ``pos``'s years in slots ``[a, b)`` with a finite annual mean.
+
+    Follows ``np.nanmean``/``np.nanstd(ddof=0)`` step by step (same float32
+    accumulation order, so results are bit-identical) but skips the division
+    for years without values instead of warning.
+    """
+    block = dataset.block(pos, a, b)
+    missing = np.isnan(block)
+    counts = block.shape[1] - np.count_nonzero(missing, axis=1)
+    has_values = counts > 0
+    filled = block.copy()
+    np.copyto(filled, 0, where=missing)
+
+    means = np.full(block.shape[0], np.nan, dtype=block.dtype)
+    np.true_divide(_month_sums(filled), counts, out=means, where=has_values, casting="unsafe")
+    keep = np.isfinite(means)
+
+    stds = None
+    if include_std:
+        np.subtract(filled, means[:, None], out=filled)
+        np.copyto(filled, 0, where=missing)
+        np.multiply(filled, filled, out=filled)
+        stds = np.full(block.shape[0], np.nan, dtype=block.dtype)
+        np.true_divide(_month_sums(filled), counts, out=stds, where=has_values, casting="unsafe")
+        np.sqrt(stds, out=stds)
+        stds = stds[keep]
+
+    return _slot_years(dataset, a, np.flatnonzero(keep)), means[keep], stds
+
+
+def _monthly_series(
+    dataset: _Dataset, pos: int | None, a: int, b: int, max_points: int | None, downsample_method: str
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    years, months, values = _monthly_arrays(dataset, pos, a, b)
+    keep = downsample(years + (months - 1) / 12.0, values, max_points, downsample_method)
+    if keep is not None:
+        years, months, values = years[keep], months[keep], values[keep]
+    return years, months, values
+
+
+def _annual_series(
+    dataset: _Dataset,
+    pos: int | None,
+    a: int,
+    b: int,
+    include_std: bool,
+    max_points: int | None,
+    downsample_method: str,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray | None]:
+    years, means, stds = _annual_arrays(dataset, pos, a, b, include_std=include_std)
+    keep = downsample(years, means, max_points, downsample_method)
+    if keep is not None:
+        years, means = years[keep], means[keep]
+        stds = stds[keep] if stds is not None else None
+    return years, means, stds
+
+
+def _station_slots(
+    dataset: _Dataset, stations: Sequence[str], start_year: int | None, end_year: int | None
+) -> list[tuple[int | None, int, int]]:
+    """``(position, a, b)`` per station: its cube position and year slots within the window."""
+    out = []
+    for station in stations:
+        pos = dataset.position(station)
+        out.append((pos, *dataset.station_slots(pos, start_year, end_year)))
+    return out
+
+
+# Per-process snapshots mapped from bundles by pool workers, by CSV path.
+_WORKER_DATASETS: dict[str, tuple[int, int, _Dataset]] = {}
 
+
+def _worker_dataset(cache_dir: str, csv_path: str, mtime_ns: int, size: int) -> _Dataset | None:
+    cached = _WORKER_DATASETS.get(csv_path)
+    if cached is not None and cached[:2] == (mtime_ns, size):
+        return cached[2]
+    bundle = read_bundle(cache_dir, csv_path, mtime_ns, size)
+    if bundle is None:
+        return None
+    dataset = _Dataset.from_arrays(*bundle)
+    _WORKER_DATASETS[csv_path] = (mtime_ns, size, dataset)
+    return dataset
+
+
+def _monthly_partition(
+    cache_dir: str, csv_path: str, mtime_ns: int, size: int, slots: list, options: tuple
+) -> list[tuple[np.ndarray, np.ndarray, np.ndarray]] | None:
+    dataset = _worker_dataset(cache_dir, csv_path, mtime_ns, size)
+    if dataset is None:
+        return None
+    return [_monthly_series(dataset, *item, *options) for item in slots]
+
+
+def _annual_partition(
+    cache_dir: str, csv_path: str, mtime_ns: int, size: int, slots: list, options: tuple
+) -> list[tuple[np.ndarray, np.ndarray, np.ndarray | None]] | None:
+    dataset = _worker_dataset(cache_dir, csv_path, mtime_ns, size)
+    if dataset is None:
+        return None
+    return [_annual_series(dataset, *item, *options) for item in slots]
+
+
+def _run_partitioned(
+    task: Callable[..., list | None],
+    csv_path: str,
+    mtime_ns: int,
+    size: int,
+    slots: list[tuple[int | None, int, int]],
+    options: tuple,
+) -> list | None:
+    """Run ``task`` over contiguous partitions of ``slots`` on the process pool.
+
+    Returns the concatenated per-station results, or None when the selection
+    is too small, the pool is disabled, a worker could not map the bundle
+    for this snapshot, or the pool broke (a worker died; the pool is then
+    replaced for later queries); callers then compute in-process.
+    """
+    if len(slots) < max(settings.parallel_min_stations, 2):
+        return None
+    pool = process_pool()
+    if pool is None:
+        return None
     try:
-        import numpy as np
-    except ModuleNotFoundError as e:
-        raise RuntimeError("numpy is required (installed with pandas).") from e
-
-    values = df.loc[mask, month_cols].to_numpy(copy=False).ravel()
-    finite = np.isfinite(values)
-    count = int(finite.sum())
-    if count == 0:
-        return {"count": 0, "mean": None, "std": None, "min": None, "max": None}
+        futures = [
+            pool.submit(task, settings.cache_dir, csv_path, mtime_ns, size, part, options)
+            for part in partition(slots, settings.query_processes)
+        ]
+        results = [future.result() for future in futures]
+    except BrokenProcessPool:
+        logger.warning("query process pool broke; computing in-process and starting a new pool")
+        reset_process_pool(pool)
+        return None
+    if any(result is None for result in results):
+        return None
+    return list(itertools.chain.from_iterable(results))
+
+
+def _record_scan(query: str, slots: list[tuple[int | None, int, int]], series: list[tuple]) -> None:
+    if settings.metrics_enabled:
+        _SLOTS_SCANNED.inc(query, amount=sum(b - a for _, a, b in slots))
+        _POINTS_EMITTED.inc(query, amount=sum(int(item[0].shape[0]) for item in series))
+
 
-    values = values[finite]
-    return {
-        "count": count,
-        "mean": float(values.mean()),
-        "std": float(values.std(ddof=0)),
-        "min": float(values.min()),
-        "max": float(values.max()),
-    }
+def _check_layout(layout: str) -> None:
+    if layout not in _LAYOUTS:
+        raise ValueError(f"layout must be one of {sorted(_LAYOUTS)}, got {layout!r}")
 
 
 def monthly_data(
@@ -164,51 +1136,53 @@ def monthly_data(
     stations: Iterable[str],
     start_year: int | None = None,
     end_year: int | None = None,
+    layout: str = "points",
+    max_points: int | None = None,
+    downsample_method: str = "lttb",
+    arrays: bool = False,
 ) -> dict[str, object]:
-    df, month_cols, _ = _STORE.get(csv_path)
-    stations_key = tuple(sorted({s.strip() for s in stations if s and s.strip()}, key=_sort_station_key))
-    if not stations_key or not month_cols:
-        return {"stations": []}
-
-    mask = df["Station Number"].isin(stations_key)
-    if start_year is not None:
-        mask &= df["Year"] >= start_year
-    if end_year is not None:
-        mask &= df["Year"] <= end_year
+    """Monthly values per station.
 
-    try:
-        import numpy as np
-    except ModuleNotFoundError as e:
-        raise RuntimeError("numpy is required (installed with pandas).") from e
+    ``layout="points"`` returns ``{"station", "points": [{year, month, value}]}``
+    per station; ``layout="columnar"`` returns parallel ``years``/``months``/
+    ``values`` lists instead. With ``max_points``, each series longer than
+    that is reduced with ``downsample_method`` (see ``core.downsample``).
+    ``arrays=True`` keeps the columnar lists as NumPy arrays (values widened
+    to float64, so they hold exactly what the lists would) for
+    ``api.encoding.dumps``; it has no effect on the points layout.
+    """
+    _check_layout(layout)
+    mtime_ns, size, dataset = _STORE.snapshot(csv_path)
+    stations_key = normalize_stations(stations)
+    if not stations_key or not dataset.month_cols:
+        return {"stations": []}
 
-    month_map = {name: month_num for name, month_num in _MONTH_ORDER}
-    filtered = df.loc[mask, ["Station Number", "Year", *month_cols]].sort_values(
-        ["Station Number", "Year"], kind="mergesort"
-    )
+    with _QUERY_SECONDS.time("monthly", "compute"):
+        slots = _station_slots(dataset, stations_key, start_year, end_year)
+        options = (max_points, downsample_method)
+        series = _run_partitioned(_monthly_partition, csv_path, mtime_ns, size, slots, options)
+        if series is None:
+            series = [_monthly_series(dataset, *item, *options) for item in slots]
+    _record_scan("monthly", slots, series)
 
     out: list[dict[str, object]] = []
-    for station in stations_key:
-        sub = filtered[filtered["Station Number"] == station]
-        if sub.empty:
-            out.append({"station": station, "points": []})
-            continue
-
-        years = sub["Year"].to_numpy(copy=False)
-        data = sub[month_cols].to_numpy(copy=False)
-        points: list[dict[str, object]] = []
-
-        for row_i in range(data.shape[0]):
-            year_val = years[row_i]
-            if year_val is None or (isinstance(year_val, float) and np.isnan(year_val)):
+    with _QUERY_SECONDS.time("monthly", "format"):
+        for station, (years, months, values) in zip(stations_key, series):
+            if layout == "columnar" and arrays:
+                out.append(
+                    {"station": station, "years": years, "months": months, "values": values.astype("float64")}
+                )
                 continue
-            year_int = int(year_val)
-            row = data[row_i]
-            for col_i, name in enumerate(month_cols):
-                v = row[col_i]
-                if np.isfinite(v):
-                    points.append({"year": year_int, "month": month_map[name], "value": float(v)})
 
-        out.append({"station": station, "points": points})
+            years_l, months_l, values_l = years.tolist(), months.tolist(), values.tolist()
+            if layout == "columnar":
+                out.append({"station": station, "years": years_l, "months": months_l, "values": values_l})
+            else:
+                points = [
+                    {"year": y, "month": m, "value": v}
+                    for y, m, v in zip(years_l, months_l, values_l)
+                ]
+                out.append({"station": station, "points": points})
 
     return {"stations": out}
 
@@ -220,78 +1194,317 @@ def annual_data(
     start_year: int | None = None,
     end_year: int | None = None,
     include_std: bool = False,
+    layout: str = "points",
+    max_points: int | None = None,
+    downsample_method: str = "lttb",
+    arrays: bool = False,
 ) -> dict[str, object]:
-    df, month_cols, _ = _STORE.get(csv_path)
-    stations_key = tuple(sorted({s.strip() for s in stations if s and s.strip()}, key=_sort_station_key))
-    if not stations_key or not month_cols:
+    """Annual means (and optionally population std) per station.
+
+    ``layout="points"`` returns ``{"station", "points": [{year, mean, ...}]}``
+    per station; ``layout="columnar"`` returns parallel ``years``/``mean``
+    (and ``std``, ``None`` where undefined) lists instead. ``max_points``
+    downsamples each series by its means, and ``arrays`` keeps columnar
+    lists as NumPy arrays, as in ``monthly_data`` (undefined ``std`` is NaN).
+    """
+    _check_layout(layout)
+    mtime_ns, size, dataset = _STORE.snapshot(csv_path)
+    stations_key = normalize_stations(stations)
+    if not stations_key or not dataset.month_cols:
         return {"stations": []}
 
-    mask = df["Station Number"].isin(stations_key)
-    if start_year is not None:
-        mask &= df["Year"] >= start_year
-    if end_year is not None:
-        mask &= df["Year"] <= end_year
+    with _QUERY_SECONDS.time("annual", "compute"):
+        slots = _station_slots(dataset, stations_key, start_year, end_year)
+        options = (include_std, max_points, downsample_method)
+        series = _run_partitioned(_annual_partition, csv_path, mtime_ns, size, slots, options)
+        if series is None:
+            series = [_annual_series(dataset, *item, *options) for item in slots]
+    _record_scan("annual", slots, series)
 
-    try:
-        import numpy as np
-    except ModuleNotFoundError as e:
-        raise RuntimeError("numpy is required (installed with pandas).") from e
+    out: list[dict[str, object]] = []
+    with _QUERY_SECONDS.time("annual", "format"):
+        for station, (years, means, stds) in zip(stations_key, series):
+            if layout == "columnar" and arrays:
+                item = {"station": station, "years": years, "mean": means.astype("float64")}
+                if stds is not None:
+                    item["std"] = stds.astype("float64")
+                out.append(item)
+                continue
 
-    filtered = df.loc[mask, ["Station Number", "Year", *month_cols]].copy()
-    if filtered.empty:
-        return {"stations": [{"station": s, "points": []} for s in stations_key]}
+            years_l, means_l = years.tolist(), means.tolist()
 
-    month_matrix = filtered[month_cols].to_numpy(copy=False)
-    annual_mean = np.nanmean(month_matrix, axis=1)
-    filtered["annual_mean"] = annual_mean
+            if stds is None:
+                if layout == "columnar":
+                    out.append({"station": station, "years": years_l, "mean": means_l})
+                else:
+                    points = [{"year": y, "mean": m} for y, m in zip(years_l, means_l)]
+                    out.append({"station": station, "points": points})
+                continue
 
-    if include_std:
-        annual_std = np.nanstd(month_matrix, axis=1, ddof=0)
-        filtered["annual_std"] = annual_std
+            std_finite = np.isfinite(stds)
+            stds_l = [v if ok else None for v, ok in zip(stds.tolist(), std_finite.tolist())]
+            if layout == "columnar":
+                out.append({"station": station, "years": years_l, "mean": means_l, "std": stds_l})
+                continue
 
-    filtered = filtered.sort_values(["Station Number", "Year"], kind="mergesort")
+            points = []
+            for y, m, sd in zip(years_l, means_l, stds_l):
+                if sd is None:
+                    points.append({"year": y, "mean": m, "std": None})
+                else:
+                    points.append({"year": y, "mean": m, "std": sd, "lower": m - sd, "upper": m + sd})
+            out.append({"station": station, "points": points})
 
-    out: list[dict[str, object]] = []
-    for station, group in filtered.groupby("Station Number", sort=False):
-        years = group["Year"].to_numpy(copy=False)
-        means = group["annual_mean"].to_numpy(copy=False)
-        stds = group["annual_std"].to_numpy(copy=False) if include_std else None
-
-        points: list[dict[str, object]] = []
-        for i in range(len(group)):
-            year_val = years[i]
-            if year_val is None or (isinstance(year_val, float) and np.isnan(year_val)):
-                continue
-            mean_val = means[i]
-            if not np.isfinite(mean_val):
-                continue
-            year_int = int(year_val)
+    return {"stations": out}
+
+
+def _format_columns(
+    station: str, columns: Sequence[tuple[str, str, np.ndarray]], layout: str, arrays: bool
+) -> dict[str, object]:
+    """One station's series as ``points`` objects or ``columnar`` lists (kept as arrays with ``arrays``).
+
+    ``columns`` holds ``(point key, columnar key, values)``; values must be
+    int64 or NaN-free float64 so both forms encode alike.
+    """
+    if layout == "columnar":
+        item: dict[str, object] = {"station": station}
+        for _, key, values in columns:
+            item[key] = values if arrays else values.tolist()
+        return item
+    keys = [key for key, _, _ in columns]
+    rows = zip(*(values.tolist() for _, _, values in columns))
+    return {"station": station, "points": [dict(zip(keys, row)) for row in rows]}
+
+
+def _rolling_series(
+    dataset: _Dataset, pos: int | None, a: int, b: int, window: int, min_years: int, start_year: int | None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    years, means, _ = _annual_arrays(dataset, pos, a, b, include_std=False)
+    # Slots [a, b) cover the station's data within the window, so the window - 1 years before slot a are empty.
+    annual = np.full(window - 1 + b - a, np.nan)
+    annual[years - (dataset.year0 + a) + window - 1] = means
+    rolling_means, rolling_stds, _ = rolling_mean_std(annual, window, min_years)
+    ends = np.arange(a, b, dtype=np.int64) + dataset.year0
+    keep = np.isfinite(rolling_means)
+    if start_year is not None:
+        keep &= ends >= start_year
+    return ends[keep], rolling_means[keep], rolling_stds[keep]
+
+
+def analytics_rolling(
+    csv_path: str,
+    *,
+    stations: Iterable[str],
+    window: int,
+    min_years: int | None = None,
+    start_year: int | None = None,
+    end_year: int | None = None,
+    include_std: bool = False,
+    layout: str = "points",
+    arrays: bool = False,
+) -> dict[str, object]:
+    """Trailing ``window``-year rolling mean (and optionally population std) of each station's annual means.
+
+    The value for ``year`` covers the annual means of ``year - window + 1``
+    through ``year``, reaching back before ``start_year`` where the station
+    has data. Windows with fewer than ``min_years`` annual means (default:
+    all ``window`` of them) are left out. Layouts and ``arrays`` as in
+    ``annual_data``, with ``{year, mean[, std]}`` points.
+    """
+    _check_layout(layout)
+    min_years = window if min_years is None else min_years
+    if not 1 <= min_years <= window:
+        raise ValueError(f"need 1 <= min_years <= window, got min_years={min_years}, window={window}")
+    dataset = _STORE.get(csv_path)
+    stations_key = normalize_stations(stations)
+    if not stations_key or not dataset.month_cols:
+        return {"stations": []}
+
+    lookback_start = None if start_year is None else start_year - window + 1
+    with _QUERY_SECONDS.time("rolling", "compute"):
+        slots = _station_slots(dataset, stations_key, lookback_start, end_year)
+        series = [_rolling_series(dataset, *item, window, min_years, start_year) for item in slots]
+    _record_scan("rolling", slots, series)
+
+    with _QUERY_SECONDS.time("rolling", "format"):
+        out = []
+        for station, (years, means, stds) in zip(stations_key, series):
+            columns = [("year", "years", years), ("mean", "mean", means)]
             if include_std:
-                std_val = stds[i]
-                if np.isfinite(std_val):
-                    std_f = float(std_val)
-                    mean_f = float(mean_val)
-                    points.append(
-                        {
-                            "year": year_int,
-                            "mean": mean_f,
-                            "std": std_f,
-                            "lower": mean_f - std_f,
-                            "upper": mean_f + std_f,
-                        }
-                    )
-                else:
-                    points.append({"year": year_int, "mean": float(mean_val), "std": None})
-            else:
-                points.append({"year": year_int, "mean": float(mean_val)})
+                columns.append(("std", "std", stds))
+            out.append(_format_columns(station, columns, layout, arrays))
+    return {"stations": out}
 
-        out.append({"station": str(station), "points": points})
 
-    # Ensure stations with zero points still appear, in requested order.
-    existing = {item["station"] for item in out}
+def analytics_normals(
+    csv_path: str,
+    *,
+    stations: Iterable[str],
+    base_start: int | None = None,
+    base_end: int | None = None,
+) -> dict[str, object]:
+    """Per-calendar-month normals of each station over the reference years ``[base_start, base_end]``.
+
+    Returns ``{"station", "normals": [{month, mean, count}]}`` per station,
+    one entry per month column; ``count`` is the number of reference years
+    with a value and ``mean`` is None where it is 0. The reference period is
+    the whole record by default.
+    """
+    dataset = _STORE.get(csv_path)
+    stations_key = normalize_stations(stations)
+    if not stations_key or not dataset.month_cols:
+        return {"stations": []}
+
+    with _QUERY_SECONDS.time("normals", "compute"):
+        positions = dataset.positions(stations_key)
+        a, b = dataset.year_slots(base_start, base_end)
+        normals, counts = monthly_normals(dataset.cube[positions, a:b])
+        _SLOTS_SCANNED.inc("normals", amount=positions.size * (b - a))
+
+    months = dataset.months.tolist()
+    known = iter(zip(normals.tolist(), counts.tolist()))  # rows follow ``positions``: known stations, in order
+    out = []
     for station in stations_key:
-        if station not in existing:
-            out.append({"station": station, "points": []})
+        if dataset.position(station) is None:
+            means_l, counts_l = [None] * len(months), [0] * len(months)
+        else:
+            means_l, counts_l = next(known)
+        entries = [
+            {"month": month, "mean": mean if count else None, "count": count}
+            for month, mean, count in zip(months, means_l, counts_l)
+        ]
+        out.append({"station": station, "normals": entries})
+    return {"stations": out}
 
-    out.sort(key=lambda x: _sort_station_key(x["station"]))  # stable, small S
+
+def _anomaly_series(
+    dataset: _Dataset, pos: int | None, a: int, b: int, base: tuple[int, int], resolution: str
+) -> tuple[np.ndarray, ...]:
+    normals, _ = monthly_normals(dataset.block(pos, *base))
+    anomalies = dataset.block(pos, a, b) - normals
+    if resolution == "annual":
+        annual = annual_anomalies(anomalies)
+        keep = np.isfinite(annual)
+        return _slot_years(dataset, a, np.flatnonzero(keep)), annual[keep]
+    rows, cols = np.isfinite(anomalies).nonzero()
+    return _slot_years(dataset, a, rows), dataset.months[cols], anomalies[rows, cols]
+
+
+def analytics_anomalies(
+    csv_path: str,
+    *,
+    stations: Iterable[str],
+    base_start: int | None = None,
+    base_end: int | None = None,
+    start_year: int | None = None,
+    end_year: int | None = None,
+    resolution: str = "monthly",
+    layout: str = "points",
+    arrays: bool = False,
+) -> dict[str, object]:
+    """Departures from each station's monthly normals (see ``analytics_normals``).
+
+    ``resolution="monthly"`` returns ``{year, month, anomaly}`` points for
+    every value whose calendar month has a normal; ``"annual"`` returns
+    ``{year, anomaly}`` with the year's mean monthly anomaly, which unlike
+    the difference of annual means is not biased by missing months. Layouts
+    and ``arrays`` as in ``monthly_data``.
+    """
+    _check_layout(layout)
+    if resolution not in _RESOLUTIONS:
+        raise ValueError(f"resolution must be one of {sorted(_RESOLUTIONS)}, got {resolution!r}")
+    dataset = _STORE.get(csv_path)
+    stations_key = normalize_stations(stations)
+    if not stations_key or not dataset.month_cols:
+        return {"stations": []}
+
+    base = dataset.year_slots(base_start, base_end)
+    with _QUERY_SECONDS.time("anomalies", "compute"):
+        slots = _station_slots(dataset, stations_key, start_year, end_year)
+        series = [_anomaly_series(dataset, *item, base, resolution) for item in slots]
+    _record_scan("anomalies", slots, series)
+
+    with _QUERY_SECONDS.time("anomalies", "format"):
+        out = []
+        for station, item in zip(stations_key, series):
+            if resolution == "annual":
+                years, values = item
+                columns = [("year", "years", years), ("anomaly", "anomaly", values)]
+            else:
+                years, months, values = item
+                columns = [("year", "years", years), ("month", "months", months), ("anomaly", "anomaly", values)]
+            out.append(_format_columns(station, columns, layout, arrays))
     return {"stations": out}
+
+
+def analytics_correlation(
+    csv_path: str,
+    *,
+    stations: Iterable[str],
+    start_year: int | None = None,
+    end_year: int | None = None,
+    anomalies: bool = False,
+    base_start: int | None = None,
+    base_end: int | None = None,
+    min_overlap: int = 12,
+    arrays: bool = False,
+) -> dict[str, object]:
+    """Pairwise Pearson correlation of the stations' monthly values within the year window.
+
+    Each pair is correlated over the months both stations have a value
+    for. With ``anomalies``, each station's monthly normals over
+    ``[base_start, base_end]`` are subtracted first, so the shared seasonal
+    cycle does not dominate. Returns ``{"stations", "correlation",
+    "overlap"}``: the normalized station order and two square matrices
+    (rows as lists, or 2-D arrays with ``arrays``); a correlation is None
+    where fewer than ``min_overlap`` months overlap or a series is constant.
+    """
+    dataset = _STORE.get(csv_path)
+    stations_key = normalize_stations(stations)
+    if not stations_key or not dataset.month_cols:
+        return {"stations": list(stations_key), "correlation": [], "overlap": []}
+
+    with _QUERY_SECONDS.time("correlation", "compute"):
+        a, b = dataset.year_slots(start_year, end_year)
+        rows = [dataset.position(station) for station in stations_key]
+        known = np.array([i for i, pos in enumerate(rows) if pos is not None], dtype=np.int64)
+        values = np.full((len(rows), b - a, len(dataset.month_cols)), np.nan)
+        values[known] = dataset.cube[dataset.positions(stations_key), a:b]
+        if anomalies:
+            base = dataset.year_slots(base_start, base_end)
+            normals, _ = monthly_normals(dataset.cube[dataset.positions(stations_key), base[0] : base[1]])
+            values[known] -= normals[:, None, :]
+        r, overlap = pairwise_correlation(values.reshape(len(rows), -1), min_overlap)
+        _SLOTS_SCANNED.inc("correlation", amount=known.size * (b - a))
+
+    if arrays:
+        return {"stations": list(stations_key), "correlation": r, "overlap": overlap}
+    with _QUERY_SECONDS.time("correlation", "format"):
+        correlation = [[None if v != v else v for v in row] for row in r.tolist()]
+        return {"stations": list(stations_key), "correlation": correlation, "overlap": overlap.tolist()}
+
+
+def export_series(
+    csv_path: str,
+    *,
+    stations: Iterable[str] | None = None,
+    start_year: int | None = None,
+    end_year: int | None = None,
+) -> tuple[list[str], list[int], list[tuple[str, int, np.ndarray]]]:
+    """Per-station year blocks for bulk export, as views into the cube (no copies).
+
+    Returns ``(month_cols, months, [(station, first_year, values), ...])`` with
+    ``values`` a C-contiguous ``(years, len(month_cols))`` block covering the
+    consecutive years from ``first_year`` (within the window and the station's
+    years with data), NaN for missing months. All stations are exported when
+    ``stations`` is None.
+    """
+    dataset = _STORE.get(csv_path)
+    stations_key = tuple(dataset.stations) if stations is None else normalize_stations(stations)
+
+    series = []
+    for station in stations_key:
+        pos = dataset.position(station)
+        a, b = dataset.station_slots(pos, start_year, end_year)
+        series.append((station, dataset.year0 + a, dataset.block(pos, a, b)))
+    return list(dataset.month_cols), dataset.months.tolist(), series
@@ -0,0 +1,83 @@
+"""Series downsampling for plotting: pick which points of a series to keep.
+
+Both methods return sorted indices into the input, always keep the first and
+last point and return every index when the series already fits.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+METHODS = ("lttb", "minmax")
+
+
+def _bucket_starts(n: int, buckets: int) -> np.ndarray:
+    return np.linspace(0, n, buckets + 1).astype(np.int64)
+
+
+def lttb(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets (Steinarsson, 2013).
+
+    Each bucket keeps the point forming the largest triangle with the point
+    kept in the previous bucket and the average of the next bucket. That
+    dependency on the previous choice is sequential, so the loop runs once
+    per output point while the work inside a bucket is vectorized. Budgets
+    below 3 leave no inner bucket and keep just the end points, like ``minmax``.
+    """
+    n = x.shape[0]
+    if max_points >= n:
+        return np.arange(n)
+    if max_points < 3:
+        return np.array([0, n - 1], dtype=np.int64)
+
+    x = x.astype(np.float64, copy=False)
+    y = y.astype(np.float64, copy=False)
+    inner = _bucket_starts(n - 2, max_points - 2) + 1
+    counts = np.diff(inner)
+    avg_x = np.add.reduceat(x[1 : n - 1], inner[:-1] - 1) / counts
+    avg_y = np.add.reduceat(y[1 : n - 1], inner[:-1] - 1) / counts
+    # The last bucket's "next average" is the final point itself.
+    next_x = np.append(avg_x[1:], x[n - 1])
+    next_y = np.append(avg_y[1:], y[n - 1])
+
+    out = np.empty(max_points, dtype=np.int64)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(max_points - 2):
+        lo, hi = inner[i], inner[i + 1]
+        ax, ay = x[a], y[a]
+        # Twice the triangle area, up to sign.
+        area = np.abs((ax - next_x[i]) * (y[lo:hi] - ay) - (ax - x[lo:hi]) * (next_y[i] - ay))
+        a = lo + int(area.argmax())
+        out[i + 1] = a
+    return out
+
+
+def minmax(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """Keep the minimum and maximum of equal-count buckets, plus the end points (fully vectorized)."""
+    n = y.shape[0]
+    if max_points >= n:
+        return np.arange(n)
+    buckets = (max_points - 2) // 2
+    if buckets < 1:
+        return np.array([0, n - 1], dtype=np.int64)
+
+    starts = _bucket_starts(n, buckets)
+    bucket = np.repeat(np.arange(buckets), np.diff(starts))
+    lows = np.minimum.reduceat(y, starts[:-1])
+    highs = np.maximum.reduceat(y, starts[:-1])
+    # First index in each bucket attaining its min / max.
+    _, argmin = np.unique(bucket[y == lows[bucket]], return_index=True)
+    _, argmax = np.unique(bucket[y == highs[bucket]], return_index=True)
+    idx = np.flatnonzero(y == lows[bucket])[argmin]
+    idx = np.concatenate([idx, np.flatnonzero(y == highs[bucket])[argmax], [0, n - 1]])
+    return np.unique(idx)
+
+
+def downsample(x: np.ndarray, y: np.ndarray, max_points: int | None, method: str) -> np.ndarray | None:
+    """Indices to keep, or None when no downsampling is requested or needed."""
+    if method not in METHODS:
+        raise ValueError(f"downsample must be one of {list(METHODS)}, got {method!r}")
+    if max_points is None or x.shape[0] <= max_points:
+        return None
+    return lttb(x, y, max_points) if method == "lttb" else minmax(x, y, max_points)
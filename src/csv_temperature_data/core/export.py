@@ -0,0 +1,120 @@
+"""Binary encoders for bulk export of station series.
+
+Both encoders stream the per-station blocks of the ``csv_data`` cube: a
+station's window is a C-contiguous ``(years, months)`` float32 block covering
+consecutive years, so the raw format writes it without copying.
+
+Raw format (``application/octet-stream``), all little-endian::
+
+    b"CTD2" | uint32 header length | UTF-8 JSON header
+    then per station in header order:
+        float32[rows * months] values, year-major (NaN = missing)
+
+The JSON header lists ``months`` (month numbers of the columns) and
+``stations`` as ``[{"station": ..., "first_year": ..., "rows": ...}]``; row
+``i`` of a station is year ``first_year + i``.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import struct
+from typing import Iterator, Sequence
+
+import numpy as np
+
+RAW_MEDIA_TYPE = "application/octet-stream"
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+RAW_MAGIC = b"CTD2"
+
+Series = Sequence[tuple[str, int, np.ndarray]]
+
+
+def arrow_available() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _byte_view(array: np.ndarray, dtype: str) -> memoryview:
+    return memoryview(np.ascontiguousarray(array, dtype=dtype)).cast("B")
+
+
+def raw_stream(months: Sequence[int], series: Series) -> Iterator[bytes | memoryview]:
+    header = {
+        "months": list(months),
+        "values_dtype": "<f4",
+        "stations": [
+            {"station": station, "first_year": first_year, "rows": int(values.shape[0])}
+            for station, first_year, values in series
+        ],
+    }
+    blob = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    yield RAW_MAGIC + struct.pack("<I", len(blob)) + blob
+
+    for _, _, values in series:
+        if values.size:
+            yield _byte_view(values, "<f4")
+
+
+class _ChunkSink:
+    """Minimal writable file object that hands written IPC messages back to the caller."""
+
+    def __init__(self) -> None:
+        self.closed = False
+        self._chunks: list[bytes] = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(self._chunks[-1])
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> list[bytes]:
+        chunks, self._chunks = self._chunks, []
+        return chunks
+
+
+def arrow_stream(month_cols: Sequence[str], series: Series) -> Iterator[bytes]:
+    """Arrow IPC stream with one record batch per station.
+
+    Columns: ``station`` (dictionary-encoded), ``year`` (int64) and one float32
+    column per month; years without any value are left out. Raises ``RuntimeError`` right away if pyarrow is missing.
+    """
+    try:
+        import pyarrow as pa
+    except ModuleNotFoundError as e:
+        raise RuntimeError("pyarrow is required for Arrow export.") from e
+
+    schema = pa.schema(
+        [
+            ("station", pa.dictionary(pa.int32(), pa.string())),
+            ("year", pa.int64()),
+            *[(name, pa.float32()) for name in month_cols],
+        ]
+    )
+    dictionary = pa.array([station for station, _, _ in series], type=pa.string())
+
+    def _batches() -> Iterator[bytes]:
+        sink = _ChunkSink()
+        with pa.ipc.new_stream(sink, schema) as writer:
+            for station_i, (_, first_year, values) in enumerate(series):
+                rows = np.flatnonzero(np.isfinite(values).any(axis=1))
+                if not rows.size:
+                    continue
+                # Gathering the rows also transposes the block into one contiguous array per month.
+                columns_major = np.ascontiguousarray(values[rows].T)
+                codes = pa.array(np.full(rows.shape[0], station_i, dtype=np.int32))
+                columns = [
+                    pa.DictionaryArray.from_arrays(codes, dictionary),
+                    pa.array(rows + first_year),
+                    *[pa.array(column) for column in columns_major],
+                ]
+                writer.write_batch(pa.RecordBatch.from_arrays(columns, schema=schema))
+                yield from sink.drain()
+        yield from sink.drain()
+
+    return _batches()
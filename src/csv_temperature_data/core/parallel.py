@@ -0,0 +1,69 @@
+"""Optional process pool for splitting large station selections across cores.
+
+Workers are never sent the dataset: each maps the on-disk bundle of the same
+CSV version (see ``core.bundle``), so all processes share one copy of the
+arrays through the OS page cache and only the per-station results are
+pickled back. Enabled with ``settings.query_processes`` and requires
+``settings.cache_dir``.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Sequence, TypeVar
+
+from csv_temperature_data.core.config import settings
+
+T = TypeVar("T")
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def process_pool() -> ProcessPoolExecutor | None:
+    """The shared pool, or None when process execution is disabled."""
+    global _pool
+    if settings.query_processes <= 0 or not settings.cache_dir:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            # Never fork: the server process runs threads (reloader, query executor).
+            _pool = ProcessPoolExecutor(
+                max_workers=settings.query_processes,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def reset_process_pool(broken: ProcessPoolExecutor) -> None:
+    """Discard ``broken`` (a worker died) so the next ``process_pool()`` call starts a fresh pool.
+
+    A pool another thread has already replaced it with is left alone.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is broken:
+            _pool = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_process_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def partition(items: Sequence[T], parts: int) -> list[Sequence[T]]:
+    """Split ``items`` into at most ``parts`` contiguous, near-equal, non-empty slices."""
+    parts = max(1, min(parts, len(items)))
+    size, extra = divmod(len(items), parts)
+    out, start = [], 0
+    for i in range(parts):
+        end = start + size + (1 if i < extra else 0)
+        out.append(items[start:end])
+        start = end
+    return out
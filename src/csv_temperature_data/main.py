@@ -1,12 +1,37 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from starlette.concurrency import run_in_threadpool
 
+from csv_temperature_data.api.concurrency import shutdown_executor
+from csv_temperature_data.api.middleware import RequestMetricsMiddleware
 from csv_temperature_data.api.router import api_router
 from csv_temperature_data.core.config import settings
+from csv_temperature_data.core.csv_data import preload, start_reloader, stop_reloader
+from csv_temperature_data.core.parallel import shutdown_process_pool
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load the dataset before serving; changes are then picked up in the background.
+    watch = settings.reload_interval > 0
+    await run_in_threadpool(preload, settings.csv_path, watch=watch)
+    if watch:
+        start_reloader(settings.reload_interval)
+    try:
+        yield
+    finally:
+        stop_reloader()
+        shutdown_executor()
+        shutdown_process_pool()
+
 
 app = FastAPI(
     title=settings.app_name,
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    lifespan=lifespan,
 )
+app.add_middleware(RequestMetricsMiddleware)
 app.include_router(api_router, prefix="/api")
@@ -29,6 +29,30 @@ def test_list_stations_unique(tmp_path) -> None:
     assert resp.json() == {"count": 2, "stations": ["123", "456"]}
 
 
+def test_header_without_month_columns(tmp_path) -> None:
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "Station Number;Year\n"
+        "123;2000\n"
+        "456;2001\n",
+        encoding="utf-8",
+    )
+
+    from csv_temperature_data.core.config import settings
+
+    settings.csv_path = str(csv_path)
+    client = TestClient(app)
+    resp = client.get("/api/stations")
+    assert resp.status_code == 200
+    assert resp.json() == {"count": 2, "stations": ["123", "456"]}
+    resp = client.get("/api/data/range")
+    assert resp.status_code == 200
+    assert resp.json() == {"min_year": 2000, "max_year": 2001}
+    resp = client.get("/api/analytics/summary?stations=123")
+    assert resp.status_code == 200
+    assert resp.json()["count"] == 0
+
+
 def test_analytics_summary(tmp_path) -> None:
     csv_path = tmp_path / "data.csv"
     csv_path.write_text(
@@ -163,3 +187,855 @@ def test_annual_data_missing_station_404(tmp_path) -> None:
     resp = client.get("/api/data/annual?stations=999&include_std=false")
     assert resp.status_code == 404
     assert resp.json() == {"detail": {"missing_stations": ["999"]}}
+
+
+def test_monthly_data_unsorted_rows_year_window(tmp_path) -> None:
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "Station Number;Year;Jan\n"
+        "456;2002;6.0\n"
+        "123;2002;3.0\n"
+        "123;2000;1.0\n"
+        "456;2001;5.0\n"
+        "123;2001;2.0\n",
+        encoding="utf-8",
+    )
+
+    from csv_temperature_data.core.config import settings
+
+    settings.csv_path = str(csv_path)
+    client = TestClient(app)
+    resp = client.get("/api/data/monthly?stations=456,123&start_year=2001&end_year=2002")
+    assert resp.status_code == 200
+    assert resp.json() == {
+        "stations": [
+            {
+                "station": "123",
+                "points": [
+                    {"year": 2001, "month": 1, "value": 2.0},
+                    {"year": 2002, "month": 1, "value": 3.0},
+                ],
+            },
+            {
+                "station": "456",
+                "points": [
+                    {"year": 2001, "month": 1, "value": 5.0},
+                    {"year": 2002, "month": 1, "value": 6.0},
+                ],
+            },
+        ]
+    }
+
+
+def test_year_gaps_and_repeated_rows(tmp_path) -> None:
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "Station Number;Year;Jan;Feb\n"
+        "123;1990;1.0;2.0\n"
+        "123;1995;9.0;\n"
+        "456;2000;4.0;\n"
+        "123;1995;3.0;\n",
+        encoding="utf-8",
+    )
+
+    from csv_temperature_data.core.config import settings
+
+    settings.csv_path = str(csv_path)
+    client = TestClient(app)
+    assert client.get("/api/data/range").json() == {"min_year": 1990, "max_year": 2000}
+
+    resp = client.get("/api/data/annual?stations=123,456&format=columnar")
+    assert resp.json() == {
+        "stations": [
+            {"station": "123", "years": [1990, 1995], "mean": [1.5, 3.0]},
+            {"station": "456", "years": [2000], "mean": [4.0]},
+        ]
+    }
+
+    summary = client.get("/api/analytics/summary?stations=123&start_year=1991").json()
+    assert summary == {"count": 1, "mean": 3.0, "std": 0.0, "min": 3.0, "max": 3.0}
+
+
+def test_monthly_and_annual_columnar_format(tmp_path) -> None:
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "Station Number;Year;Jan;Feb\n"
+        "123;2000;1.0;3.0\n"
+        "123;2001;5.0;\n"
+        "123;2002;;\n",
+        encoding="utf-8",
+    )
+
+    from csv_temperature_data.core.config import settings
+
+    settings.csv_path = str(csv_path)
+    client = TestClient(app)
+    resp = client.get("/api/data/monthly?stations=123&format=columnar")
+    assert resp.status_code == 200
+    assert resp.json() == {
+        "stations": [{"station": "123", "years": [2000, 2000, 2001], "months": [1, 2, 1], "values": [1.0, 3.0, 5.0]}]
+    }
+
+    resp = client.get("/api/data/annual?stations=123&include_std=true&format=columnar")
+    assert resp.status_code == 200
+    assert resp.json() == {"stations": [{"station": "123", "years": [2000, 2001], "mean": [2.0, 5.0], "std": [1.0, 0.0]}]}
+
+    resp = client.get("/api/data/annual?stations=123&format=bogus")
+    assert resp.status_code == 422
+
+
+def test_export_raw_buffer(tmp_path) -> None:
+    import json
+    import struct
+
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "Station Number;Year;Jan;Feb\n"
+        "123;2001;5.0;\n"
+        "123;2000;1.0;3.0\n"
+        "456;2000;100.0;200.0\n",
+        encoding="utf-8",
+    )
+
+    from csv_temperature_data.core.config import settings
+
+    settings.csv_path = str(csv_path)
+    client = TestClient(app)
+    resp = client.get("/api/data/export?stations=123", headers={"Accept": "application/octet-stream"})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/octet-stream"
+
+    body = resp.content
+    assert body[:4] == b"CTD2"
+    (header_len,) = struct.unpack("<I", body[4:8])
+    header = json.loads(body[8 : 8 + header_len])
+    assert header["months"] == [1, 2]
+    assert header["stations"] == [{"station": "123", "first_year": 2000, "rows": 2}]
+    values = struct.unpack("<4f", body[8 + header_len :])
+    assert values[:3] == (1.0, 3.0, 5.0)
+    assert values[3] != values[3]
+
+    resp = client.get("/api/data/export", headers={"Accept": "text/html"})
+    assert resp.status_code == 406
+
+
+def test_export_arrow_stream(tmp_path) -> None:
+    import math
+
+    import pytest
+
+    pa = pytest.importorskip("pyarrow")
+
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "Station Number;Year;Jan;Feb;Mar\n"
+        "123;2001;5.5;;-0.1\n"
+        "123;2000;1.0;3.0;2.25\n"
+        "123;2002;;;\n"
+        "456;2000;100.0;200.0;\n"
+        "789;1999;0.3;0.6;0.9\n",
+        encoding="utf-8",
+    )
+
+    from csv_temperature_data.core.config import settings
+
+    settings.csv_path = str(csv_path)
+    client = TestClient(app)
+    resp = client.get(
+        "/api/data/export?stations=123,456", headers={"Accept": "application/vnd.apache.arrow.stream"}
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/vnd.apache.arrow.stream"
+
+    table = pa.ipc.open_stream(resp.content).read_all()
+    assert table.schema.names == ["station", "year", "Jan", "Feb", "Mar"]
+    assert table.schema.field("station").type == pa.dictionary(pa.int32(), pa.string())
+    assert table.schema.field("year").type == pa.int64()
+    assert all(table.schema.field(name).type == pa.float32() for name in ("Jan", "Feb", "Mar"))
+    assert table.num_rows == 3  # 2002 has no values
+    assert table.column("station").to_pylist() == ["123", "123", "456"]
+    assert table.column("year").to_pylist() == [2000, 2001, 2000]
+
+    exported = {
+        (row["station"], row["year"], month, row[name])
+        for row in table.to_pylist()
+        for month, name in enumerate(("Jan", "Feb", "Mar"), start=1)
+        if not math.isnan(row[name])
+    }
+    monthly = client.get("/api/data/monthly?stations=123,456").json()
+    expected = {
+        (item["station"], point["year"], point["month"], point["value"])
+        for item in monthly["stations"]
+        for point in item["points"]
+    }
+    assert exported == expected
+
+
+def test_dataset_cache_bundle_roundtrip(tmp_path, monkeypatch) -> None:
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "Station Number;Year;Jan;Feb\n"
+        "123;2000;1.0;3.0\n"
+        "123;2001;5.0;7.0\n"
+        "456;2000;100.0;\n",
+        encoding="utf-8",
+    )
+    cache_dir = tmp_path / "cache"
+
+    from csv_temperature_data.core import csv_data
+    from csv_temperature_data.core.config import settings
+
+    monkeypatch.setattr(settings, "cache_dir", str(cache_dir))
+    settings.csv_path = str(csv_path)
+    client = TestClient(app)
+    urls = [
+        "/api/analytics/summary?stations=123,456",
+        "/api/data/annual?stations=123,456&include_std=true",
+        "/api/data/monthly?stations=123&start_year=2001",
+    ]
+    parsed = [client.get(url).json() for url in urls]
+    assert len(list(cache_dir.iterdir())) == 1
+
+    monkeypatch.setattr(csv_data, "_STORE", csv_data._CsvStore())
+    monkeypatch.setattr(csv_data._CsvStore, "_load", None)  # must not re-parse the CSV
+    assert [client.get(url).json() for url in urls] == parsed
+
+
+def test_streamed_load_matches_full_parse(tmp_path, monkeypatch) -> None:
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "Station Number;Year;Jan;Feb\n"
+        "456;2001;100.0;\n"
+        "123;2000;1.0;3.0\n"
+        "123;2002;5.0;7.0\n"
+        "456;2001;110.0;120.0\n"
+        "789;1999;;\n",
+        encoding="utf-8",
+    )
+
+    from csv_temperature_data.core import csv_data
+    from csv_temperature_data.core.config import settings
+
+    settings.csv_path = str(csv_path)
+    client = TestClient(app)
+    urls = [
+        "/api/stations",
+        "/api/data/range",
+        "/api/analytics/summary?stations=123,456,789",
+        "/api/data/annual?stations=123,456&include_std=true",
+        "/api/data/monthly?stations=123,456&start_year=2001",
+    ]
+    expected = [client.get(url).json() for url in urls]
+
+    monkeypatch.setattr(settings, "cache_dir", str(tmp_path / "cache"))
+    monkeypatch.setattr(settings, "stream_threshold_bytes", 0)
+    monkeypatch.setattr(settings, "stream_chunk_rows", 2)
+    monkeypatch.setattr(csv_data, "_STORE", csv_data._CsvStore())
+    monkeypatch.setattr(csv_data._CsvStore, "_load", None)  # must not parse the whole CSV at once
+    assert [client.get(url).json() for url in urls] == expected
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+
+
+def test_background_reload_swaps_snapshot(tmp_path, monkeypatch) -> None:
+    import time
+
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("Station Number;Year;Jan\n123;2000;1.0\n", encoding="utf-8")
+
+    from csv_temperature_data.core.config import settings
+
+    monkeypatch.setattr(settings, "reload_interval", 0.05)
+    settings.csv_path = str(csv_path)
+    with TestClient(app) as client:
+        assert client.get("/api/stations").json() == {"count": 1, "stations": ["123"]}
+
+        csv_path.write_text("Station Number;Year;Jan\n123;2000;1.0\n456;2000;2.0\n", encoding="utf-8")
+        deadline = time.monotonic() + 5
+        while client.get("/api/stations").json()["count"] != 2 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert client.get("/api/stations").json() == {"count": 2, "stations": ["123", "456"]}
+
+        # Watched files are not stat-ed per request: the last snapshot keeps serving.
+        csv_path.unlink()
+        time.sleep(0.2)
+        assert client.get("/api/stations").json() == {"count": 2, "stations": ["123", "456"]}
+
+
+def test_appended_rows_are_parsed_incrementally(tmp_path, monkeypatch) -> None:
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "Station Number;Year;Jan;Feb\n"
+        "123;2000;1.0;3.0\n"
+        "456;2000;100.0;200.0\n",
+        encoding="utf-8",
+    )
+
+    from csv_temperature_data.core import csv_data
+    from csv_temperature_data.core.config import settings
+
+    settings.csv_path = str(csv_path)
+    client = TestClient(app)
+    assert client.get("/api/analytics/summary?stations=123").json()["count"] == 2
+
+    monkeypatch.setattr(csv_data._CsvStore, "_load", None)  # a full re-parse would fail
+    with csv_path.open("a", encoding="utf-8") as f:
+        f.write("123;2001;5.0;7.0\n789;1999;-1.0;\n")
+
+    assert client.get("/api/stations").json() == {"count": 3, "stations": ["123", "456", "789"]}
+    summary = client.get("/api/analytics/summary?stations=123").json()
+    assert summary["count"] == 4
+    assert summary["mean"] == 4.0
+    assert client.get("/api/data/range").json() == {"min_year": 1999, "max_year": 2001}
+
+
+def test_etag_conditional_get(tmp_path) -> None:
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "Station Number;Year;Jan;Feb\n"
+        "123;2000;1.0;3.0\n"
+        "456;2000;100.0;200.0\n",
+        encoding="utf-8",
+    )
+
+    from csv_temperature_data.core.config import settings
+
+    settings.csv_path = str(csv_path)
+    client = TestClient(app)
+    resp = client.get("/api/data/annual?stations=456,123")
+    assert resp.status_code == 200
+    etag = resp.headers["etag"]
+    assert "max-age" in resp.headers["cache-control"]
+
+    # Station order and duplicates do not change the cache key.
+    resp = client.get("/api/data/annual?stations=123,456,123", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.content == b""
+
+    resp = client.get("/api/data/annual?stations=123,456&include_std=true", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.headers["etag"] != etag
+
+    with csv_path.open("a", encoding="utf-8") as f:
+        f.write("123;2001;5.0;7.0\n")
+    resp = client.get("/api/data/annual?stations=123,456", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.json()["stations"][0]["points"][-1] == {"year": 2001, "mean": 6.0}
+
+
+def test_single_flight_coalesces_identical_calls() -> None:
+    import asyncio
+    import threading
+    import time
+
+    from csv_temperature_data.api.concurrency import SingleFlight
+
+    flight = SingleFlight()
+    calls = []
+    lock = threading.Lock()
+
+    def compute(tag: str) -> str:
+        with lock:
+            calls.append(tag)
+        time.sleep(0.1)
+        return tag
+
+    async def burst() -> list[str]:
+        return await asyncio.gather(
+            *[flight.run("a", lambda: compute("a")) for _ in range(10)],
+            flight.run("b", lambda: compute("b")),
+        )
+
+    results = asyncio.run(burst())
+    assert results == ["a"] * 10 + ["b"]
+    assert sorted(calls) == ["a", "b"]
+    assert flight.inflight() == 0
+
+
+def test_monthly_data_downsampled(tmp_path) -> None:
+    csv_path = tmp_path / "data.csv"
+    rows = "".join(f"123;{year};{year % 7}.0;{-(year % 5)}.0\n" for year in range(1900, 2000))
+    csv_path.write_text("Station Number;Year;Jan;Feb\n" + rows, encoding="utf-8")
+
+    from csv_temperature_data.core.config import settings
+
+    settings.csv_path = str(csv_path)
+    client = TestClient(app)
+    full = client.get("/api/data/monthly?stations=123&format=columnar").json()["stations"][0]
+    assert len(full["values"]) == 200
+
+    for method in ("lttb", "minmax"):
+        resp = client.get(f"/api/data/monthly?stations=123&format=columnar&max_points=40&downsample={method}")
+        assert resp.status_code == 200
+        series = resp.json()["stations"][0]
+        assert 3 <= len(series["values"]) <= 40
+        assert series["years"][0] == 1900 and series["years"][-1] == 1999
+        if method == "minmax":
+            assert min(series["values"]) == min(full["values"])
+            assert max(series["values"]) == max(full["values"])
+
+    resp = client.get("/api/data/annual?stations=123&max_points=2")
+    assert resp.status_code == 422
+
+
+def test_downsample_small_budget_keeps_endpoints() -> None:
+    import numpy as np
+
+    from csv_temperature_data.core.downsample import lttb, minmax
+
+    x = np.arange(50, dtype=np.float64)
+    y = np.sin(x)
+    for method in (lttb, minmax):
+        for max_points in (1, 2):
+            assert method(x, y, max_points).tolist() == [0, 49]
+        assert method(x, y, 50).tolist() == list(range(50))
+
+
+def test_multiple_datasets_with_bounded_cache(tmp_path, monkeypatch) -> None:
+    datasets_dir = tmp_path / "datasets"
+    datasets_dir.mkdir()
+    for name, station in (("north", "111"), ("south", "222")):
+        (datasets_dir / f"{name}.csv").write_text(
+            f"Station Number;Year;Jan\n{station};2000;1.0\n{station};2001;2.0\n",
+            encoding="utf-8",
+        )
+
+    from csv_temperature_data.core.config import settings
+
+    monkeypatch.setattr(settings, "datasets_dir", str(datasets_dir))
+    monkeypatch.setattr(settings, "dataset_cache_bytes", 1)  # keeps only the most recent dataset
+    client = TestClient(app)
+
+    assert client.get("/api/stations?dataset=north").json() == {"count": 1, "stations": ["111"]}
+    assert client.get("/api/stations?dataset=south").json() == {"count": 1, "stations": ["222"]}
+    assert client.get("/api/data/monthly?stations=111&dataset=south").status_code == 404
+    resp = client.get("/api/analytics/summary?stations=111&dataset=north")
+    assert resp.status_code == 200
+    assert resp.json()["count"] == 2
+
+    listing = client.get("/api/datasets").json()
+    assert [d["id"] for d in listing["datasets"]] == ["north", "south"]
+    loaded = {d["id"]: d["loaded"] for d in listing["datasets"]}
+    assert loaded == {"north": True, "south": False}
+    assert listing["memory"]["total_bytes"] > 0
+
+    for bad in ("missing", "../datasets/north", ".hidden"):
+        resp = client.get("/api/stations", params={"dataset": bad})
+        assert resp.status_code == 404
+        assert resp.json() == {"detail": {"unknown_dataset": bad}}
+
+
+def test_process_pool_matches_in_process(tmp_path, monkeypatch) -> None:
+    csv_path = tmp_path / "data.csv"
+    lines = ["Station Number;Year;Jan;Feb"]
+    for station in range(1, 6):
+        for year in range(2000, 2004):
+            lines.append(f"{station};{year};{station + year % 7}.5;{'' if year % 2 else station * 2}")
+    csv_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    from csv_temperature_data.api.cache import RESPONSE_CACHE
+    from csv_temperature_data.core import csv_data, parallel
+    from csv_temperature_data.core.config import settings
+
+    monkeypatch.setattr(settings, "cache_dir", str(tmp_path / "cache"))
+    settings.csv_path = str(csv_path)
+    client = TestClient(app)
+    urls = [
+        "/api/data/annual?stations=1,2,3,4,5&include_std=true&start_year=2001",
+        "/api/data/monthly?stations=1,2,3,4,5&format=columnar&max_points=5",
+    ]
+    expected = [client.get(url).json() for url in urls]
+    assert all(body["stations"] for body in expected)
+
+    RESPONSE_CACHE.clear()
+    monkeypatch.setattr(settings, "query_processes", 2)
+    monkeypatch.setattr(settings, "parallel_min_stations", 2)
+    monkeypatch.setattr(csv_data, "_monthly_series", None)  # only the workers may compute
+    monkeypatch.setattr(csv_data, "_annual_series", None)
+    try:
+        assert [client.get(url).json() for url in urls] == expected
+    finally:
+        parallel.shutdown_process_pool()
+
+
+def test_broken_process_pool_falls_back_and_recovers(tmp_path, monkeypatch) -> None:
+    import os
+    import signal
+
+    csv_path = tmp_path / "data.csv"
+    lines = ["Station Number;Year;Jan;Feb"]
+    for station in range(1, 6):
+        for year in range(2000, 2004):
+            lines.append(f"{station};{year};{station + year % 7}.5;{station * 2}")
+    csv_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    from csv_temperature_data.api.cache import RESPONSE_CACHE
+    from csv_temperature_data.core import parallel
+    from csv_temperature_data.core.config import settings
+
+    monkeypatch.setattr(settings, "cache_dir", str(tmp_path / "cache"))
+    monkeypatch.setattr(settings, "query_processes", 2)
+    monkeypatch.setattr(settings, "parallel_min_stations", 2)
+    settings.csv_path = str(csv_path)
+    client = TestClient(app)
+    url = "/api/data/annual?stations=1,2,3,4,5&include_std=true"
+    try:
+        expected = client.get(url).json()
+        pool = parallel.process_pool()
+        for pid in list(pool._processes):
+            os.kill(pid, signal.SIGKILL)
+
+        for _ in range(2):
+            RESPONSE_CACHE.clear()
+            resp = client.get(url)
+            assert resp.status_code == 200
+            assert resp.json() == expected
+        assert parallel.process_pool() is not pool
+    finally:
+        parallel.shutdown_process_pool()
+
+
+def test_metrics_endpoint(tmp_path, monkeypatch) -> None:
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "Station Number;Year;Jan;Feb\n"
+        "123;2000;1.0;3.0\n"
+        "123;2001;5.0;\n",
+        encoding="utf-8",
+    )
+
+    from csv_temperature_data.core.config import settings
+
+    settings.csv_path = str(csv_path)
+    client = TestClient(app)
+    assert client.get("/api/data/monthly?stations=123").status_code == 200
+
+    resp = client.get("/api/metrics")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = resp.text
+    assert 'http_request_duration_seconds_count{method="GET",route="/api/data/monthly",status="200"}' in text
+    assert 'csv_query_stage_seconds_count{query="monthly",stage="format"}' in text
+    assert 'csv_dataset_lookups_total{result="miss"}' in text
+    assert f'csv_dataset_bytes{{csv_path="{csv_path}"}}' in text
+
+    def monthly_count(body: str) -> str:
+        prefix = 'csv_query_points_total{query="monthly"} '
+        return next(line for line in body.splitlines() if line.startswith(prefix))
+
+    before = monthly_count(text)
+    monkeypatch.setattr(settings, "metrics_enabled", False)
+    client.get("/api/data/monthly?stations=123&start_year=2001")
+    assert monthly_count(client.get("/api/metrics").text) == before
+
+
+def test_json_encoding_matches_stdlib_reference(tmp_path) -> None:
+    import json
+
+    import numpy as np
+
+    from csv_temperature_data.api.encoding import dumps
+    from csv_temperature_data.core.csv_data import annual_data, monthly_data
+
+    def reference(content: object) -> bytes:
+        return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode()
+
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "Station Number;Year;Jan;Feb;Mar\n"
+        "Zürich;2000;1.1;-3.3;0.2\n"
+        "Zürich;2001;;;\n"
+        "Zürich;2002;7.7;;\n"
+        "456;2001;-0.1;2.5;12.4\n",
+        encoding="utf-8",
+    )
+    for query, kwargs in ((monthly_data, {}), (annual_data, {}), (annual_data, {"include_std": True})):
+        lists = query(str(csv_path), stations=["Zürich", "456"], layout="columnar", **kwargs)
+        arrays = query(str(csv_path), stations=["Zürich", "456"], layout="columnar", arrays=True, **kwargs)
+        assert dumps(arrays) == reference(lists)
+
+    # NaN becomes null; floats Python prints with an exponent keep the stdlib spelling.
+    content = {"v": np.array([1.5, np.nan, 9.99e-05, 2.0e-7, 1e16, -0.0]), "n": np.arange(3)}
+    assert dumps(content) == b'{"v":[1.5,null,9.99e-05,2e-07,1e+16,-0.0],"n":[0,1,2]}'
+    points = monthly_data(str(csv_path), stations=["Zürich"], arrays=True)
+    assert dumps(points) == reference(points)
+
+
+def test_json_encoding_float32_matches_stdlib() -> None:
+    import numpy as np
+
+    from csv_temperature_data.api.encoding import _stdlib_dumps, dumps
+
+    content = {"v": np.array([0.1, 1.5, np.nan, -9.9], dtype=np.float32), "n": np.arange(2, dtype=np.int32)}
+    assert dumps(content) == _stdlib_dumps(content)
+    assert dumps(content) == b'{"v":[0.10000000149011612,1.5,null,-9.899999618530273],"n":[0,1]}'
+
+
+def test_rolling_normals_and_anomalies(tmp_path) -> None:
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "Station Number;Year;Jan;Feb\n"
+        "123;2000;1.0;3.0\n"
+        "123;2001;5.0;\n"
+        "123;2002;;\n"
+        "123;2003;3.0;5.0\n"
+        "123;2004;2.0;4.0\n",
+        encoding="utf-8",
+    )
+
+    from csv_temperature_data.core.config import settings
+
+    settings.csv_path = str(csv_path)
+    client = TestClient(app)
+
+    resp = client.get("/api/analytics/rolling?stations=123&window=2&include_std=true")
+    assert resp.status_code == 200
+    assert resp.json()["stations"][0]["points"] == [
+        {"year": 2001, "mean": 3.5, "std": 1.5},
+        {"year": 2004, "mean": 3.5, "std": 0.5},
+    ]
+    resp = client.get("/api/analytics/rolling?stations=123&window=2&min_years=1&start_year=2001&format=columnar")
+    assert resp.json()["stations"][0] == {
+        "station": "123",
+        "years": [2001, 2002, 2003, 2004],
+        "mean": [3.5, 5.0, 4.0, 3.5],
+    }
+    assert client.get("/api/analytics/rolling?stations=123&window=2&min_years=3").status_code == 422
+
+    resp = client.get("/api/analytics/normals?stations=123&base_start=2000&base_end=2002")
+    assert resp.status_code == 200
+    assert resp.json()["stations"][0]["normals"] == [
+        {"month": 1, "mean": 3.0, "count": 2},
+        {"month": 2, "mean": 3.0, "count": 1},
+    ]
+    assert client.get("/api/analytics/normals?stations=123&base_start=2003&base_end=2000").status_code == 422
+
+    resp = client.get("/api/analytics/anomalies?stations=123&base_start=2000&base_end=2001&start_year=2003")
+    assert resp.json()["stations"][0]["points"] == [
+        {"year": 2003, "month": 1, "anomaly": 0.0},
+        {"year": 2003, "month": 2, "anomaly": 2.0},
+        {"year": 2004, "month": 1, "anomaly": -1.0},
+        {"year": 2004, "month": 2, "anomaly": 1.0},
+    ]
+    resp = client.get(
+        "/api/analytics/anomalies?stations=123&base_start=2000&base_end=2001&resolution=annual&format=columnar"
+    )
+    assert resp.json()["stations"][0] == {
+        "station": "123",
+        "years": [2000, 2001, 2003, 2004],
+        "anomaly": [-1.0, 2.0, 1.0, 0.0],
+    }
+    assert client.get("/api/analytics/anomalies?stations=999").status_code == 404
+
+
+def test_batch_matches_individual_routes(tmp_path) -> None:
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "Station Number;Year;Jan;Feb\n"
+        "123;2000;1.0;3.0\n"
+        "123;2001;5.0;\n"
+        "456;2000;2.0;2.5\n",
+        encoding="utf-8",
+    )
+
+    from csv_temperature_data.api.cache import RESPONSE_CACHE
+    from csv_temperature_data.core.config import settings
+
+    settings.csv_path = str(csv_path)
+    RESPONSE_CACHE.clear()
+    client = TestClient(app)
+
+    monthly = client.get("/api/data/monthly?stations=456,123&format=columnar")
+    resp = client.post(
+        "/api/batch",
+        json={
+            "queries": [
+                {"type": "monthly", "stations": ["123", "456"], "format": "columnar"},
+                {"type": "summary", "stations": "123", "start_year": 2001},
+                {"type": "annual", "stations": "123,999"},
+                {"type": "summary", "stations": "123", "start_year": 2001},
+                {"type": "rolling", "stations": "123", "window": 2, "min_years": 3},
+                {"type": "normals", "stations": ["456"]},
+            ]
+        },
+    )
+    assert resp.status_code == 200
+    results = resp.json()["results"]
+    assert results[0] == {"status": 200, "body": monthly.json()}
+    summary = client.get("/api/analytics/summary?stations=123&start_year=2001")
+    assert results[1] == {"status": 200, "body": summary.json()}
+    assert results[2] == {"status": 404, "detail": {"missing_stations": ["999"]}}
+    assert results[3] == results[1]
+    assert results[4] == {"status": 422, "detail": "min_years must be <= window"}
+    assert results[5]["body"]["stations"][0]["normals"][0] == {"month": 1, "mean": 2.0, "count": 1}
+
+    assert client.post("/api/batch", json={"queries": [{"type": "nope", "stations": "123"}]}).status_code == 422
+    assert client.post("/api/batch", json={"queries": []}).status_code == 422
+
+
+def test_correlation_matrix(tmp_path) -> None:
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "Station Number;Year;Jan;Feb;Mar\n"
+        "1;2000;1.0;2.0;3.0\n"
+        "1;2001;4.0;;6.0\n"
+        "2;2000;2.0;4.0;6.0\n"
+        "2;2001;8.0;10.0;12.0\n"
+        "3;2000;3.0;2.0;1.0\n"
+        "3;2001;;;\n"
+        "4;2000;5.0;5.0;5.0\n",
+        encoding="utf-8",
+    )
+
+    from csv_temperature_data.core.config import settings
+
+    settings.csv_path = str(csv_path)
+    client = TestClient(app)
+
+    resp = client.get("/api/analytics/correlation?stations=3,1,2,4&min_overlap=3")
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["stations"] == ["1", "2", "3", "4"]
+    assert body["overlap"] == [[5, 5, 3, 3], [5, 6, 3, 3], [3, 3, 3, 3], [3, 3, 3, 3]]
+    r = body["correlation"]
+    assert r[0][1] == r[1][0] and abs(r[0][1] - 1.0) < 1e-12  # station 2 = 2 * station 1 where both have data
+    assert r[0][2] == r[2][0] and abs(r[0][2] + 1.0) < 1e-12
+    assert r[0][0] == 1.0
+    assert r[3] == [None, None, None, None]  # constant series
+    assert client.get("/api/analytics/correlation?stations=1,2&anomalies=true&min_overlap=2").status_code == 200
+    assert client.get("/api/analytics/correlation?stations=1,9").status_code == 404
+
+
+def test_warm_start_does_not_import_pandas(tmp_path) -> None:
+    import os
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    from csv_temperature_data.core import csv_data
+
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "Station Number;Year;Jan;Feb\n"
+        "123;2000;1.0;3.0\n"
+        "123;2001;5.0;7.0\n"
+        "456;2000;100.0;\n",
+        encoding="utf-8",
+    )
+    cache_dir = tmp_path / "cache"
+    env = dict(os.environ, CSV_PATH=str(csv_path), CSV_CACHE_DIR=str(cache_dir))
+    script = (
+        "import sys\n"
+        "from fastapi.testclient import TestClient\n"
+        "from csv_temperature_data.main import app\n"
+        "from csv_temperature_data.core.config import settings\n"
+        "from csv_temperature_data.core.csv_data import preload\n"
+        "preload(settings.csv_path, watch=False)\n"
+        "resp = TestClient(app).get('/api/data/annual?stations=123,456&format=columnar')\n"
+        "assert resp.status_code == 200, resp.status_code\n"
+        "print('pandas' in sys.modules)\n"
+    )
+    src = str(Path(csv_data.__file__).resolve().parents[2])
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+
+    def run() -> str:
+        proc = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True)
+        return proc.stdout.strip()
+
+    assert run() == "True"  # the first start parses the CSV and writes the bundle
+    assert run() == "False"  # later starts map the bundle
+
+
+def test_station_metadata(tmp_path) -> None:
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "Station Number;Year;Jan;Feb\n"
+        "123;2000;1.0;3.0\n"
+        "123;2002;5.0;\n"
+        "124;2001;-2.0;4.0\n"
+        "456;2000;;\n"
+        "12;1999;7.0;7.0\n",
+        encoding="utf-8",
+    )
+
+    from csv_temperature_data.core.config import settings
+
+    settings.csv_path = str(csv_path)
+    client = TestClient(app)
+    resp = client.get("/api/stations/metadata")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["count"] == 4 and data["offset"] == 0 and data["limit"] == 100
+    assert [item["station"] for item in data["stations"]] == ["12", "123", "124", "456"]
+    assert data["stations"][1] == {
+        "station": "123",
+        "first_year": 2000,
+        "last_year": 2002,
+        "valid_months": 3,
+        "missing_ratio": 0.5,
+        "mean": 3.0,
+        "min": 1.0,
+        "max": 5.0,
+    }
+    assert data["stations"][3] == {
+        "station": "456",
+        "first_year": None,
+        "last_year": None,
+        "valid_months": 0,
+        "missing_ratio": None,
+        "mean": None,
+        "min": None,
+        "max": None,
+    }
+
+    page = client.get("/api/stations/metadata?prefix=12&offset=1&limit=1&format=columnar").json()
+    assert page["count"] == 3
+    assert page["stations"]["station"] == ["123"]
+    assert page["stations"]["valid_months"] == [3]
+    assert client.get("/api/stations/metadata?prefix=9").json()["stations"] == []
+    assert client.get("/api/stations/metadata?limit=0").status_code == 422
+
+
+def test_negotiated_compression_is_cached(tmp_path, monkeypatch) -> None:
+    rows = "".join(f"{s};{year};{year % 7}.5;{s % 5}.25\n" for s in (1, 2) for year in range(1900, 2000))
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("Station Number;Year;Jan;Feb\n" + rows, encoding="utf-8")
+
+    from csv_temperature_data.api import cache, compression
+    from csv_temperature_data.core.config import settings
+
+    settings.csv_path = str(csv_path)
+    monkeypatch.setattr(settings, "compression_min_bytes", 1024)
+    calls = []
+
+    def counting_compress(body: bytes, coding: str) -> bytes:
+        calls.append(coding)
+        return compression.compress(body, coding)
+
+    monkeypatch.setattr(cache, "compress", counting_compress)
+    client = TestClient(app)
+    url = "/api/data/monthly?stations=1,2"
+
+    plain = client.get(url, headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["vary"] == "Accept-Encoding"
+
+    resp = client.get(url, headers={"Accept-Encoding": "gzip;q=0.5, deflate"})
+    assert resp.headers["content-encoding"] == "gzip"
+    assert resp.content == plain.content  # decoded by the client
+    assert int(resp.headers["content-length"]) < len(plain.content) // 4
+    assert resp.headers["etag"] == plain.headers["etag"][:-1] + '-gzip"'
+    assert client.get(url, headers={"Accept-Encoding": "gzip"}).content == plain.content
+    assert calls == ["gzip"]  # the second request was served from the cache
+
+    for etag in (plain.headers["etag"], resp.headers["etag"]):
+        assert client.get(url, headers={"Accept-Encoding": "gzip", "If-None-Match": etag}).status_code == 304
+    assert client.get(url, headers={"Accept-Encoding": "gzip;q=0"}).headers.get("content-encoding") is None
+    assert client.get("/api/health", headers={"Accept-Encoding": "gzip"}).headers.get("content-encoding") is None
+    small = client.get("/api/analytics/summary?stations=1", headers={"Accept-Encoding": "gzip"})
+    assert small.status_code == 200 and "content-encoding" not in small.headers
+
+    assert compression.negotiate_encoding("br, gzip;q=0.8") == ("br" if compression.brotli else "gzip")
+    assert compression.negotiate_encoding("*") == compression.offered_encodings()[0]
+    assert compression.negotiate_encoding("identity") is None
+    monkeypatch.setattr(settings, "response_compression", False)
+    assert compression.negotiate_encoding("gzip") is None